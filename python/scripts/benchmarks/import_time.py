@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the cold import time of the GOAT packages.
+
+Every import runs in a fresh interpreter, so nothing is shared between measurements. Packages
+whose dependencies are not installed are reported as failed.
+
+Usage:
+    python scripts/benchmarks/import_time.py
+    python scripts/benchmarks/import_time.py --repeat 5 --filter goat_plugins
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+SRC_DIR = Path(__file__).resolve().parent.parent.parent / "src"
+
+MEASURE = (
+    "import time; start = time.perf_counter(); import {module}; "
+    "print(time.perf_counter() - start)"
+)
+
+
+def find_packages() -> List[Tuple[str, Path]]:
+    """Find the importable GOAT packages and the directory each is imported from."""
+    packages = [("goat", SRC_DIR / "goat-sdk")]
+    for group, namespace in (("wallets", "goat_wallets"), ("plugins", "goat_plugins"), ("adapters", "goat_adapters")):
+        for root in sorted((SRC_DIR / group).iterdir()):
+            namespace_dir = root / namespace
+            if not namespace_dir.is_dir():
+                continue
+            for package in sorted(namespace_dir.iterdir()):
+                if (package / "__init__.py").exists():
+                    packages.append((f"{namespace}.{package.name}", root))
+    return packages
+
+
+def measure(module: str, path: str) -> Optional[float]:
+    env = {**os.environ, "PYTHONPATH": path, "PYTHONDONTWRITEBYTECODE": "1"}
+    result = subprocess.run(
+        [sys.executable, "-c", MEASURE.format(module=module)], env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        return None
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure cold import times of the GOAT packages")
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh interpreters per package, the median is reported")
+    parser.add_argument("--filter", default="", help="Only measure packages whose name contains this string")
+    args = parser.parse_args()
+
+    packages = find_packages()
+    # Every package sees the SDK and the wallets it may depend on, plus its own root only: a few
+    # plugins ship a regular goat_plugins/__init__.py that would shadow the others' namespace
+    base_path = [str(root) for module, root in packages if module == "goat" or module.startswith("goat_wallets.")]
+
+    total = 0.0
+    for module, root in packages:
+        if args.filter not in module:
+            continue
+        path = os.pathsep.join(dict.fromkeys([str(root), *base_path]))
+        timings = [measure(module, path) for _ in range(args.repeat)]
+        if any(timing is None for timing in timings):
+            print(f"{module:<45} failed (missing dependencies?)")
+            continue
+        median = statistics.median(timings)  # type: ignore
+        total += median
+        print(f"{module:<45} {median * 1000:8.1f} ms")
+    print(f"{'total':<45} {total * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
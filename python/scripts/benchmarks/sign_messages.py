@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Benchmark for signing off-chain messages with a Solana keypair wallet.
+
+Compares deriving a new nacl SigningKey for every message (the previous behaviour) with the
+cached key used by sign_message and the bulk sign_messages API, with and without a thread pool.
+
+Usage (from python/src, with goat-sdk and wallets/solana on PYTHONPATH):
+    python ../scripts/benchmarks/sign_messages.py --messages 20000
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+import nacl.signing
+from solana.rpc.api import Client
+from solders.keypair import Keypair
+
+from goat_wallets.solana import SolanaKeypairWalletClient
+
+
+def measure(name: str, count: int, run: Callable[[], object]) -> None:
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<40} {elapsed:8.3f}s {count / elapsed:12,.0f} signatures/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark Solana message signing")
+    parser.add_argument("--messages", type=int, default=20000, help="Number of messages to sign")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 4, help="Thread pool size")
+    args = parser.parse_args()
+
+    keypair = Keypair()
+    # The RPC client is never contacted, signing is purely local
+    wallet = SolanaKeypairWalletClient(Client("http://localhost:8899"), keypair)
+    messages = [f"auth challenge {i}: {os.urandom(16).hex()}" for i in range(args.messages)]
+
+    def uncached():
+        for message in messages:
+            nacl.signing.SigningKey(keypair.secret()).sign(message.encode("utf-8")).signature.hex()
+
+    measure("SigningKey per message (before)", len(messages), uncached)
+    measure("sign_message, cached key", len(messages), lambda: [wallet.sign_message(m) for m in messages])
+    measure("sign_messages", len(messages), lambda: wallet.sign_messages(messages))
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        measure(
+            f"sign_messages, {args.workers} threads",
+            len(messages),
+            lambda: wallet.sign_messages(messages, executor=executor),
+        )
+
+    # Every path must produce the same signatures
+    assert wallet.sign_messages(messages[:100]) == [wallet.sign_message(m) for m in messages[:100]]
+
+
+if __name__ == "__main__":
+    main()
@@ -2,22 +2,30 @@ import inspect
 from typing import List, Any, Dict, Callable, Annotated, Protocol, runtime_checkable, cast, Sequence, get_type_hints
 from autogen import ConversableAgent, register_function
 from autogen.tools import Tool
-from goat import WalletClientBase, get_tools
+from goat import WalletClientBase, get_tool_factory, get_tool_parameters, get_tools
 from functools import wraps, update_wrapper
 
 from goat.classes.tool_base import ToolBase
 
-def get_on_chain_tools(wallet: WalletClientBase, plugins: List[Any]) -> List[Tool]:
+def get_on_chain_tools(wallet: WalletClientBase, plugins: List[Any], cache: bool = False) -> List[Tool]:
     """Create typed functions from GOAT tools.
 
     Args:
         wallet: A wallet client instance
         plugins: List of plugin instances
+        cache: Reuse the tools already built for this wallet and plugins, see `goat.ToolFactory`.
+            The cached tool objects are shared by every caller, enable it only if agents do not modify them.
 
     Returns:
         Dictionary mapping tool names to ToolFunction objects that are callable
         and also expose tool metadata like name and description
     """
+    if cache:
+        return get_tool_factory().get_or_build("ag2", wallet, plugins, lambda: _build_tools(wallet, plugins))
+    return _build_tools(wallet, plugins)
+
+
+def _build_tools(wallet: WalletClientBase, plugins: List[Any]) -> List[Tool]:
     # Get tools from GOAT
     raw_tools = get_tools(wallet=wallet, plugins=plugins)
     typed_functions = []
@@ -30,7 +38,7 @@ def get_on_chain_tools(wallet: WalletClientBase, plugins: List[Any]) -> List[Too
         parameters_model = raw_tool.parameters
         
         # Get field information from the Pydantic model schema
-        schema = parameters_model.model_json_schema()
+        schema = get_tool_parameters(parameters_model).json_schema()
         properties = schema.get('properties', {})
         
         # Create function with proper annotations
@@ -62,14 +70,14 @@ def get_on_chain_tools(wallet: WalletClientBase, plugins: List[Any]) -> List[Too
             new_sig = inspect.Signature(parameters=parameters, return_annotation=Any)
             
             # Create function with dynamic parameters
-            def tool_function(*args, **kwargs):
+            async def tool_function(*args, **kwargs):
                 # Map positional args to parameter names
                 bound_args = new_sig.bind(*args, **kwargs)
                 bound_args.apply_defaults()
                 
                 # Extract all arguments as a dictionary
                 all_params = dict(bound_args.arguments)
-                return t.execute(all_params)
+                return await t.aexecute(all_params)
             
             # Apply the signature using inspect's technique
             tool_function.__signature__ = new_sig  # type: ignore
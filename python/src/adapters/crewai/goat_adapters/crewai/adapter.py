@@ -4,7 +4,7 @@ from crewai.tools import BaseTool
 from goat.classes.plugin_base import PluginBase
 from litellm import ConfigDict
 from pydantic import BaseModel, Field
-from goat import WalletClientBase, get_tools
+from goat import WalletClientBase, get_tool_factory, get_tools
 from goat.classes.tool_base import ToolBase
 
 class GoatToolWrapper(BaseTool):
@@ -41,16 +41,36 @@ class GoatToolWrapper(BaseTool):
             error_details = traceback.format_exc()
             raise Exception(f"Error executing tool {self.name}: {error_details}")
 
-def get_crewai_tools(wallet: WalletClientBase, plugins: List[PluginBase]) -> List[BaseTool]:
+    async def _arun(
+        self,
+        **kwargs: Any
+    ) -> Any:
+        """Executes the wrapped GOAT tool without blocking the running event loop."""
+        try:
+            return await self.goat_tool.aexecute(kwargs)
+        except Exception as e:
+            # Get the full traceback
+            error_details = traceback.format_exc()
+            raise Exception(f"Error executing tool {self.name}: {error_details}")
+
+def get_crewai_tools(wallet: WalletClientBase, plugins: List[PluginBase], cache: bool = False) -> List[BaseTool]:
     """Create CrewAI-compatible tools from GOAT tools.
 
     Args:
         wallet: A wallet client instance
         plugins: List of plugin instances
+        cache: Reuse the tools already built for this wallet and plugins, see `goat.ToolFactory`.
+            The cached tool objects are shared by every caller, enable it only if agents do not modify them.
 
     Returns:
         List of BaseTool instances ready for CrewAI Agents.
     """
+    if cache:
+        return get_tool_factory().get_or_build("crewai", wallet, plugins, lambda: _build_tools(wallet, plugins))
+    return _build_tools(wallet, plugins)
+
+
+def _build_tools(wallet: WalletClientBase, plugins: List[PluginBase]) -> List[BaseTool]:
     raw_tools: List[ToolBase] = get_tools(wallet=wallet, plugins=plugins)
     crewai_tools: List[BaseTool] = []
 
@@ -65,4 +85,4 @@ def get_crewai_tools(wallet: WalletClientBase, plugins: List[PluginBase]) -> Lis
             print(f"Info: Skipping GOAT tool '{raw_tool.name}' as it lacks a Pydantic parameters model.")
 
 
-    return crewai_tools
\ No newline at end of file
+    return crewai_tools
@@ -2,24 +2,35 @@ from typing import List, TypeVar, Any
 
 from langchain_core.tools import BaseTool
 from langchain_core.tools.structured import StructuredTool
-from goat import ToolBase, WalletClientBase, get_tools
+from goat import ToolBase, WalletClientBase, get_tool_factory, get_tools
 
 
-def get_on_chain_tools(wallet: WalletClientBase, plugins: List[Any]) -> List[BaseTool]:
+def get_on_chain_tools(wallet: WalletClientBase, plugins: List[Any], cache: bool = False) -> List[BaseTool]:
     """Create LangChain tools from GOAT tools.
 
     Args:
         wallet: A wallet client instance
         plugins: List of plugin instances
+        cache: Reuse the tools already built for this wallet and plugins, see `goat.ToolFactory`.
+            The cached tool objects are shared by every caller, enable it only if agents do not modify them.
 
     Returns:
         List of LangChain Tool instances configured with the GOAT tools
     """
+    if cache:
+        return get_tool_factory().get_or_build("langchain", wallet, plugins, lambda: _build_tools(wallet, plugins))
+    return _build_tools(wallet, plugins)
+
+
+def _build_tools(wallet: WalletClientBase, plugins: List[Any]) -> List[BaseTool]:
     tools: List[ToolBase] = get_tools(wallet=wallet, plugins=plugins)
 
     def _execute_tool(t: ToolBase, **args):
         return t.execute(args)
 
+    async def _aexecute_tool(t: ToolBase, **args):
+        return await t.aexecute(args)
+
     langchain_tools = []
     for t in tools:
         # Create a LangChain Tool for each GOAT tool
@@ -27,6 +38,7 @@ def get_on_chain_tools(wallet: WalletClientBase, plugins: List[Any]) -> List[Bas
             name=t.name,
             description=t.description,
             func=lambda t=t, **args: _execute_tool(t, **args),
+            coroutine=lambda t=t, **args: _aexecute_tool(t, **args),
             args_schema=t.parameters,
         )
         langchain_tools.append(tool)
@@ -1,29 +1,39 @@
 from typing import List, Any
 
-import json
 from agents import FunctionTool, RunContextWrapper
-from goat import ToolBase, WalletClientBase, get_tools
+from goat import ToolBase, WalletClientBase, get_tool_factory, get_tool_parameters, get_tools
 
-def get_on_chain_tools(wallet: WalletClientBase, plugins: List[Any]) -> List[FunctionTool]:
+def get_on_chain_tools(wallet: WalletClientBase, plugins: List[Any], cache: bool = False) -> List[FunctionTool]:
     """Create OpenAI Agents SDK tools from GOAT tools.
 
     Args:
         wallet: A wallet client instance
         plugins: List of plugin instances
+        cache: Reuse the tools already built for this wallet and plugins, see `goat.ToolFactory`.
+            The cached tool objects are shared by every caller, enable it only if agents do not modify them.
 
     Returns:
         List of OpenAI Agents SDK Tool instances configured with the GOAT tools
     """
+    if cache:
+        return get_tool_factory().get_or_build(
+            "openai_agents_sdk", wallet, plugins, lambda: _build_tools(wallet, plugins)
+        )
+    return _build_tools(wallet, plugins)
+
+
+def _build_tools(wallet: WalletClientBase, plugins: List[Any]) -> List[FunctionTool]:
     tools: List[ToolBase] = get_tools(wallet=wallet, plugins=plugins)
 
     openai_agents_sdk_tools = []
 
     for t in tools:
-        async def _execute_tool(ctx: RunContextWrapper[Any], args: str) -> str:
-            parsed = json.loads(args) if args else {}
-            return str(tool.execute(parsed))
+        async def _execute_tool(ctx: RunContextWrapper[Any], args: str, t: ToolBase = t) -> str:
+            # The arguments are validated straight from JSON
+            return str(await t.aexecute_json(args))
     
-        schema = t.parameters.model_json_schema()
+        # Schemas are generated once per parameters model
+        schema = get_tool_parameters(t.parameters).json_schema()
         # TODO: Consider making custom BaseModel with extra = "forbid"
         schema["additionalProperties"] = False
 
@@ -3,7 +3,7 @@ import inspect
 import traceback
 from goat.classes.plugin_base import PluginBase
 from pydantic import BaseModel
-from goat import WalletClientBase, get_tools
+from goat import WalletClientBase, get_tool_factory, get_tools
 from goat.classes.tool_base import ToolBase
 from smolagents import Tool
 
@@ -84,16 +84,24 @@ class GoatToolWrapper(Tool):
             error_details = traceback.format_exc()
             raise Exception(f"Error executing tool {self.name}: {error_details}")
 
-def get_smolagents_tools(wallet: WalletClientBase, plugins: List[PluginBase]) -> List[Tool]:
+def get_smolagents_tools(wallet: WalletClientBase, plugins: List[PluginBase], cache: bool = False) -> List[Tool]:
     """Create Smolagents-compatible tools from GOAT tools.
 
     Args:
         wallet: A wallet client instance
         plugins: List of plugin instances
+        cache: Reuse the tools already built for this wallet and plugins, see `goat.ToolFactory`.
+            The cached tool objects are shared by every caller, enable it only if agents do not modify them.
 
     Returns:
         List of Tool instances ready for Smolagents Agents.
     """
+    if cache:
+        return get_tool_factory().get_or_build("smolagents", wallet, plugins, lambda: _build_tools(wallet, plugins))
+    return _build_tools(wallet, plugins)
+
+
+def _build_tools(wallet: WalletClientBase, plugins: List[PluginBase]) -> List[Tool]:
     raw_tools: List[ToolBase] = get_tools(wallet=wallet, plugins=plugins)
     smolagents_tools: List[Tool] = []
 
@@ -107,4 +115,4 @@ def get_smolagents_tools(wallet: WalletClientBase, plugins: List[PluginBase]) ->
         else:
             print(f"Info: Skipping GOAT tool '{raw_tool.name}' as it lacks a Pydantic parameters model.")
 
-    return smolagents_tools
\ No newline at end of file
+    return smolagents_tools
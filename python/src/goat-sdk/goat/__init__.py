@@ -1,9 +1,71 @@
-from .classes.tool_base import create_tool, ToolBase
-from .classes.wallet_client_base import WalletClientBase
-from .classes.plugin_base import PluginBase
-from .utils.snake_case import snake_case
-from .utils.get_tools import get_tools
-from .types.chain import Chain, EvmChain, SolanaChain, AptosChain, ChromiaChain, MultiversXChain
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .classes.tool_base import create_tool, ToolBase
+    from .classes.wallet_client_base import WalletClientBase
+    from .classes.plugin_base import PluginBase
+    from .utils.snake_case import snake_case
+    from .utils.get_tools import get_tools
+    from .utils.event_loop_executor import EventLoopExecutor, ExecutorMetrics, get_event_loop_executor, run_sync
+    from .utils.http_session import (
+        HttpSessionConfig,
+        HttpSessionRegistry,
+        get_http_session,
+        get_http_session_registry,
+        close_http_sessions,
+    )
+    from .utils.token_metadata_cache import TokenMetadataCache, get_token_metadata_cache
+    from .utils.tool_parameters import ToolParameters, get_tool_parameters
+    from .utils.tool_factory import ToolFactory, get_tool_factory
+    from .types.chain import Chain, EvmChain, SolanaChain, AptosChain, ChromiaChain, MultiversXChain
+
+# Exported names and the modules defining them. They are imported on first access (PEP 562),
+# so importing a single submodule such as `goat.decorators.tool` does not load the others.
+_LAZY_IMPORTS = {
+    "create_tool": ".classes.tool_base",
+    "ToolBase": ".classes.tool_base",
+    "WalletClientBase": ".classes.wallet_client_base",
+    "PluginBase": ".classes.plugin_base",
+    "snake_case": ".utils.snake_case",
+    "get_tools": ".utils.get_tools",
+    "EventLoopExecutor": ".utils.event_loop_executor",
+    "ExecutorMetrics": ".utils.event_loop_executor",
+    "get_event_loop_executor": ".utils.event_loop_executor",
+    "run_sync": ".utils.event_loop_executor",
+    "HttpSessionConfig": ".utils.http_session",
+    "HttpSessionRegistry": ".utils.http_session",
+    "get_http_session": ".utils.http_session",
+    "get_http_session_registry": ".utils.http_session",
+    "close_http_sessions": ".utils.http_session",
+    "TokenMetadataCache": ".utils.token_metadata_cache",
+    "get_token_metadata_cache": ".utils.token_metadata_cache",
+    "ToolParameters": ".utils.tool_parameters",
+    "get_tool_parameters": ".utils.tool_parameters",
+    "ToolFactory": ".utils.tool_factory",
+    "get_tool_factory": ".utils.tool_factory",
+    "Chain": ".types.chain",
+    "EvmChain": ".types.chain",
+    "SolanaChain": ".types.chain",
+    "AptosChain": ".types.chain",
+    "ChromiaChain": ".types.chain",
+    "MultiversXChain": ".types.chain",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    # Cache on the package so later lookups skip this hook
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted([*globals(), *_LAZY_IMPORTS])
+
 
 __all__ = [
     # Classes
@@ -11,9 +73,24 @@ __all__ = [
     "create_tool",
     "WalletClientBase",
     "PluginBase",
+    "EventLoopExecutor",
+    "ExecutorMetrics",
+    "HttpSessionConfig",
+    "HttpSessionRegistry",
+    "TokenMetadataCache",
+    "ToolParameters",
+    "ToolFactory",
     # Utils
     "snake_case",
     "get_tools",
+    "get_event_loop_executor",
+    "run_sync",
+    "get_http_session",
+    "get_http_session_registry",
+    "close_http_sessions",
+    "get_token_metadata_cache",
+    "get_tool_parameters",
+    "get_tool_factory",
     # Types
     "Chain",
     "EvmChain",
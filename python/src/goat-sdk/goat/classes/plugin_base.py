@@ -1,13 +1,13 @@
 import asyncio
 import inspect
-import threading
 from abc import ABC, abstractmethod
-from typing import List, Any, TypeVar, Generic
+from typing import Callable, List, Any, Tuple, TypeVar, Generic
 
 from goat.classes.tool_base import ToolBase, create_tool
 from goat.classes.wallet_client_base import WalletClientBase
 from goat.types.chain import Chain
-from goat.decorators.tool import StoredToolMetadata, TOOL_METADATA_KEY
+from goat.decorators.tool import StoredToolMetadata, get_tool_metadata
+from goat.utils.event_loop_executor import run_sync
 
 TWalletClient = TypeVar("TWalletClient", bound=WalletClientBase)
 
@@ -63,25 +63,24 @@ class PluginBase(Generic[TWalletClient], ABC):
         tools: List[ToolBase] = []
 
         for tool_provider in self.tool_providers:
-            # Get all methods of the tool provider instance
-            for attr_name in dir(tool_provider):
-                attr = getattr(tool_provider, attr_name)
-                # Check if the method has tool metadata
-                tool_metadata = getattr(attr, TOOL_METADATA_KEY, None)
-
-                if tool_metadata:
-                    tools.append(
-                        create_tool(
-                            {
-                                "name": tool_metadata.name,
-                                "description": tool_metadata.description,
-                                "parameters": tool_metadata.parameters["schema"],
-                            },
-                            lambda params, tool=tool_metadata: self._execute_tool(
-                                tool, tool_provider, wallet_client, params
-                            ),
-                        )
+            # Tool metadata is introspected once per provider class and cached
+            for tool_metadata in get_tool_metadata(type(tool_provider)):
+                tools.append(
+                    create_tool(
+                        {
+                            "name": tool_metadata.name,
+                            "description": tool_metadata.description,
+                            "parameters": tool_metadata.parameters["schema"],
+                        },
+                        # Bind the provider as a default, a closure would see the last provider of the loop
+                        lambda params, tool=tool_metadata, provider=tool_provider: self._execute_tool(
+                            tool, provider, wallet_client, params
+                        ),
+                        lambda params, tool=tool_metadata, provider=tool_provider: self._aexecute_tool(
+                            tool, provider, wallet_client, params
+                        ),
                     )
+                )
 
         return tools
 
@@ -95,6 +94,39 @@ class PluginBase(Generic[TWalletClient], ABC):
         """
         Helper method to execute a tool with the correct arguments.
 
+        Coroutine tools are run on the process-wide GOAT event loop, so synchronous callers
+        share one loop (and its pooled connections) instead of creating one per call.
+
+        Args:
+            tool: The tool metadata
+            tool_provider: The instance providing the tool
+            wallet_client: The wallet client to use
+            params: The parameters for the tool
+
+        Returns:
+            The result of the tool execution
+        """
+        method, args = self._resolve_tool_call(tool_metadata, tool_provider, wallet_client, params)
+        result = method(*args)
+
+        if inspect.iscoroutine(result):
+            return run_sync(result)
+
+        return result
+
+    async def _aexecute_tool(
+        self,
+        tool_metadata: StoredToolMetadata,
+        tool_provider: Any,
+        wallet_client: WalletClientBase,
+        params: Any,
+    ) -> Any:
+        """
+        Helper method to execute a tool from async code without blocking the running event loop.
+
+        Coroutine tools are awaited directly on the caller's loop; synchronous tools are run
+        in a worker thread.
+
         Args:
             tool: The tool metadata
             tool_provider: The instance providing the tool
@@ -104,30 +136,36 @@ class PluginBase(Generic[TWalletClient], ABC):
         Returns:
             The result of the tool execution
         """
+        method, args = self._resolve_tool_call(tool_metadata, tool_provider, wallet_client, params)
 
-        def _run_coroutine_in_new_thread(coro):
-            """Run a coroutine in a new thread with its own event loop."""
-            result = None
-            exception = None
-            
-            def run_coro():
-                nonlocal result, exception
-                loop = asyncio.new_event_loop()
-                try:
-                    result = loop.run_until_complete(coro)
-                except Exception as e:
-                    exception = e
-                finally:
-                    loop.close()
-            
-            thread = threading.Thread(target=run_coro)
-            thread.start()
-            thread.join()
-            
-            if exception:
-                raise exception
-            return result
+        if inspect.iscoroutinefunction(method):
+            return await method(*args)
 
+        result = await asyncio.to_thread(method, *args)
+        if inspect.iscoroutine(result):
+            return await result
+
+        return result
+
+    def _resolve_tool_call(
+        self,
+        tool_metadata: StoredToolMetadata,
+        tool_provider: Any,
+        wallet_client: WalletClientBase,
+        params: Any,
+    ) -> Tuple[Callable[..., Any], List[Any]]:
+        """
+        Resolves the bound tool method and its positional arguments.
+
+        Args:
+            tool: The tool metadata
+            tool_provider: The instance providing the tool
+            wallet_client: The wallet client to use
+            params: The parameters for the tool
+
+        Returns:
+            The bound method and the arguments to call it with
+        """
         wallet_client_index = tool_metadata.wallet_client.get("index", 0)
         parameters_index = tool_metadata.parameters.get("index", 0)
         args = [None] * max(wallet_client_index or 0, parameters_index)
@@ -139,22 +177,4 @@ class PluginBase(Generic[TWalletClient], ABC):
             args[parameters_index - 1] = params
 
         method = getattr(tool_provider, tool_metadata.target.__name__)
-        result = method(*args)
-
-        # Handle coroutine results in three cases:
-        # 1. If there's an existing event loop and it's not running: use it directly with run_until_complete
-        # 2. If there's an existing event loop and it's running: create a new thread with its own event loop to avoid deadlock
-        # 3. If there's no event loop: create a new one and use it, then set it as the current event loop to be reused
-        if inspect.iscoroutine(result):
-            try:
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    return _run_coroutine_in_new_thread(result)
-                else:
-                    return loop.run_until_complete(result)
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                return loop.run_until_complete(result)
-
-        return result
+        return method, args
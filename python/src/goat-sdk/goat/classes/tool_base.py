@@ -1,14 +1,21 @@
+import asyncio
+import json
 from abc import ABC, abstractmethod
 from typing import (
     Any,
+    Awaitable,
     Callable,
     Generic,
+    Optional,
     Type,
     TypeVar,
     TypedDict,
+    Union,
 )
 from pydantic import BaseModel
 
+from goat.utils.tool_parameters import get_tool_parameters
+
 TResult = TypeVar("TResult")
 
 
@@ -72,9 +79,49 @@ class ToolBase(Generic[TResult], ABC):
         """
         pass
 
+    async def aexecute(self, parameters: dict[str, Any]) -> TResult:
+        """
+        Executes the tool with the provided parameters without blocking the running event loop
+
+        Tools without a native async implementation run `execute` in a worker thread.
+
+        Args:
+            parameters: The parameters for the tool execution, validated against the tool's Pydantic model
+
+        Returns:
+            The result of the tool execution
+        """
+        return await asyncio.to_thread(self.execute, parameters)
+
+    def execute_json(self, arguments: Union[str, bytes]) -> TResult:
+        """
+        Executes the tool with parameters given as a JSON object, e.g. the arguments of an LLM tool call
+
+        Args:
+            arguments: The parameters as a JSON string or bytes, empty for no parameters
+
+        Returns:
+            The result of the tool execution
+        """
+        return self.execute(json.loads(arguments) if arguments else {})
+
+    async def aexecute_json(self, arguments: Union[str, bytes]) -> TResult:
+        """
+        Async variant of `execute_json`
+
+        Args:
+            arguments: The parameters as a JSON string or bytes, empty for no parameters
+
+        Returns:
+            The result of the tool execution
+        """
+        return await self.aexecute(json.loads(arguments) if arguments else {})
+
 
 def create_tool(
-    config: ToolConfig, execute_fn: Callable[[dict[str, Any]], TResult]
+    config: ToolConfig,
+    execute_fn: Callable[[dict[str, Any]], TResult],
+    aexecute_fn: Optional[Callable[[dict[str, Any]], Awaitable[TResult]]] = None,
 ) -> ToolBase[TResult]:
     """
     Creates a new Tool instance with the provided configuration and execution function
@@ -82,15 +129,36 @@ def create_tool(
     Args:
         config: The configuration object for the tool containing name, description, and parameter model
         execute_fn: The function to be called when the tool is executed
+        aexecute_fn: Optional coroutine function to be awaited when the tool is executed from async code.
+            When omitted, `aexecute` runs `execute_fn` in a worker thread.
 
     Returns:
         A new Tool instance that validates parameters using the provided Pydantic model
     """
 
+    # Validators are compiled once per parameters model and shared by every tool using it
+    tool_parameters = get_tool_parameters(config["parameters"])
+
     class Tool(ToolBase):
         def execute(self, parameters: dict[str, Any]) -> TResult:
             # Validate parameters using the tool's schema before executing
-            validated_params = self.parameters.model_validate(parameters)
-            return execute_fn(validated_params.model_dump())
+            return execute_fn(tool_parameters.validate(parameters))
+
+        def execute_json(self, arguments: Union[str, bytes]) -> TResult:
+            # Parse and validate in one pass, skipping the intermediate dict
+            return execute_fn(tool_parameters.validate_json(arguments))
+
+        async def aexecute(self, parameters: dict[str, Any]) -> TResult:
+            if aexecute_fn is None:
+                return await super().aexecute(parameters)
+
+            return await aexecute_fn(tool_parameters.validate(parameters))
+
+        async def aexecute_json(self, arguments: Union[str, bytes]) -> TResult:
+            if aexecute_fn is None:
+                validated_params = tool_parameters.validate_json(arguments)
+                return await asyncio.to_thread(execute_fn, validated_params)
+
+            return await aexecute_fn(tool_parameters.validate_json(arguments))
 
     return Tool(config)
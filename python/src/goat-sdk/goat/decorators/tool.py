@@ -1,6 +1,7 @@
 from dataclasses import dataclass
-from typing import Any, Callable, Type, TypedDict
+from typing import Any, Callable, Tuple, Type, TypedDict
 from typing_extensions import NotRequired
+from weakref import WeakKeyDictionary
 import inspect
 from pydantic import BaseModel
 
@@ -69,6 +70,9 @@ class StoredToolMetadata:
 
 TOOL_METADATA_KEY = "__goat_tool__"
 
+# Provider class -> metadata of its tools, filled the first time a class is introspected
+_tool_registry: "WeakKeyDictionary[type, Tuple[StoredToolMetadata, ...]]" = WeakKeyDictionary()
+
 
 def Tool(tool_params: ToolDecoratorParams) -> Any:
     """
@@ -181,3 +185,32 @@ def validate_decorator_parameters(method: Callable) -> dict[str, int]:
         result["wallet_client"] = wallet_client_index
 
     return result
+
+
+def get_tool_metadata(provider_class: type) -> Tuple[StoredToolMetadata, ...]:
+    """
+    Returns the metadata of every tool a provider class defines, including inherited tools.
+
+    The class is introspected once and the result cached, so building tools for many wallets
+    or agents does not walk and resolve every attribute of the provider again. Attributes are
+    looked up statically, without triggering properties or other descriptors.
+
+    Args:
+        provider_class: The tool provider class
+
+    Returns:
+        The tools' metadata, ordered by attribute name
+    """
+    tools = _tool_registry.get(provider_class)
+    if tools is None:
+        found = []
+        for attr_name in dir(provider_class):
+            attr = inspect.getattr_static(provider_class, attr_name, None)
+            if isinstance(attr, (staticmethod, classmethod)):
+                attr = attr.__func__
+            tool_metadata = getattr(attr, TOOL_METADATA_KEY, None)
+            if isinstance(tool_metadata, StoredToolMetadata):
+                found.append(tool_metadata)
+        tools = tuple(found)
+        _tool_registry[provider_class] = tools
+    return tools
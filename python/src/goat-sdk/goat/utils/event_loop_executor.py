@@ -0,0 +1,284 @@
+import asyncio
+import atexit
+import os
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from typing import Any, Coroutine, Optional, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_MAX_PENDING = 256
+
+
+@dataclass(frozen=True)
+class ExecutorMetrics:
+    """Point-in-time snapshot of an EventLoopExecutor's counters.
+
+    Attributes:
+        submitted: Coroutines accepted by the executor
+        completed: Coroutines that finished successfully
+        failed: Coroutines that raised or were cancelled
+        rejected: Submissions refused because the queue was full
+        pending: Coroutines currently queued or running on the loop
+        max_pending: Highest number of pending coroutines observed
+        total_run_time: Accumulated wall time (seconds) of finished coroutines
+    """
+
+    submitted: int
+    completed: int
+    failed: int
+    rejected: int
+    pending: int
+    max_pending: int
+    total_run_time: float
+
+
+class ExecutorQueueFullError(RuntimeError):
+    """Raised when a coroutine cannot be queued before the submit timeout expires."""
+
+
+class EventLoopExecutor:
+    """A long-lived event loop running on a daemon thread.
+
+    Synchronous callers hand coroutines to the loop with `submit` or `run`, so every async
+    tool shares one loop (and therefore one set of pooled connections) instead of paying
+    for a new thread and event loop on every call. The number of coroutines queued or running
+    at once is bounded by `max_pending`.
+    """
+
+    def __init__(self, max_pending: int = DEFAULT_MAX_PENDING, name: str = "goat-event-loop"):
+        """Creates a new executor. The loop thread is started lazily on first submit.
+
+        Args:
+            max_pending: Maximum number of coroutines queued or running at once
+            name: Name of the background thread
+        """
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+
+        self.max_pending = max_pending
+        self.name = name
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._pending = 0
+        self._max_pending_seen = 0
+        self._total_run_time = 0.0
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The executor's event loop, starting the background thread if needed."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("EventLoopExecutor is closed")
+            if self._loop is None:
+                self._start()
+            return self._loop  # type: ignore
+
+    def in_executor_thread(self) -> bool:
+        """Whether the caller is running on the executor's own loop thread."""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def submit(self, coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> "Future[T]":
+        """Schedules a coroutine on the executor loop.
+
+        Args:
+            coro: The coroutine to run
+            timeout: Seconds to wait for a free queue slot, None to wait indefinitely
+
+        Returns:
+            A concurrent.futures.Future resolved with the coroutine's result
+
+        Raises:
+            ExecutorQueueFullError: If no slot frees up before the timeout
+            RuntimeError: If called from the executor thread itself, which would deadlock
+        """
+        if self.in_executor_thread():
+            coro.close()
+            raise RuntimeError(
+                "Cannot block on the GOAT event loop from inside it; await the coroutine instead"
+            )
+
+        loop = self.loop
+        if not self._slots.acquire(timeout=timeout):
+            coro.close()
+            with self._lock:
+                self._rejected += 1
+            raise ExecutorQueueFullError(f"{self.max_pending} coroutines already pending on {self.name}")
+
+        with self._lock:
+            self._submitted += 1
+            self._pending += 1
+            self._max_pending_seen = max(self._max_pending_seen, self._pending)
+
+        started = time.perf_counter()
+        try:
+            future = asyncio.run_coroutine_threadsafe(coro, loop)
+        except BaseException:
+            self._finish(started, failed=True)
+            raise
+
+        future.add_done_callback(
+            lambda f: self._finish(started, failed=f.cancelled() or f.exception() is not None)
+        )
+        return future
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+        """Runs a coroutine on the executor loop and blocks until it finishes.
+
+        Args:
+            coro: The coroutine to run
+            timeout: Seconds to wait for the result, None to wait indefinitely
+
+        Returns:
+            The coroutine's result
+
+        Raises:
+            TimeoutError: If the coroutine did not finish in time. It is cancelled on the loop.
+        """
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            # Don't leave the coroutine holding connections or completing side effects later
+            future.cancel()
+            raise
+
+    def metrics(self) -> ExecutorMetrics:
+        """Returns a snapshot of the executor's counters."""
+        with self._lock:
+            return ExecutorMetrics(
+                submitted=self._submitted,
+                completed=self._completed,
+                failed=self._failed,
+                rejected=self._rejected,
+                pending=self._pending,
+                max_pending=self._max_pending_seen,
+                total_run_time=self._total_run_time,
+            )
+
+    def shutdown(self, timeout: Optional[float] = 5.0) -> None:
+        """Cancels outstanding work, stops the loop and joins the background thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            loop, thread = self._loop, self._thread
+
+        if loop is None or thread is None:
+            return
+
+        async def _cancel_all():
+            current = asyncio.current_task()
+            tasks = [task for task in asyncio.all_tasks() if task is not current]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await loop.shutdown_asyncgens()
+
+        if not self.in_executor_thread():
+            try:
+                asyncio.run_coroutine_threadsafe(_cancel_all(), loop).result(timeout)
+            except Exception:
+                pass
+        loop.call_soon_threadsafe(loop.stop)
+        if not self.in_executor_thread():
+            thread.join(timeout)
+
+    def _start(self) -> None:
+        loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        def _run_loop():
+            asyncio.set_event_loop(loop)
+            loop.call_soon(ready.set)
+            try:
+                loop.run_forever()
+            finally:
+                loop.close()
+
+        thread = threading.Thread(target=_run_loop, name=self.name, daemon=True)
+        thread.start()
+        ready.wait()
+        self._loop = loop
+        self._thread = thread
+
+    def _finish(self, started: float, failed: bool) -> None:
+        with self._lock:
+            self._pending -= 1
+            self._total_run_time += time.perf_counter() - started
+            if failed:
+                self._failed += 1
+            else:
+                self._completed += 1
+        self._slots.release()
+
+
+_default_executor: Optional[EventLoopExecutor] = None
+_default_executor_pid: Optional[int] = None
+_default_executor_lock = threading.Lock()
+
+
+def get_event_loop_executor() -> EventLoopExecutor:
+    """Returns the process-wide executor, creating it on first use (and again after a fork)."""
+    global _default_executor, _default_executor_pid
+
+    with _default_executor_lock:
+        if _default_executor is None or _default_executor_pid != os.getpid():
+            _default_executor = EventLoopExecutor()
+            _default_executor_pid = os.getpid()
+        return _default_executor
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """Runs a coroutine to completion from synchronous code on the process-wide executor.
+
+    When called from the executor's own loop thread (a coroutine calling back into synchronous
+    code), blocking on the shared loop would deadlock, so the coroutine runs on a short-lived
+    loop in a helper thread instead.
+
+    Args:
+        coro: The coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    executor = get_event_loop_executor()
+    if executor.in_executor_thread():
+        return _run_in_new_thread(coro)
+    return executor.run(coro)
+
+
+def _run_in_new_thread(coro: Coroutine[Any, Any, T]) -> T:
+    result: Any = None
+    exception: Optional[BaseException] = None
+
+    def _run():
+        nonlocal result, exception
+        try:
+            result = asyncio.run(coro)
+        except BaseException as e:
+            exception = e
+
+    thread = threading.Thread(target=_run)
+    thread.start()
+    thread.join()
+
+    if exception is not None:
+        raise exception
+    return result
+
+
+@atexit.register
+def _shutdown_default_executor() -> None:
+    if _default_executor is not None and _default_executor_pid == os.getpid():
+        _default_executor.shutdown(timeout=1.0)
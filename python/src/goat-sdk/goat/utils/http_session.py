@@ -0,0 +1,222 @@
+import asyncio
+import atexit
+import threading
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Dict, Iterable, Optional
+
+# Imported so this module's exit hook is registered after (and therefore runs before) the
+# event loop executor's, while the shared loop can still close its sessions.
+import goat.utils.event_loop_executor  # noqa: F401
+
+if TYPE_CHECKING:
+    import aiohttp
+
+
+@dataclass(frozen=True)
+class HttpSessionConfig:
+    """Connection pool settings for sessions created by the HttpSessionRegistry.
+
+    Attributes:
+        limit: Maximum number of open connections per session
+        limit_per_host: Maximum number of open connections to a single host
+        keepalive_timeout: Seconds an idle connection is kept open for reuse
+        ttl_dns_cache: Seconds resolved DNS entries are cached, None to cache forever
+        total_timeout: Default total timeout in seconds for a request, None to disable
+        connect_timeout: Default timeout in seconds to acquire a connection, None to disable
+    """
+
+    limit: int = 100
+    limit_per_host: int = 10
+    keepalive_timeout: float = 30.0
+    ttl_dns_cache: Optional[int] = 300
+    total_timeout: Optional[float] = 30.0
+    connect_timeout: Optional[float] = 10.0
+
+
+@dataclass
+class _LoopSessions:
+    """The sessions created on one event loop and the task closing them when the loop shuts down."""
+
+    watcher: "Optional[asyncio.Task[None]]" = None
+    sessions: Dict[str, "aiohttp.ClientSession"] = field(default_factory=dict)
+
+
+class HttpSessionRegistry:
+    """Shares pooled aiohttp ClientSessions between plugin services.
+
+    Sessions are keyed by base URL and by the event loop they were created on, since an
+    aiohttp session cannot be used outside its loop. Requests made from the process-wide GOAT
+    event loop therefore reuse keep-alive connections and cached DNS lookups across tool calls.
+
+    Every loop with sessions runs a small watcher task. `asyncio.run` and the GOAT executor
+    cancel pending tasks before closing their loop, which makes the watcher close the loop's
+    sessions and forget them, so hosts running one loop per request do not accumulate sessions.
+    """
+
+    def __init__(self, config: Optional[HttpSessionConfig] = None):
+        """Creates a new registry.
+
+        Args:
+            config: Default pool settings for new sessions
+        """
+        self.config = config or HttpSessionConfig()
+        self._overrides: Dict[str, HttpSessionConfig] = {}
+        # A plain dict: sessions reference their loop, so weak keys would never be released
+        self._sessions: Dict[asyncio.AbstractEventLoop, _LoopSessions] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, config: HttpSessionConfig, base_url: Optional[str] = None) -> None:
+        """Sets pool settings for sessions created from now on.
+
+        Args:
+            config: The pool settings to use
+            base_url: Only apply the settings to this base URL, or to every base URL when omitted
+        """
+        with self._lock:
+            if base_url is None:
+                self.config = config
+            else:
+                self._overrides[self._key(base_url)] = config
+
+    def get_session(self, base_url: str, **overrides) -> "aiohttp.ClientSession":
+        """Returns the shared session for a base URL on the running event loop.
+
+        Args:
+            base_url: The base URL the session will be used for
+            **overrides: HttpSessionConfig fields to override when the session is first created
+
+        Returns:
+            A pooled aiohttp ClientSession. Callers must not close it.
+
+        Raises:
+            RuntimeError: If called outside a running event loop
+        """
+        loop = asyncio.get_running_loop()
+        key = self._key(base_url)
+
+        with self._lock:
+            self._forget_closed_loops()
+            entry = self._sessions.get(loop)
+            if entry is None:
+                entry = self._sessions[loop] = _LoopSessions()
+                entry.watcher = loop.create_task(self._close_on_shutdown(loop, entry), name="goat-http-sessions")
+            session = entry.sessions.get(key)
+            if session is None or session.closed:
+                config = self._overrides.get(key, self.config)
+                if overrides:
+                    config = replace(config, **overrides)
+                session = self._create_session(config)
+                entry.sessions[key] = session
+            return session
+
+    async def close(self) -> None:
+        """Closes every session created on the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            entry = self._sessions.pop(loop, None)
+        if entry is None:
+            return
+        if entry.watcher is not None and entry.watcher is not asyncio.current_task():
+            entry.watcher.cancel()
+        await self._close_sessions(entry.sessions.values())
+
+    def close_all(self, timeout: float = 5.0) -> None:
+        """Closes sessions on every event loop that can still run them."""
+        with self._lock:
+            entries = list(self._sessions.items())
+            self._sessions.clear()
+
+        for loop, entry in entries:
+            if loop.is_closed():
+                continue
+
+            async def _close(entry=entry):
+                if entry.watcher is not None:
+                    entry.watcher.cancel()
+                await self._close_sessions(entry.sessions.values())
+
+            try:
+                if loop.is_running():
+                    asyncio.run_coroutine_threadsafe(_close(), loop).result(timeout)
+                else:
+                    loop.run_until_complete(_close())
+            except Exception:
+                pass
+
+    async def _close_on_shutdown(self, loop: asyncio.AbstractEventLoop, entry: _LoopSessions) -> None:
+        try:
+            # Only returns when cancelled, which loops do to pending tasks before they close
+            await loop.create_future()
+        finally:
+            with self._lock:
+                current = self._sessions.get(loop) is entry
+                if current:
+                    del self._sessions[loop]
+            if current:
+                await self._close_sessions(entry.sessions.values())
+
+    def _forget_closed_loops(self) -> None:
+        # Loops closed without cancelling their tasks, their sessions can no longer be closed
+        for loop in [loop for loop in self._sessions if loop.is_closed()]:
+            del self._sessions[loop]
+
+    @staticmethod
+    async def _close_sessions(sessions: Iterable["aiohttp.ClientSession"]) -> None:
+        await asyncio.gather(*(session.close() for session in list(sessions)), return_exceptions=True)
+
+    @staticmethod
+    def _key(base_url: str) -> str:
+        return base_url.rstrip("/").lower()
+
+    @staticmethod
+    def _create_session(config: HttpSessionConfig) -> "aiohttp.ClientSession":
+        try:
+            import aiohttp
+        except ImportError as e:
+            raise ImportError(
+                "aiohttp is required for pooled HTTP sessions. Install it with `pip install goat-sdk[http]`."
+            ) from e
+
+        connector = aiohttp.TCPConnector(
+            limit=config.limit,
+            limit_per_host=config.limit_per_host,
+            keepalive_timeout=config.keepalive_timeout,
+            ttl_dns_cache=config.ttl_dns_cache,
+            use_dns_cache=True,
+        )
+        timeout = aiohttp.ClientTimeout(total=config.total_timeout, connect=config.connect_timeout)
+        return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+
+_registry = HttpSessionRegistry()
+
+
+def get_http_session_registry() -> HttpSessionRegistry:
+    """Returns the process-wide session registry."""
+    return _registry
+
+
+def get_http_session(base_url: str, **overrides) -> "aiohttp.ClientSession":
+    """Returns the shared pooled session for a base URL on the running event loop.
+
+    Args:
+        base_url: The base URL the session will be used for
+        **overrides: HttpSessionConfig fields to override when the session is first created
+
+    Returns:
+        A pooled aiohttp ClientSession. Callers must not close it.
+    """
+    return _registry.get_session(base_url, **overrides)
+
+
+async def close_http_sessions() -> None:
+    """Closes the shared sessions created on the running event loop.
+
+    Hosts that run GOAT tools on their own event loop should await this before the loop ends.
+    """
+    await _registry.close()
+
+
+@atexit.register
+def _close_http_sessions_at_exit() -> None:
+    _registry.close_all(timeout=1.0)
@@ -0,0 +1,201 @@
+import atexit
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+from goat.types.token import Token
+
+DEFAULT_MAX_SIZE = 4096
+DEFAULT_TTL = 24 * 60 * 60
+
+
+class TokenMetadataCache:
+    """LRU cache of token metadata (name, symbol and decimals) shared by wallet clients.
+
+    Entries are keyed by a chain namespace such as `evm:8453` or `solana:mainnet` and the
+    token address, so one cache can serve wallets on several chains. When a path is given
+    the cache is loaded from and saved to a JSON file, letting metadata survive restarts.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttl: Optional[float] = DEFAULT_TTL,
+        path: Optional[str] = None,
+    ):
+        """Creates a new cache.
+
+        Args:
+            max_size: Maximum number of tokens kept before the least recently used is evicted
+            ttl: Seconds an entry stays valid, None to keep entries until evicted
+            path: Optional JSON file used to persist the cache
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.path = path
+        self._entries: "OrderedDict[str, Tuple[Token, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._dirty = False
+
+        if path is not None:
+            self.load()
+
+    def get(self, namespace: str, address: str) -> Optional[Token]:
+        """Returns the cached metadata for a token, or None if it is missing or expired.
+
+        Args:
+            namespace: Chain namespace, e.g. `evm:1` or `solana:mainnet`
+            address: Token contract or mint address, in the chain's canonical form
+        """
+        key = self._key(namespace, address)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            metadata, stored_at = entry
+            if self._expired(stored_at):
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return metadata
+
+    def set(self, namespace: str, address: str, metadata: Token) -> None:
+        """Stores metadata for a token.
+
+        Args:
+            namespace: Chain namespace, e.g. `evm:1` or `solana:mainnet`
+            address: Token contract or mint address, in the chain's canonical form
+            metadata: The token's name, symbol and decimals
+        """
+        key = self._key(namespace, address)
+        entry: Token = {
+            "name": metadata["name"],
+            "symbol": metadata["symbol"],
+            "decimals": int(metadata["decimals"]),
+        }
+        with self._lock:
+            self._entries[key] = (entry, time.time())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+            self._dirty = True
+
+    def get_or_load(self, namespace: str, address: str, loader: Callable[[], Token]) -> Token:
+        """Returns cached metadata, calling `loader` and caching its result on a miss.
+
+        Args:
+            namespace: Chain namespace, e.g. `evm:1` or `solana:mainnet`
+            address: Token contract or mint address, in the chain's canonical form
+            loader: Fetches the metadata, typically from the chain
+        """
+        metadata = self.get(namespace, address)
+        if metadata is None:
+            metadata = loader()
+            self.set(namespace, address, metadata)
+        return metadata
+
+    def invalidate(self, namespace: Optional[str] = None, address: Optional[str] = None) -> None:
+        """Removes entries from the cache.
+
+        Args:
+            namespace: Only remove entries of this chain namespace, or every entry when omitted
+            address: Only remove this token (requires `namespace`)
+        """
+        with self._lock:
+            if namespace is None:
+                self._entries.clear()
+            elif address is not None:
+                self._entries.pop(self._key(namespace, address), None)
+            else:
+                prefix = f"{namespace}/"
+                for key in [key for key in self._entries if key.startswith(prefix)]:
+                    del self._entries[key]
+            self._dirty = True
+
+    def load(self) -> None:
+        """Loads persisted entries from `path`, ignoring a missing or unreadable file and malformed entries."""
+        if self.path is None or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r") as f:
+                data: Dict[str, Dict] = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict):
+            return
+
+        entries = []
+        for key, entry in data.items():
+            try:
+                metadata = entry["metadata"]
+                stored_at = float(entry["stored_at"])
+                token: Token = {
+                    "name": str(metadata["name"]),
+                    "symbol": str(metadata["symbol"]),
+                    "decimals": int(metadata["decimals"]),
+                }
+            except (KeyError, TypeError, ValueError):
+                continue
+            if not self._expired(stored_at):
+                entries.append((key, token, stored_at))
+
+        with self._lock:
+            for key, token, stored_at in entries:
+                self._entries[key] = (token, stored_at)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def save(self) -> None:
+        """Writes the cache to `path` if it changed since it was last saved."""
+        if self.path is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {
+                key: {"metadata": metadata, "stored_at": stored_at}
+                for key, (metadata, stored_at) in self._entries.items()
+            }
+            self._dirty = False
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _expired(self, stored_at: float) -> bool:
+        return self.ttl is not None and time.time() - stored_at > self.ttl
+
+    @staticmethod
+    def _key(namespace: str, address: str) -> str:
+        return f"{namespace}/{address}"
+
+
+_default_cache = TokenMetadataCache(path=os.environ.get("GOAT_TOKEN_METADATA_CACHE_PATH"))
+
+
+def get_token_metadata_cache() -> TokenMetadataCache:
+    """Returns the process-wide token metadata cache used by wallet clients by default.
+
+    Set the `GOAT_TOKEN_METADATA_CACHE_PATH` environment variable to persist it to disk.
+    """
+    return _default_cache
+
+
+@atexit.register
+def _save_default_cache() -> None:
+    try:
+        _default_cache.save()
+    except OSError:
+        pass
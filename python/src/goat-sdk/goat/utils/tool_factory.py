@@ -0,0 +1,113 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, List, Optional, Sequence, Tuple, TypeVar
+
+from goat.classes.wallet_client_base import WalletClientBase
+
+T = TypeVar("T")
+
+DEFAULT_MAX_SIZE = 64
+
+# (adapter, wallet identity, plugin identities)
+_Key = Tuple[str, int, Tuple[int, ...]]
+# (wallet, plugins, tools). The wallet and plugins are kept with the entry so their identities
+# cannot be reused by other objects while it is cached.
+_Entry = Tuple[WalletClientBase, Tuple[Any, ...], Tuple[Any, ...]]
+
+
+class ToolFactory:
+    """Memoizes the framework tools adapters build for a wallet and a set of plugins.
+
+    Adapters wrap every GOAT tool in a framework specific object, which is repeated for every
+    agent that is created. The factory builds the tool list once per wallet, plugin set and
+    adapter, and hands out the prebuilt tools afterwards. Entries are keyed by object identity.
+
+    The built tools call into their wallet, so an entry keeps its wallet alive. At most
+    `max_size` entries are kept, the least recently used one is dropped first. Call
+    `invalidate` to release a wallet earlier, or after changing a plugin's configuration or
+    the wallet's chain.
+
+    Tools are shared between every caller that asks for the same combination. Only enable
+    caching for frameworks whose tool objects are not mutated by the agents using them.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        """Creates a new factory.
+
+        Args:
+            max_size: Maximum number of tool lists kept before the least recently used is dropped
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self.max_size = max_size
+        self._entries: "OrderedDict[_Key, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_build(
+        self,
+        adapter: str,
+        wallet: WalletClientBase,
+        plugins: Optional[Sequence[Any]],
+        build: Callable[[], List[T]],
+    ) -> List[T]:
+        """Returns the tools built for a wallet and plugins, building them on first use.
+
+        Args:
+            adapter: Name of the adapter building the tools, e.g. `langchain`
+            wallet: The wallet client the tools are bound to
+            plugins: The plugins providing the tools, in order
+            build: Builds the adapter's tools when they are not cached
+
+        Returns:
+            A new list holding the prebuilt tools
+        """
+        plugins = tuple(plugins or ())
+        key = (adapter, id(wallet), tuple(id(plugin) for plugin in plugins))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return list(entry[2])
+
+        tools = tuple(build())
+        with self._lock:
+            # Keep the tools of a concurrent build, so every caller shares the same objects
+            entry = self._entries.setdefault(key, (wallet, plugins, tools))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return list(entry[2])
+
+    def invalidate(self, wallet: Optional[WalletClientBase] = None, plugin: Optional[Any] = None) -> None:
+        """Drops cached tools.
+
+        Args:
+            wallet: Only drop the tools built for this wallet
+            plugin: Only drop the tools built with this plugin
+
+        Without arguments every entry is dropped.
+        """
+        with self._lock:
+            if wallet is None and plugin is None:
+                self._entries.clear()
+                return
+
+            for key in [
+                key
+                for key, (cached_wallet, plugins, _) in self._entries.items()
+                if (wallet is None or cached_wallet is wallet)
+                and (plugin is None or any(p is plugin for p in plugins))
+            ]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_default_factory = ToolFactory()
+
+
+def get_tool_factory() -> ToolFactory:
+    """Returns the process-wide tool factory used by the adapters."""
+    return _default_factory
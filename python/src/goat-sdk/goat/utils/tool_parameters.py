@@ -0,0 +1,62 @@
+import copy
+import threading
+from typing import Any, Dict, Optional, Type, Union
+from weakref import WeakKeyDictionary
+
+from pydantic import BaseModel
+
+
+class ToolParameters:
+    """Validator, serializer and JSON schema of a tool's parameters model, resolved once.
+
+    Pydantic compiles a `SchemaValidator` and `SchemaSerializer` for every model class. Tools
+    call them directly instead of going through `model_validate` and `model_dump`, and the JSON
+    schema adapters send to the LLM is generated once per model rather than once per agent.
+    """
+
+    def __init__(self, model: Type[BaseModel]):
+        """Creates the compiled parameters of a model. Prefer `get_tool_parameters`, which caches them.
+
+        Args:
+            model: The Pydantic model class defining the tool's parameters
+        """
+        if not model.__pydantic_complete__:
+            # Models with unresolved forward references get their validator on rebuild
+            model.model_rebuild()
+        self.model = model
+        self._validator = model.__pydantic_validator__
+        self._serializer = model.__pydantic_serializer__
+        self._json_schema: Optional[Dict[str, Any]] = None
+
+    def validate(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Validates parameters against the model and returns them as a plain dict."""
+        return self._serializer.to_python(self._validator.validate_python(parameters))
+
+    def validate_json(self, data: Union[str, bytes]) -> Dict[str, Any]:
+        """Validates raw JSON against the model and returns the parameters as a plain dict.
+
+        The JSON is parsed and validated in one pass, without building an intermediate dict.
+        """
+        return self._serializer.to_python(self._validator.validate_json(data or "{}"))
+
+    def json_schema(self) -> Dict[str, Any]:
+        """Returns the model's JSON schema. The result is a copy, callers are free to modify it."""
+        if self._json_schema is None:
+            self._json_schema = self.model.model_json_schema()
+        return copy.deepcopy(self._json_schema)
+
+
+_cache: "WeakKeyDictionary[Type[BaseModel], ToolParameters]" = WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def get_tool_parameters(model: Type[BaseModel]) -> ToolParameters:
+    """Returns the compiled parameters of a model, creating them on first use."""
+    parameters = _cache.get(model)
+    if parameters is None:
+        with _lock:
+            parameters = _cache.get(model)
+            if parameters is None:
+                parameters = ToolParameters(model)
+                _cache[model] = parameters
+    return parameters
@@ -0,0 +1,41 @@
+import asyncio
+import threading
+
+import pytest
+from goat import EventLoopExecutor
+
+
+def test_run_cancels_coroutine_on_timeout():
+    """Test a coroutine that outlives the run timeout is cancelled on the loop."""
+    executor = EventLoopExecutor()
+    cancelled = threading.Event()
+    finished = threading.Event()
+
+    async def slow():
+        try:
+            await asyncio.sleep(1)
+            finished.set()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    try:
+        with pytest.raises(TimeoutError):
+            executor.run(slow(), timeout=0.05)
+        assert cancelled.wait(1)
+        assert not finished.is_set()
+    finally:
+        executor.shutdown()
+
+
+def test_run_returns_result():
+    """Test run blocks until the coroutine's result is available."""
+    executor = EventLoopExecutor()
+
+    async def add(a, b):
+        return a + b
+
+    try:
+        assert executor.run(add(1, 2), timeout=1) == 3
+    finally:
+        executor.shutdown()
@@ -0,0 +1,56 @@
+import asyncio
+import gc
+import weakref
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from goat.utils.http_session import HttpSessionRegistry  # noqa: E402
+
+
+def test_sessions_are_shared_per_loop_and_base_url():
+    """Test one loop reuses a session per base URL."""
+    registry = HttpSessionRegistry()
+
+    async def main():
+        first = registry.get_session("https://api.example.com/")
+        assert registry.get_session("https://API.example.com") is first
+        assert registry.get_session("https://other.example.com") is not first
+        await registry.close()
+        return first
+
+    assert asyncio.run(main()).closed
+
+
+def test_loops_do_not_retain_sessions():
+    """Test sessions of loops run with asyncio.run are closed and released when the loop ends."""
+    registry = HttpSessionRegistry()
+    loops = []
+
+    async def main():
+        loops.append(weakref.ref(asyncio.get_running_loop()))
+        return registry.get_session("https://api.example.com")
+
+    closed = [asyncio.run(main()).closed for _ in range(5)]
+    gc.collect()
+
+    assert registry._sessions == {}
+    assert closed == [True] * 5
+    assert all(loop() is None for loop in loops)
+
+
+def test_closed_loops_are_forgotten():
+    """Test loops closed without cancelling their tasks are dropped on the next lookup."""
+    registry = HttpSessionRegistry()
+    loop = asyncio.new_event_loop()
+
+    async def get():
+        return registry.get_session("https://api.example.com")
+
+    session = loop.run_until_complete(get())
+    loop.run_until_complete(session.close())
+    loop.close()
+
+    asyncio.run(get())
+    assert registry._sessions == {}
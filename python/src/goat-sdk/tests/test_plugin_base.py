@@ -0,0 +1,110 @@
+import pytest
+from pydantic import BaseModel
+
+from goat import PluginBase, WalletClientBase
+from goat.decorators.tool import Tool, get_tool_metadata
+
+
+class FakeWalletClient(WalletClientBase):
+    def get_address(self) -> str:
+        return "0x0"
+
+    def get_chain(self):
+        return {"type": "evm", "id": 1}
+
+    def sign_message(self, message: str):
+        return {"signature": message}
+
+    def balance_of(self, address: str, token_address=None):
+        return {"decimals": 18, "symbol": "ETH", "name": "Ether", "value": "0", "in_base_units": "0"}
+
+
+class EchoParameters(BaseModel):
+    text: str
+
+
+class FirstProvider:
+    @Tool({"description": "First tool", "parameters_schema": EchoParameters})
+    def first_tool(self, parameters: dict):
+        return ("first", self, parameters["text"])
+
+
+class SecondProvider:
+    @Tool({"description": "Second tool", "parameters_schema": EchoParameters})
+    async def second_tool(self, wallet_client: WalletClientBase, parameters: dict):
+        return ("second", self, wallet_client, parameters["text"])
+
+
+class TwoProviderPlugin(PluginBase):
+    def __init__(self):
+        super().__init__("two", [FirstProvider(), SecondProvider()])
+
+    def supports_chain(self, chain) -> bool:
+        return True
+
+
+def test_each_tool_calls_its_own_provider():
+    """Test tools of multi-provider plugins are dispatched to the provider defining them."""
+    plugin = TwoProviderPlugin()
+    wallet = FakeWalletClient()
+    tools = {tool.name: tool for tool in plugin.get_tools(wallet)}
+
+    assert tools["first_tool"].execute({"text": "a"}) == ("first", plugin.tool_providers[0], "a")
+    assert tools["second_tool"].execute({"text": "b"}) == ("second", plugin.tool_providers[1], wallet, "b")
+
+
+@pytest.mark.asyncio
+async def test_each_async_tool_calls_its_own_provider():
+    """Test the async execution path dispatches to the right provider as well."""
+    plugin = TwoProviderPlugin()
+    wallet = FakeWalletClient()
+    tools = {tool.name: tool for tool in plugin.get_tools(wallet)}
+
+    assert (await tools["first_tool"].aexecute({"text": "a"}))[1] is plugin.tool_providers[0]
+    assert (await tools["second_tool"].aexecute({"text": "b"}))[1] is plugin.tool_providers[1]
+
+
+class BaseProvider:
+    @Tool({"description": "Inherited tool", "parameters_schema": EchoParameters})
+    def inherited_tool(self, parameters: dict):
+        return "inherited"
+
+
+class ExplodingDescriptor:
+    """Fails on any access, including through the class."""
+
+    def __get__(self, instance, owner):
+        raise AssertionError("descriptors must not be evaluated during tool discovery")
+
+
+class DerivedProvider(BaseProvider):
+    connection = ExplodingDescriptor()
+
+    @property
+    def client(self):
+        raise AssertionError("properties must not be evaluated during tool discovery")
+
+    @Tool({"description": "Own tool", "parameters_schema": EchoParameters})
+    def own_tool(self, parameters: dict):
+        return "own"
+
+    @staticmethod
+    @Tool({"description": "Static tool", "parameters_schema": EchoParameters})
+    def static_tool(wallet_client: WalletClientBase, parameters: dict):
+        return "static"
+
+    def not_a_tool(self, parameters: dict):
+        return "plain"
+
+
+def test_get_tool_metadata_finds_inherited_tools_and_skips_descriptors():
+    """Test tool discovery walks base classes and never triggers properties."""
+    names = [tool.name for tool in get_tool_metadata(DerivedProvider)]
+
+    assert names == ["inherited_tool", "own_tool", "static_tool"]
+
+
+def test_get_tool_metadata_is_cached_per_class():
+    """Test a provider class is introspected once."""
+    assert get_tool_metadata(DerivedProvider) is get_tool_metadata(DerivedProvider)
+    assert [tool.name for tool in get_tool_metadata(BaseProvider)] == ["inherited_tool"]
@@ -0,0 +1,165 @@
+import json
+
+import pytest
+
+from goat.utils import token_metadata_cache
+from goat.utils.token_metadata_cache import TokenMetadataCache
+
+USDC = {"name": "USD Coin", "symbol": "USDC", "decimals": 6}
+WETH = {"name": "Wrapped Ether", "symbol": "WETH", "decimals": 18}
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(token_metadata_cache.time, "time", clock.time)
+    return clock
+
+
+def test_entries_expire_after_ttl(clock):
+    """Test entries are returned until their TTL has passed and dropped afterwards."""
+    cache = TokenMetadataCache(ttl=60)
+    cache.set("evm:1", "0xa", USDC)
+
+    clock.now += 60
+    assert cache.get("evm:1", "0xa") == USDC
+
+    clock.now += 1
+    assert cache.get("evm:1", "0xa") is None
+    assert len(cache) == 0
+
+
+def test_entries_without_ttl_never_expire(clock):
+    """Test a TTL of None keeps entries until they are evicted."""
+    cache = TokenMetadataCache(ttl=None)
+    cache.set("evm:1", "0xa", USDC)
+
+    clock.now += 10 * 365 * 24 * 60 * 60
+    assert cache.get("evm:1", "0xa") == USDC
+
+
+def test_least_recently_used_entry_is_evicted():
+    """Test the cache is bounded and evicts the entry read least recently."""
+    cache = TokenMetadataCache(max_size=2)
+    cache.set("evm:1", "0xa", USDC)
+    cache.set("evm:1", "0xb", WETH)
+    # Reading 0xa makes 0xb the least recently used entry
+    assert cache.get("evm:1", "0xa") == USDC
+
+    cache.set("evm:1", "0xc", USDC)
+
+    assert len(cache) == 2
+    assert cache.get("evm:1", "0xb") is None
+    assert cache.get("evm:1", "0xa") == USDC
+    assert cache.get("evm:1", "0xc") == USDC
+
+
+def test_namespaces_are_kept_apart():
+    """Test the same address on different chains is cached separately."""
+    cache = TokenMetadataCache()
+    cache.set("evm:1", "0xa", USDC)
+    cache.set("evm:8453", "0xa", WETH)
+
+    cache.invalidate("evm:1")
+
+    assert cache.get("evm:1", "0xa") is None
+    assert cache.get("evm:8453", "0xa") == WETH
+
+
+def test_get_or_load_only_calls_loader_on_miss():
+    """Test the loader runs once and its result is served from the cache afterwards."""
+    cache = TokenMetadataCache()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return dict(USDC)
+
+    assert cache.get_or_load("evm:1", "0xa", loader) == USDC
+    assert cache.get_or_load("evm:1", "0xa", loader) == USDC
+    assert len(calls) == 1
+
+
+def test_save_and_load_round_trip(tmp_path):
+    """Test a saved cache is restored by a new cache using the same path, in LRU order."""
+    path = str(tmp_path / "cache" / "tokens.json")
+    cache = TokenMetadataCache(path=path)
+    cache.set("evm:1", "0xa", USDC)
+    cache.set("solana:mainnet", "Mint1111", WETH)
+    cache.save()
+
+    restored = TokenMetadataCache(max_size=1, path=path)
+
+    # Only the most recently used entry fits
+    assert len(restored) == 1
+    assert restored.get("solana:mainnet", "Mint1111") == WETH
+    assert list(tmp_path.joinpath("cache").iterdir()) == [tmp_path / "cache" / "tokens.json"]
+
+
+def test_save_skips_unchanged_cache(tmp_path):
+    """Test save does not rewrite the file when nothing changed since the last save."""
+    path = tmp_path / "tokens.json"
+    cache = TokenMetadataCache(path=str(path))
+    cache.save()
+    assert not path.exists()
+
+    cache.set("evm:1", "0xa", USDC)
+    cache.save()
+    path.write_text("{}")
+    cache.save()
+
+    assert path.read_text() == "{}"
+
+
+def test_load_drops_expired_entries(tmp_path, clock):
+    """Test entries that expired while persisted are not loaded."""
+    path = str(tmp_path / "tokens.json")
+    cache = TokenMetadataCache(ttl=60, path=path)
+    cache.set("evm:1", "0xa", USDC)
+    clock.now += 30
+    cache.set("evm:1", "0xb", WETH)
+    cache.save()
+
+    clock.now += 45
+    restored = TokenMetadataCache(ttl=60, path=path)
+
+    assert restored.get("evm:1", "0xa") is None
+    assert restored.get("evm:1", "0xb") == WETH
+
+
+@pytest.mark.parametrize("content", ["not json", "[]", "null"])
+def test_load_ignores_unreadable_file(tmp_path, content):
+    """Test a corrupt cache file results in an empty cache instead of an error."""
+    path = tmp_path / "tokens.json"
+    path.write_text(content)
+
+    assert len(TokenMetadataCache(path=str(path))) == 0
+
+
+def test_load_skips_malformed_entries(tmp_path, clock):
+    """Test malformed entries are skipped while valid ones are still loaded."""
+    path = tmp_path / "tokens.json"
+    path.write_text(
+        json.dumps(
+            {
+                "evm:1/0xa": {"metadata": USDC, "stored_at": clock.now},
+                "evm:1/0xb": {"metadata": {"name": "No decimals"}, "stored_at": clock.now},
+                "evm:1/0xc": {"metadata": WETH},
+                "evm:1/0xd": {"metadata": WETH, "stored_at": "yesterday"},
+                "evm:1/0xe": "not an entry",
+            }
+        )
+    )
+
+    cache = TokenMetadataCache(path=str(path))
+
+    assert len(cache) == 1
+    assert cache.get("evm:1", "0xa") == USDC
@@ -0,0 +1,104 @@
+import gc
+import weakref
+
+import pytest
+
+from goat import ToolFactory, WalletClientBase
+
+
+class FakeWalletClient(WalletClientBase):
+    def get_address(self) -> str:
+        return "0x0"
+
+    def get_chain(self):
+        return {"type": "evm", "id": 1}
+
+    def sign_message(self, message: str):
+        return {"signature": message}
+
+    def balance_of(self, address: str, token_address=None):
+        return {"decimals": 18, "symbol": "ETH", "name": "Ether", "value": "0", "in_base_units": "0"}
+
+
+class FakePlugin:
+    pass
+
+
+def _build_for(wallet):
+    # Like real adapter tools, the built tools hold a reference to their wallet
+    return lambda: [lambda: wallet.get_address()]
+
+
+def test_returns_shared_tools_in_new_lists():
+    """Test the same combination returns the cached tool objects in a fresh list."""
+    factory = ToolFactory()
+    wallet, plugin = FakeWalletClient(), FakePlugin()
+    builds = []
+
+    def build():
+        builds.append(1)
+        return ["tool"]
+
+    first = factory.get_or_build("test", wallet, [plugin], build)
+    second = factory.get_or_build("test", wallet, [plugin], build)
+
+    assert first == second and first is not second
+    assert len(builds) == 1
+    assert factory.get_or_build("other", wallet, [plugin], build) == ["tool"]
+    assert len(builds) == 2
+
+
+def test_wallets_are_released_once_evicted():
+    """Test cached tools cannot keep an unbounded number of wallets alive."""
+    factory = ToolFactory(max_size=2)
+    plugin = FakePlugin()
+    wallet = FakeWalletClient()
+    wallet_ref = weakref.ref(wallet)
+    factory.get_or_build("test", wallet, [plugin], _build_for(wallet))
+    del wallet
+
+    for _ in range(2):
+        other = FakeWalletClient()
+        factory.get_or_build("test", other, [plugin], _build_for(other))
+    del other
+    gc.collect()
+
+    assert wallet_ref() is None
+    assert len(factory) == 2
+
+
+def test_invalidate_releases_wallet():
+    """Test invalidating a wallet drops its entries and lets it be collected."""
+    factory = ToolFactory()
+    plugin = FakePlugin()
+    wallet, kept = FakeWalletClient(), FakeWalletClient()
+    wallet_ref = weakref.ref(wallet)
+    factory.get_or_build("test", wallet, [plugin], _build_for(wallet))
+    factory.get_or_build("test", kept, [plugin], _build_for(kept))
+
+    factory.invalidate(wallet=wallet)
+    del wallet
+    gc.collect()
+
+    assert wallet_ref() is None
+    assert len(factory) == 1
+
+
+def test_invalidate_by_plugin():
+    """Test invalidating a plugin only drops the entries built with it."""
+    factory = ToolFactory()
+    wallet, first, second = FakeWalletClient(), FakePlugin(), FakePlugin()
+    factory.get_or_build("test", wallet, [first], list)
+    factory.get_or_build("test", wallet, [first, second], list)
+    factory.get_or_build("test", wallet, [second], list)
+
+    factory.invalidate(plugin=first)
+    assert len(factory) == 1
+
+    factory.invalidate()
+    assert len(factory) == 0
+
+
+def test_rejects_invalid_max_size():
+    with pytest.raises(ValueError):
+        ToolFactory(max_size=0)
@@ -1,6 +1,6 @@
-import aiohttp
 from typing import Optional
 from goat.decorators.tool import Tool
+from goat.utils.http_session import get_http_session
 from .parameters import GetBalancesParameters
 
 class OneInchService:
@@ -29,8 +29,8 @@ class OneInchService:
         if self.api_key:
             headers["Authorization"] = f"Bearer {self.api_key}"
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers) as response:
-                if not response.ok:
-                    raise Exception(f"Failed to fetch balances: {response.status} {await response.text()}")
-                return await response.json()
+        session = get_http_session(self.base_url)
+        async with session.get(url, headers=headers) as response:
+            if not response.ok:
+                raise Exception(f"Failed to fetch balances: {response.status} {await response.text()}")
+            return await response.json()
@@ -1,6 +1,6 @@
-import aiohttp
 from typing import Optional
 from goat.decorators.tool import Tool
+from goat.utils.http_session import get_http_session
 from .parameters import GetAlloraPricePredictionParameters, AlloraPricePredictionToken, AlloraPricePredictionTimeframe
 
 
@@ -32,18 +32,18 @@ class AlloraService:
         # Construct URL following TypeScript pattern
         url = f"{self.api_root}/consumer/price/{signature_format}/{ticker}/{timeframe}"
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers) as response:
-                if not response.ok:
-                    raise Exception(
-                        f"Allora plugin: error requesting price prediction: url={url} "
-                        f"status={response.status} body={await response.text()}"
-                    )
+        session = get_http_session(self.api_root)
+        async with session.get(url, headers=headers) as response:
+            if not response.ok:
+                raise Exception(
+                    f"Allora plugin: error requesting price prediction: url={url} "
+                    f"status={response.status} body={await response.text()}"
+                )
                 
-                data = await response.json()
+            data = await response.json()
                 
-                # Validate response structure
-                if not data.get("data", {}).get("inference_data"):
-                    raise Exception(f"API response missing data: {data}")
+            # Validate response structure
+            if not data.get("data", {}).get("inference_data"):
+                raise Exception(f"API response missing data: {data}")
                 
-                return data["data"]["inference_data"]
+            return data["data"]["inference_data"]
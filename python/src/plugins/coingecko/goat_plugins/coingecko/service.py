@@ -1,5 +1,5 @@
-import aiohttp
 from goat.decorators.tool import Tool
+from goat.utils.http_session import get_http_session
 from .parameters import GetCoinPriceParameters, GetTrendingCoinsParameters, SearchCoinsParameters
 
 class CoinGeckoService:
@@ -13,12 +13,12 @@ class CoinGeckoService:
     })
     async def get_trending_coins(self, parameters: dict):
         """Get the list of trending coins from CoinGecko"""
-        async with aiohttp.ClientSession() as session:
-            url = f"{self.base_url}/search/trending?x_cg_demo_api_key={self.api_key}"
-            async with session.get(url) as response:
-                if not response.ok:
-                    raise Exception(f"HTTP error! status: {response.status} {await response.text()}")
-                return await response.json()
+        session = get_http_session(self.base_url)
+        url = f"{self.base_url}/search/trending?x_cg_demo_api_key={self.api_key}"
+        async with session.get(url) as response:
+            if not response.ok:
+                raise Exception(f"HTTP error! status: {response.status} {await response.text()}")
+            return await response.json()
 
     @Tool({
         "description": "Get the price of a specific coin from CoinGecko",
@@ -36,12 +36,12 @@ class CoinGeckoService:
             "x_cg_demo_api_key": self.api_key
         }
         
-        async with aiohttp.ClientSession() as session:
-            url = f"{self.base_url}/simple/price"
-            async with session.get(url, params=params) as response:
-                if not response.ok:
-                    raise Exception(f"HTTP error! status: {response.status} {await response.text()}")
-                return await response.json()
+        session = get_http_session(self.base_url)
+        url = f"{self.base_url}/simple/price"
+        async with session.get(url, params=params) as response:
+            if not response.ok:
+                raise Exception(f"HTTP error! status: {response.status} {await response.text()}")
+            return await response.json()
 
     @Tool({
         "description": "Search for coins on CoinGecko",
@@ -54,21 +54,21 @@ class CoinGeckoService:
             "x_cg_demo_api_key": self.api_key
         }
         
-        async with aiohttp.ClientSession() as session:
-            url = f"{self.base_url}/search"
-            async with session.get(url, params=params) as response:
-                if not response.ok:
-                    raise Exception(f"HTTP error! status: {response.status} {await response.text()}")
-                data = await response.json()
+        session = get_http_session(self.base_url)
+        url = f"{self.base_url}/search"
+        async with session.get(url, params=params) as response:
+            if not response.ok:
+                raise Exception(f"HTTP error! status: {response.status} {await response.text()}")
+            data = await response.json()
                 
-                if parameters["exact_match"]:
-                    coins = data.get("coins", [])
-                    exact_matches = [
-                        coin for coin in coins 
-                        if coin.get("id") == parameters["query"] or 
-                           coin.get("symbol").lower() == parameters["query"].lower() or
-                           coin.get("name").lower() == parameters["query"].lower()
-                    ]
-                    data["coins"] = exact_matches
+            if parameters["exact_match"]:
+                coins = data.get("coins", [])
+                exact_matches = [
+                    coin for coin in coins 
+                    if coin.get("id") == parameters["query"] or 
+                       coin.get("symbol").lower() == parameters["query"].lower() or
+                       coin.get("name").lower() == parameters["query"].lower()
+                ]
+                data["coins"] = exact_matches
                 
-                return data
+            return data
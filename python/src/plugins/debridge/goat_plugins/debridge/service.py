@@ -1,5 +1,5 @@
-import aiohttp
 from goat.decorators.tool import Tool
+from goat.utils.http_session import get_http_session
 from urllib.parse import urlencode
 from .parameters import (
     CancelExternalCallParameters,
@@ -22,13 +22,13 @@ class DebridgeService:
 
     async def _fetch(self, url: str, action: str):
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if not response.ok:
-                        raise Exception(
-                            f"HTTP error! status: {response.status} {await response.text()}"
-                        )
-                    return await response.json()
+            session = get_http_session(self.base_url)
+            async with session.get(url) as response:
+                if not response.ok:
+                    raise Exception(
+                        f"HTTP error! status: {response.status} {await response.text()}"
+                    )
+                return await response.json()
         except Exception as e:
             raise Exception(f"Failed to {action}: {e}")
 
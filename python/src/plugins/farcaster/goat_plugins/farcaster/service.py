@@ -1,5 +1,5 @@
-import aiohttp
 from goat.decorators.tool import Tool
+from goat.utils.http_session import get_http_session
 from .parameters import (
     GetCastParameters,
     PublishCastParameters,
@@ -50,8 +50,8 @@ class FarcasterService:
         headers = kwargs.pop("headers", {})
         headers["x-api-key"] = self.api_key
         headers["content-type"] = "application/json"
-        async with aiohttp.ClientSession() as session:
-            async with session.request(method, url, headers=headers, **kwargs) as response:
-                if not response.ok:
-                    raise Exception(f"HTTP error! status: {response.status}, text: {await response.text()}")
-                return await response.json()
+        session = get_http_session(self.base_url)
+        async with session.request(method, url, headers=headers, **kwargs) as response:
+            if not response.ok:
+                raise Exception(f"HTTP error! status: {response.status}, text: {await response.text()}")
+            return await response.json()
@@ -1,19 +1,13 @@
-import aiohttp
 import json
 from typing import Dict, Any
 
 from goat.decorators.tool import Tool
+from goat.utils.http_session import get_http_session
 from .parameters import BuyTokenParameters
-from goat_wallets.evm import EVMWalletClient
-from goat_wallets.solana import SolanaWalletClient
 
 # Import the base wallet client type for proper typing
 from goat.classes.wallet_client_base import WalletClientBase
 
-# Minimal imports for EVM transaction parsing (essential for functionality)
-import rlp
-from eth_utils import to_checksum_address, to_hex
-
 
 def clean_null_values(obj):
     """Recursively remove null/None values from dictionaries and lists."""
@@ -27,6 +21,10 @@ def clean_null_values(obj):
 
 def parse_evm_transaction(serialized_tx: str) -> Dict[str, Any]:
     """Parse EVM transaction to extract to, value, and data (handles legacy and EIP-1559)."""
+    # Imported here so Solana-only agents never load the EVM encoding libraries
+    import rlp
+    from eth_utils import to_checksum_address, to_hex
+
     if not serialized_tx.startswith("0x"):
         serialized_tx = f"0x{serialized_tx}"
     
@@ -97,12 +95,12 @@ class CrossmintApiClient:
             "Content-Type": "application/json",
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(f"{self.base_url}{path}", headers=headers, json=body) as response:
-                if not response.ok:
-                    error_text = await response.text()
-                    raise Exception(f"HTTP error! status: {response.status} {error_text}")
-                return await response.json()
+        session = get_http_session(self.base_url)
+        async with session.post(f"{self.base_url}{path}", headers=headers, json=body) as response:
+            if not response.ok:
+                error_text = await response.text()
+                raise Exception(f"HTTP error! status: {response.status} {error_text}")
+            return await response.json()
 
 
 class CrossmintHeadlessCheckoutService:
@@ -165,15 +163,20 @@ class CrossmintHeadlessCheckoutService:
 
             # Handle Solana transactions
             if payment_method == "solana":
+                # Wallet packages are imported for the chain being paid on only
+                from goat_wallets.solana import SolanaWalletClient
+
                 if not isinstance(wallet_client, SolanaWalletClient):
                     raise Exception("Solana wallet client required. Use a solana wallet client, or change the payment method to one supported by your wallet client")
 
                 # Send the raw transaction using Solana wallet
-                result = wallet_client.send_raw_transaction(serialized_transaction)
+                result = await wallet_client.asend_raw_transaction(serialized_transaction)
                 return {"order": order, "txId": result["hash"]}
 
             # Handle EVM transactions
             if self._is_evm_blockchain(payment_method):
+                from goat_wallets.evm import EVMWalletClient
+
                 if not isinstance(wallet_client, EVMWalletClient):
                     raise Exception("EVM wallet client required. Use an evm wallet client, or change the payment method to one supported by your wallet client")
 
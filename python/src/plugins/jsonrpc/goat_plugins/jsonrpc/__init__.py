@@ -1,17 +1,21 @@
 from dataclasses import dataclass
 
 from goat.classes.plugin_base import PluginBase
-from .service import JSONRpcService
+from .service import DEFAULT_BATCH_SIZE, DEFAULT_MAX_CONCURRENCY, JSONRpcService
 
 
 @dataclass
 class JSONRpcPluginOptions:
     endpoint: str
+    batch_size: int = DEFAULT_BATCH_SIZE
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
 
 
 class JSONRpcPlugin(PluginBase):
     def __init__(self, options: JSONRpcPluginOptions):
-        super().__init__("jsonrpc", [JSONRpcService(options.endpoint)])
+        super().__init__("jsonrpc", [
+            JSONRpcService(options.endpoint, options.batch_size, options.max_concurrency)
+        ])
 
     def supports_chain(self, chain) -> bool:
         return True
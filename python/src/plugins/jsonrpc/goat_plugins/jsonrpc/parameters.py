@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List
+from typing import Any, List
 
 class JSONRpcBodyParameters(BaseModel):
     method: str = Field(
@@ -18,3 +18,21 @@ class JSONRpcBodyParameters(BaseModel):
         ...,
         description="A string that specifies the version of the JSON-RPC protocol must be exactly '2.0'"
     )
+
+
+class JSONRpcCallParameters(BaseModel):
+    method: str = Field(
+        ...,
+        description="A string containing the name of the method to be invoked"
+    )
+    params: List[Any] = Field(
+        default_factory=list,
+        description="A structured value that holds the parameter values to be used during the invocation of the method"
+    )
+
+
+class JSONRpcBatchParameters(BaseModel):
+    calls: List[JSONRpcCallParameters] = Field(
+        ...,
+        description="The calls to send in one batch, each with a method name and its params"
+    )
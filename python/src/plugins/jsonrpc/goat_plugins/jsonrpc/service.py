@@ -1,10 +1,29 @@
-import aiohttp
+import asyncio
+from typing import Any, Dict, List
+
 from goat.decorators.tool import Tool
-from .parameters import JSONRpcBodyParameters
+from goat.utils.http_session import get_http_session
+from .parameters import JSONRpcBatchParameters, JSONRpcBodyParameters
+
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_MAX_CONCURRENCY = 4
+
 
 class JSONRpcService:
-    def __init__(self, endpoint: str):
+    def __init__(
+        self,
+        endpoint: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
         self.endpoint = endpoint
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
 
     @Tool({
         "description": "Make a remote procedure call to a JSON RPC endpoint",
@@ -13,10 +32,81 @@ class JSONRpcService:
     async def JSONRpcFunc(self, parameters: dict):
         """Makes a POST request to the configured endpoint with the required JSON-RPC parameters."""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(self.endpoint, json=parameters) as response:
-                    if not response.ok:
-                        raise Exception(f"HTTP error! status: {response.status}, body: {await response.text()}")
-                    return await response.json()
+            session = get_http_session(self.endpoint)
+            async with session.post(self.endpoint, json=parameters) as response:
+                if not response.ok:
+                    raise Exception(f"HTTP error! status: {response.status}, body: {await response.text()}")
+                return await response.json()
+        except Exception as e:
+            raise Exception(f"Failed to call {self.endpoint}: {e}")
+
+    @Tool({
+        "description": "Make several remote procedure calls to a JSON RPC endpoint in one batch request. "
+        "Prefer this over repeated single calls when fetching many accounts, blocks or transactions",
+        "parameters_schema": JSONRpcBatchParameters
+    })
+    async def JSONRpcBatchFunc(self, parameters: dict):
+        """Sends the calls as JSON-RPC 2.0 batches and returns one response per call, in order."""
+        try:
+            return await self.batch_call(parameters["calls"])
         except Exception as e:
             raise Exception(f"Failed to call {self.endpoint}: {e}")
+
+    async def batch_call(self, calls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Sends JSON-RPC calls as batches and maps the responses back to the calls.
+
+        Calls are split into batches of `batch_size`, of which at most `max_concurrency` are in
+        flight at once. Calls the endpoint did not answer, including every call of a batch whose
+        request failed, get a JSON-RPC error response.
+
+        Args:
+            calls: Calls with a `method` and optional `params`
+
+        Returns:
+            One JSON-RPC response object per call, in the same order
+        """
+        requests = [
+            {"jsonrpc": "2.0", "id": index, "method": call["method"], "params": call.get("params", [])}
+            for index, call in enumerate(calls)
+        ]
+        if not requests:
+            return []
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        batches = [requests[i:i + self.batch_size] for i in range(0, len(requests), self.batch_size)]
+        batch_responses = await asyncio.gather(*(self._post_batch(batch, semaphore) for batch in batches))
+
+        responses_by_id = {
+            response["id"]: response
+            for responses in batch_responses
+            for response in responses
+            # Request ids are ints, anything else cannot belong to one of the calls
+            if isinstance(response, dict) and isinstance(response.get("id"), int)
+        }
+        return [
+            responses_by_id.get(request["id"]) or _error_response(request["id"], "No response returned for this call")
+            for request in requests
+        ]
+
+    async def _post_batch(self, batch: List[Dict[str, Any]], semaphore: asyncio.Semaphore) -> List[Dict[str, Any]]:
+        async with semaphore:
+            try:
+                session = get_http_session(self.endpoint)
+                async with session.post(self.endpoint, json=batch) as response:
+                    if not response.ok:
+                        raise Exception(f"HTTP error! status: {response.status}, body: {await response.text()}")
+                    body = await response.json(content_type=None)
+            except Exception as e:
+                # A failed batch must not discard the responses of the other batches
+                return [_error_response(request["id"], f"Batch request failed: {e}") for request in batch]
+
+        if isinstance(body, dict):
+            # Endpoints without batch support answer with a single error object
+            return [{**body, "id": request["id"]} for request in batch]
+        if not isinstance(body, list):
+            return [_error_response(request["id"], f"Unexpected batch response: {body!r}") for request in batch]
+        return body
+
+
+def _error_response(request_id: int, message: str) -> Dict[str, Any]:
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": -32603, "message": message}}
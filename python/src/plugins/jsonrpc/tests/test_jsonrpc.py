@@ -0,0 +1,154 @@
+import asyncio
+
+import pytest
+from goat_plugins.jsonrpc.service import JSONRpcService
+
+ENDPOINT = "https://rpc.example.com"
+
+
+class _FakeResponse:
+    def __init__(self, status, body):
+        self.status = status
+        self.ok = status < 400
+        self._body = body
+
+    async def json(self, content_type="application/json"):
+        return self._body
+
+    async def text(self):
+        return str(self._body)
+
+
+class _FakeSession:
+    """Answers each batch with `handler(batch)`, which returns (status, body) or raises."""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.batches = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def post(self, url, json=None):
+        assert url == ENDPOINT
+        self.batches.append(json)
+        return _TrackedResponse(self, json)
+
+
+class _TrackedResponse:
+    def __init__(self, session, batch):
+        self.session = session
+        self.batch = batch
+
+    async def __aenter__(self):
+        self.session.in_flight += 1
+        self.session.max_in_flight = max(self.session.max_in_flight, self.session.in_flight)
+        await asyncio.sleep(0)
+        status, body = self.session.handler(self.batch)
+        return _FakeResponse(status, body)
+
+    async def __aexit__(self, *exc):
+        self.session.in_flight -= 1
+        return False
+
+
+def _echo(batch):
+    # Answer in reverse order, responses must be matched by id
+    return 200, [{"jsonrpc": "2.0", "id": request["id"], "result": request["params"][0]} for request in reversed(batch)]
+
+
+def _calls(count):
+    return [{"method": "eth_getBalance", "params": [f"0x{i:040x}"]} for i in range(count)]
+
+
+@pytest.fixture
+def session(monkeypatch):
+    holder = {}
+
+    def use(handler):
+        holder["session"] = _FakeSession(handler)
+        return holder["session"]
+
+    monkeypatch.setattr("goat_plugins.jsonrpc.service.get_http_session", lambda endpoint: holder["session"])
+    return use
+
+
+@pytest.mark.asyncio
+async def test_batches_are_chunked_and_mapped_by_id(session):
+    """Test calls are split into batches and responses come back in call order."""
+    fake = session(_echo)
+    service = JSONRpcService(ENDPOINT, batch_size=3, max_concurrency=2)
+
+    responses = await service.batch_call(_calls(8))
+
+    assert [len(batch) for batch in fake.batches] == [3, 3, 2]
+    assert [response["id"] for response in responses] == list(range(8))
+    assert [response["result"] for response in responses] == [call["params"][0] for call in _calls(8)]
+    assert fake.max_in_flight <= 2
+
+
+@pytest.mark.asyncio
+async def test_single_error_object_applies_to_every_call(session):
+    """Test endpoints without batch support get their error copied to each call."""
+    session(lambda batch: (200, {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "no batches"}}))
+    service = JSONRpcService(ENDPOINT, batch_size=10)
+
+    responses = await service.batch_call(_calls(3))
+
+    assert [response["id"] for response in responses] == [0, 1, 2]
+    assert all(response["error"]["message"] == "no batches" for response in responses)
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_keeps_other_batches(session):
+    """Test an HTTP error only turns the calls of its own batch into error responses."""
+
+    def handler(batch):
+        if batch[0]["id"] == 2:
+            return 503, "unavailable"
+        return _echo(batch)
+
+    session(handler)
+    service = JSONRpcService(ENDPOINT, batch_size=2)
+
+    responses = await service.batch_call(_calls(6))
+
+    assert [response["id"] for response in responses] == list(range(6))
+    assert [("result" in response) for response in responses] == [True, True, False, False, True, True]
+    assert "status: 503" in responses[2]["error"]["message"]
+
+
+@pytest.mark.asyncio
+async def test_transport_errors_become_error_responses(session):
+    """Test exceptions raised while sending a batch are reported per call."""
+
+    def handler(batch):
+        raise ConnectionError("connection reset")
+
+    session(handler)
+    responses = await JSONRpcService(ENDPOINT).batch_call(_calls(2))
+
+    assert [response["error"]["code"] for response in responses] == [-32603, -32603]
+    assert "connection reset" in responses[0]["error"]["message"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("body", [None, "oops", 42])
+async def test_unexpected_bodies_become_error_responses(session, body):
+    """Test bodies that are neither a list nor an object are reported per call."""
+    session(lambda batch: (200, body))
+
+    responses = await JSONRpcService(ENDPOINT).batch_call(_calls(2))
+
+    assert [response["id"] for response in responses] == [0, 1]
+    assert all("Unexpected batch response" in response["error"]["message"] for response in responses)
+
+
+@pytest.mark.asyncio
+async def test_missing_and_malformed_responses(session):
+    """Test calls without a usable response get a 'no response' error."""
+    session(lambda batch: (200, [{"jsonrpc": "2.0", "id": 0, "result": "0x1"}, {"id": [1]}, "garbage"]))
+
+    responses = await JSONRpcService(ENDPOINT).batch_call(_calls(2))
+
+    assert responses[0]["result"] == "0x1"
+    assert responses[1]["error"]["message"] == "No response returned for this call"
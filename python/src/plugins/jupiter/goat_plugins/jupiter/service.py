@@ -1,10 +1,6 @@
 import base64
-import base58
-import aiohttp
 from goat.decorators.tool import Tool
-from goat_wallets.solana.wallet import SolanaTransaction
-from solders.message import MessageV0
-from solders.transaction import VersionedTransaction
+from goat.utils.http_session import get_http_session
 from .parameters import GetQuoteParameters, QuoteResponse
 from goat_wallets.solana import SolanaWalletClient
 
@@ -12,7 +8,14 @@ from goat_wallets.solana import SolanaWalletClient
 class JupiterService:
     def __init__(self):
         self.base_url = "https://api.jup.ag/swap/v1"
-        self._timeout = aiohttp.ClientTimeout(total=10)  # 10 second timeout
+        self._timeout_seconds = 10
+
+    @property
+    def _timeout(self):
+        # aiohttp is imported on first request, creating the plugin stays cheap
+        import aiohttp
+
+        return aiohttp.ClientTimeout(total=self._timeout_seconds)
 
     @Tool({
         "description": "Get a quote for a swap on the Jupiter DEX",
@@ -20,6 +23,8 @@ class JupiterService:
     })
     async def get_quote(self, parameters: dict) -> dict:
         """Get a quote for swapping tokens using Jupiter."""
+        import aiohttp
+
         try:
             params = GetQuoteParameters.model_validate(parameters)
             # Convert parameters to dict and ensure required fields are properly formatted
@@ -45,24 +50,24 @@ class JupiterService:
                 request_params['platformFeeBps'] = int(params.platformFeeBps)
                 
             print(f"Requesting quote with parameters: {request_params}")
-            async with aiohttp.ClientSession(timeout=self._timeout) as session:
-                async with session.get(f"{self.base_url}/quote", params=request_params) as response:
-                    response_text = await response.text()
-                    print(f"Got response: {response_text}")
-
-                    if response.status != 200:
-                        try:
-                            error_data = await response.json()
-                            raise Exception(
-                                f"Failed to get quote: {error_data.get('error', 'Unknown error')}")
-                        except:
-                            raise Exception(
-                                f"Failed to get quote: {response_text}")
-
-                    response_data = await response.json()
-                    QuoteResponse.model_validate(response_data)
-
-                    return response_data
+            session = get_http_session(self.base_url)
+            async with session.get(f"{self.base_url}/quote", params=request_params, timeout=self._timeout) as response:
+                response_text = await response.text()
+                print(f"Got response: {response_text}")
+
+                if response.status != 200:
+                    try:
+                        error_data = await response.json()
+                        raise Exception(
+                            f"Failed to get quote: {error_data.get('error', 'Unknown error')}")
+                    except:
+                        raise Exception(
+                            f"Failed to get quote: {response_text}")
+
+                response_data = await response.json()
+                QuoteResponse.model_validate(response_data)
+
+                return response_data
         except aiohttp.ClientResponseError as error:
             error_message = f"Failed to get quote: {str(error)}"
             if error.status != 404:  # Only try to parse response for non-404 errors
@@ -80,6 +85,8 @@ class JupiterService:
     })
     async def swap_tokens(self, wallet_client: SolanaWalletClient, parameters: dict):
         """Swap tokens using Jupiter DEX."""
+        import base58
+
         try:
             # First get the quote
             quote_response = await self.get_quote(parameters)
@@ -91,29 +98,29 @@ class JupiterService:
             }
 
             # Get swap transaction
-            async with aiohttp.ClientSession(timeout=self._timeout) as session:
-                async with session.post(f"{self.base_url}/swap", json=swap_request) as response:
-                    if response.status != 200:
-                        error_data = await response.json()
-                        raise Exception(
-                            f"Failed to create swap transaction: {error_data.get('error', 'Unknown error')}")
+            session = get_http_session(self.base_url)
+            async with session.post(f"{self.base_url}/swap", json=swap_request, timeout=self._timeout) as response:
+                if response.status != 200:
+                    error_data = await response.json()
+                    raise Exception(
+                        f"Failed to create swap transaction: {error_data.get('error', 'Unknown error')}")
 
-                    swap_response = await response.json()
-                    swap_transaction = swap_response.get("swapTransaction")
+                swap_response = await response.json()
+                swap_transaction = swap_response.get("swapTransaction")
 
-                    if not swap_transaction:
-                        raise Exception("No swap transaction returned")
+                if not swap_transaction:
+                    raise Exception("No swap transaction returned")
 
-                    base58_tx = base58.b58encode(
-                        base64.b64decode(swap_transaction)).decode()
+                base58_tx = base58.b58encode(
+                    base64.b64decode(swap_transaction)).decode()
 
-                    # Send the raw transaction directly
-                    result = wallet_client.send_raw_transaction(
-                        base58_tx)
+                # Send the raw transaction directly
+                result = await wallet_client.asend_raw_transaction(
+                    base58_tx)
 
-                    return {
-                        "hash": result["hash"]
-                    }
+                return {
+                    "hash": result["hash"]
+                }
 
         except Exception as error:
             # if error includes 0x1771
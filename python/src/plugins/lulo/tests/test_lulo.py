@@ -31,3 +31,81 @@ async def test_deposit_usdc():
     # Test deposit (this will make a real API call, so use with caution)
     # result = await deposit_tool.func({"amount": "1"})
     # assert result is not None
+
+
+class _FakeResponse:
+    def __init__(self, status, body):
+        self.status = status
+        self.ok = status < 400
+        self._body = body
+
+    async def json(self):
+        return self._body
+
+    async def text(self):
+        return str(self._body)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _FakeSession:
+    def __init__(self, response):
+        self.response = response
+        self.requests = []
+
+    def post(self, url, headers=None, json=None):
+        self.requests.append((url, json))
+        return self.response
+
+
+class _FakeWallet:
+    def __init__(self):
+        self.sent = []
+
+    def get_address(self):
+        return "LuLoWaLLet1111111111111111111111111111111111"
+
+    async def asend_raw_transaction(self, transaction):
+        self.sent.append(transaction)
+        return {"hash": "signature"}
+
+
+def _deposit_tool(wallet):
+    return next(tool for tool in lulo(LuloPluginOptions()).get_tools(wallet) if tool.name == "deposit_usdc")
+
+
+@pytest.mark.asyncio
+async def test_deposit_usdc_with_mocked_session(monkeypatch):
+    """Test the deposit tool posts to Lulo and sends the returned transaction."""
+    session = _FakeSession(_FakeResponse(200, {"transaction": "base64tx"}))
+    requested = []
+    monkeypatch.setattr(
+        "goat_plugins.lulo.service.get_http_session",
+        lambda base_url: requested.append(base_url) or session,
+    )
+    wallet = _FakeWallet()
+
+    result = await _deposit_tool(wallet).aexecute({"amount": "1.5"})
+
+    assert result == "signature"
+    assert requested == ["https://blink.lulo.fi"]
+    assert session.requests == [
+        ("https://blink.lulo.fi/actions?amount=1.5&symbol=USDC", {"account": wallet.get_address()})
+    ]
+    assert wallet.sent == ["base64tx"]
+
+
+@pytest.mark.asyncio
+async def test_deposit_usdc_reports_http_errors(monkeypatch):
+    """Test HTTP errors from Lulo are raised without sending a transaction."""
+    session = _FakeSession(_FakeResponse(500, "unavailable"))
+    monkeypatch.setattr("goat_plugins.lulo.service.get_http_session", lambda base_url: session)
+    wallet = _FakeWallet()
+
+    with pytest.raises(Exception, match="Failed to deposit USDC: HTTP error! status: 500"):
+        await _deposit_tool(wallet).aexecute({"amount": "1"})
+    assert wallet.sent == []
@@ -1,5 +1,5 @@
-import aiohttp
 from goat.decorators.tool import Tool
+from goat.utils.http_session import get_http_session
 from .parameters import (
     GetTokenDetailsParameters,
     GetTokenTradesParameters,
@@ -20,11 +20,11 @@ class NansenService:
         try:
             url = f"{self.base_url}{endpoint}"
             headers = {"api-key": self.api_key}
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params, headers=headers) as response:
-                    if not response.ok:
-                        raise Exception(f"HTTP error! status: {response.status} {await response.text()}")
-                    return await response.json()
+            session = get_http_session(self.base_url)
+            async with session.get(url, params=params, headers=headers) as response:
+                if not response.ok:
+                    raise Exception(f"HTTP error! status: {response.status} {await response.text()}")
+                return await response.json()
         except Exception as e:
             raise Exception(f"Failed to {action}: {e}")
 
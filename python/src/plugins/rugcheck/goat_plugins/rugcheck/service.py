@@ -1,5 +1,5 @@
-import aiohttp
 from goat.decorators.tool import Tool
+from goat.utils.http_session import get_http_session
 from .parameters import GetTokenReportParameters, NoParameters
 
 
@@ -13,14 +13,14 @@ class RugCheckService:
             "Content-Type": "application/json",
         }
         
-        async with aiohttp.ClientSession() as session:
-            url = f"{self.base_url}{endpoint}"
-            async with session.get(url, headers=headers) as response:
-                if not response.ok:
-                    if response.status == 429:
-                        raise Exception("RugCheck API rate limit exceeded")
-                    raise Exception(f"RugCheck API request failed: {response.status}")
-                return await response.json()
+        session = get_http_session(self.base_url)
+        url = f"{self.base_url}{endpoint}"
+        async with session.get(url, headers=headers) as response:
+            if not response.ok:
+                if response.status == 429:
+                    raise Exception("RugCheck API rate limit exceeded")
+                raise Exception(f"RugCheck API request failed: {response.status}")
+            return await response.json()
 
     @Tool({
         "description": "Get recently detected tokens from RugCheck",
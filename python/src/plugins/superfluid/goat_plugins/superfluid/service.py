@@ -1,5 +1,5 @@
 from goat.decorators.tool import Tool
-from goat_wallets.evm import EVMWalletClient
+from goat_wallets.evm import EVMWalletClient, register_abi
 from .abi import CFA_FORWARDER_ABI, POOL_ABI
 from .parameters import (
     FlowParameters,
@@ -10,6 +10,9 @@ from .parameters import (
     GetTotalFlowRateParameters,
 )
 
+register_abi(CFA_FORWARDER_ABI)
+register_abi(POOL_ABI)
+
 
 class SuperfluidService:
     CFA_FORWARDER_ADDRESS = "0xcfA132E353cB4E398080B9700609bb008eceB125"
@@ -1,8 +1,8 @@
-import aiohttp
 import json
 from typing import Any, Dict, cast
 from eth_typing import HexStr
 from goat.decorators.tool import Tool
+from goat.utils.http_session import get_http_session
 from .parameters import CheckApprovalParameters, GetQuoteParameters
 from goat_wallets.evm import EVMTransaction, EVMTypedData
 from goat_wallets.evm import EVMWalletClient
@@ -28,40 +28,43 @@ class UniswapService:
 
     async def make_request(self, endpoint: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Make a request to the Uniswap API."""
+        # aiohttp is imported on first request, creating the plugin stays cheap
+        import aiohttp
+
         url = f"{self.base_url}/{endpoint}"
         
         headers = {
             "x-api-key": self.api_key
         }
         
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.post(url, json=parameters, headers=headers) as response:
-                    response_text = await response.text()
-                    try:
-                        response_json = json.loads(response_text)
-                    except json.JSONDecodeError:
-                        raise Exception(f"Invalid JSON response from {endpoint}: {response_text}")
+        session = get_http_session(self.base_url)
+        try:
+            async with session.post(url, json=parameters, headers=headers) as response:
+                response_text = await response.text()
+                try:
+                    response_json = json.loads(response_text)
+                except json.JSONDecodeError:
+                    raise Exception(f"Invalid JSON response from {endpoint}: {response_text}")
                     
-                    print(f"\nAPI Response for {endpoint}:")
-                    print(f"Status: {response.status}")
-                    print(f"Headers: {dict(response.headers)}")
-                    print(f"Body: {response_text}")
+                print(f"\nAPI Response for {endpoint}:")
+                print(f"Status: {response.status}")
+                print(f"Headers: {dict(response.headers)}")
+                print(f"Body: {response_text}")
                     
-                    if not response.ok:
-                        error_code = response_json.get("errorCode", "Unknown error")
-                        if error_code == "VALIDATION_ERROR":
-                            raise Exception("Invalid parameters provided to the API")
-                        elif error_code == "INSUFFICIENT_BALANCE":
-                            raise Exception("Insufficient balance for the requested operation")
-                        elif error_code == "RATE_LIMIT":
-                            raise Exception("API rate limit exceeded")
-                        else:
-                            raise Exception(f"API error: {error_code}")
+                if not response.ok:
+                    error_code = response_json.get("errorCode", "Unknown error")
+                    if error_code == "VALIDATION_ERROR":
+                        raise Exception("Invalid parameters provided to the API")
+                    elif error_code == "INSUFFICIENT_BALANCE":
+                        raise Exception("Insufficient balance for the requested operation")
+                    elif error_code == "RATE_LIMIT":
+                        raise Exception("API rate limit exceeded")
+                    else:
+                        raise Exception(f"API error: {error_code}")
                     
-                    return response_json
-            except aiohttp.ClientError as e:
-                raise Exception(f"Network error while accessing {endpoint}: {str(e)}")
+                return response_json
+        except aiohttp.ClientError as e:
+            raise Exception(f"Network error while accessing {endpoint}: {str(e)}")
 
     @Tool({
         "name": "uniswap_check_approval",
@@ -75,7 +78,7 @@ class UniswapService:
                 "token": parameters["token"],
                 "amount": parameters["amount"],
                 "walletAddress": parameters["walletAddress"],
-                "chainId": wallet_client.get_chain()["id"]
+                "chainId": (await wallet_client.aget_chain())["id"]
             })
 
             # If no approval data is returned, the token is already approved
@@ -101,7 +104,7 @@ class UniswapService:
             }
             
             # Send the transaction
-            transaction = wallet_client.send_transaction(transaction_params)
+            transaction = await wallet_client.asend_transaction(transaction_params)
             return {
                 "status": "approved",
                 "txHash": transaction["hash"]
@@ -117,7 +120,7 @@ class UniswapService:
     async def get_quote(self, wallet_client: EVMWalletClient, parameters: dict):
         """Get a quote for token swap."""
         try:
-            chain_id = wallet_client.get_chain()["id"]
+            chain_id = (await wallet_client.aget_chain())["id"]
             
             request_params = {
                 "tokenIn": parameters["tokenIn"],
@@ -191,7 +194,7 @@ class UniswapService:
             })
             
             # Send the transaction
-            transaction = wallet_client.send_transaction(transaction_params)
+            transaction = await wallet_client.asend_transaction(transaction_params)
 
             return {
                 "txHash": transaction["hash"]
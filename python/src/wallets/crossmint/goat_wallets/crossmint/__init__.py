@@ -1,27 +1,87 @@
 """CrossMint wallet implementation for GOAT SDK."""
-from typing import Dict, Any, Union
+import importlib
+import sys
+from types import ModuleType
+from typing import TYPE_CHECKING, Dict, Any, Optional, Tuple, Union
 
-from .api_client import CrossmintWalletsAPI
-from .faucet_plugin import faucet_plugin
-from .mint_plugin import mint_plugin
-from .wallet_plugin import wallets_plugin
-from .custodial_solana_wallet import custodial_factory
-from .evm_smart_wallet import EVMSmartWalletClient
-from .solana_smart_wallet import SolanaSmartWalletClient
-from .evm_smart_wallet import smart_wallet_factory as evm_smart_wallet_factory
-from .solana_smart_wallet_factory import SolanaSmartWalletFactory
+if TYPE_CHECKING:
+    from .api_client import CrossmintWalletsAPI, HttpClientOptions
+    from .waiter import BackoffPolicy, StatusWatcher, WaitTimeoutError
+    from .custodial_solana_wallet import custodial_factory
+    from .evm_smart_wallet import EVMSmartWalletClient
+    from .evm_smart_wallet import smart_wallet_factory as evm_smart_wallet_factory
+    from .faucet_plugin import faucet_plugin
+    from .mint_plugin import mint_plugin
+    from .solana_smart_wallet import SolanaSmartWalletClient
+    from .solana_smart_wallet_factory import SolanaSmartWalletFactory
+    from .wallet_plugin import wallets_plugin
 
+# Exported names and the module and attribute defining them. They are imported on first access
+# (PEP 562), so an EVM-only application never loads the Solana wallets and vice versa.
+_LAZY_IMPORTS: Dict[str, Tuple[str, str]] = {
+    "CrossmintWalletsAPI": (".api_client", "CrossmintWalletsAPI"),
+    "HttpClientOptions": (".api_client", "HttpClientOptions"),
+    "BackoffPolicy": (".waiter", "BackoffPolicy"),
+    "StatusWatcher": (".waiter", "StatusWatcher"),
+    "WaitTimeoutError": (".waiter", "WaitTimeoutError"),
+    "EVMSmartWalletClient": (".evm_smart_wallet", "EVMSmartWalletClient"),
+    "SolanaSmartWalletClient": (".solana_smart_wallet", "SolanaSmartWalletClient"),
+    "custodial_factory": (".custodial_solana_wallet", "custodial_factory"),
+    "evm_smart_wallet_factory": (".evm_smart_wallet", "smart_wallet_factory"),
+    "SolanaSmartWalletFactory": (".solana_smart_wallet_factory", "SolanaSmartWalletFactory"),
+    "faucet_plugin": (".faucet_plugin", "faucet_plugin"),
+    "mint_plugin": (".mint_plugin", "mint_plugin"),
+    "wallets_plugin": (".wallet_plugin", "wallets_plugin"),
+}
 
-def crossmint(api_key: str) -> Dict[str, Any]:
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module, attribute = _LAZY_IMPORTS[name]
+    value = getattr(importlib.import_module(module, __name__), attribute)
+    # Cache on the package so later lookups skip this hook
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted([*globals(), *_LAZY_IMPORTS])
+
+
+class _CrossmintPackage(ModuleType):
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Importing a submodule binds it on the package. `faucet_plugin` and `mint_plugin` share
+        # their module's name, so keep the factory the package exports instead of the module.
+        if isinstance(value, ModuleType) and name in _LAZY_IMPORTS:
+            module, attribute = _LAZY_IMPORTS[name]
+            if value.__name__ == __name__ + module:
+                value = getattr(value, attribute)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _CrossmintPackage
+
+
+def crossmint(api_key: str, http_options: Optional["HttpClientOptions"] = None) -> Dict[str, Any]:
     """Initialize CrossMint SDK with API key.
 
     Args:
         api_key: CrossMint API key
+        http_options: Optional connection pooling and retry settings for the API client
 
     Returns:
         Dict containing CrossMint wallet and plugin factories
     """
-    api_client = CrossmintWalletsAPI(api_key=api_key)
+    from .api_client import CrossmintWalletsAPI
+    from .custodial_solana_wallet import custodial_factory
+    from .evm_smart_wallet import smart_wallet_factory as evm_smart_wallet_factory
+    from .faucet_plugin import faucet_plugin
+    from .mint_plugin import mint_plugin
+    from .solana_smart_wallet_factory import SolanaSmartWalletFactory
+    from .wallet_plugin import wallets_plugin
+
+    api_client = CrossmintWalletsAPI(api_key=api_key, http_options=http_options)
 
     return {
         "custodial": custodial_factory(api_client),
@@ -35,6 +95,17 @@ def crossmint(api_key: str) -> Dict[str, Any]:
 
 __all__ = [
     "crossmint",
+    "CrossmintWalletsAPI",
+    "HttpClientOptions",
+    "BackoffPolicy",
+    "StatusWatcher",
+    "WaitTimeoutError",
     "EVMSmartWalletClient",
     "SolanaSmartWalletClient",
+    "custodial_factory",
+    "evm_smart_wallet_factory",
+    "SolanaSmartWalletFactory",
+    "faucet_plugin",
+    "mint_plugin",
+    "wallets_plugin",
 ]
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional, List, Union, cast
+from typing import Any, Dict, FrozenSet, Optional, List, Tuple, Type, Union, cast
 from goat_wallets.crossmint.types import SupportedToken
 from goat_wallets.crossmint.chains import is_story_chain
 from .parameters import (
@@ -6,24 +6,134 @@ from .parameters import (
     SolanaSmartWalletTransactionParams, DelegatedSignerPermission
 )
 import requests
+from requests.adapters import HTTPAdapter
 import json
+import random
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from urllib.parse import quote
+import asyncio
 import time
+import weakref
 from goat_wallets.evm import EVMTypedData
+from .waiter import BackoffPolicy, StatusWatcher, wait_until
+
+
+@dataclass(frozen=True)
+class HttpClientOptions:
+    """Connection pooling and retry settings for CrossmintWalletsAPI.
+
+    Attributes:
+        pool_connections: Number of host connection pools to keep
+        pool_maxsize: Maximum number of keep-alive connections per host
+        timeout: Default request timeout in seconds
+        max_retries: Maximum number of retries for a failed request
+        backoff_factor: Base delay in seconds for exponential backoff between retries
+        max_backoff: Upper bound in seconds for a single retry delay, including Retry-After
+        retry_statuses: HTTP status codes that are retried
+        retry_methods: HTTP methods that are safe to retry on any retryable failure. Other
+            methods are only retried on 429 responses or when sent with an idempotency key.
+        http2: Use an HTTP/2 capable client (requires `httpx[http2]`)
+    """
+
+    pool_connections: int = 10
+    pool_maxsize: int = 10
+    timeout: float = 30.0
+    max_retries: int = 3
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    retry_methods: FrozenSet[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+    http2: bool = False
 
 
 class CrossmintWalletsAPI:
     """Python implementation of CrossmintWalletsAPI."""
 
-    def __init__(self, api_key: str, base_url: str = "https://staging.crossmint.com"):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://staging.crossmint.com",
+        http_options: Optional[HttpClientOptions] = None,
+        wait_policy: Optional[BackoffPolicy] = None,
+    ):
         """Initialize the Crossmint Wallets API client.
 
         Args:
             api_key: API key for authentication
             base_url: Base URL for the Crossmint API
+            http_options: Connection pooling and retry settings
+            wait_policy: Backoff and deadline settings used when waiting for actions,
+                transactions and signatures
         """
         self.api_key = api_key
         self.base_url = f"{base_url}/api/v1-alpha2"
+        self.http_options = http_options or HttpClientOptions()
+        self.wait_policy = wait_policy or BackoffPolicy()
+        self._session, self._transport_errors = self._create_session(self.http_options)
+        self._watchers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, StatusWatcher]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @staticmethod
+    def _create_session(options: HttpClientOptions) -> Tuple[Any, Tuple[Type[BaseException], ...]]:
+        """Create the pooled HTTP session and the transport errors it raises."""
+        if options.http2:
+            try:
+                import httpx
+            except ImportError as e:
+                raise ImportError(
+                    "httpx is required for HTTP/2 support. "
+                    "Install it with `pip install goat-sdk-wallet-crossmint[http2]`."
+                ) from e
+
+            limits = httpx.Limits(
+                max_connections=options.pool_connections * options.pool_maxsize,
+                max_keepalive_connections=options.pool_maxsize,
+            )
+            return httpx.Client(http2=True, limits=limits), (httpx.TransportError,)
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=options.pool_connections, pool_maxsize=options.pool_maxsize)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session, (requests.ConnectionError, requests.Timeout)
+
+    def close(self) -> None:
+        """Close the pooled HTTP connections."""
+        self._session.close()
+
+    def __enter__(self) -> "CrossmintWalletsAPI":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Compute the delay before a retry, honoring the server's Retry-After header.
+
+        Args:
+            attempt: Zero-based number of the retry about to be made
+            retry_after: Value of the Retry-After response header, if any
+
+        Returns:
+            Delay in seconds
+        """
+        options = self.http_options
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    delay = (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+                except (TypeError, ValueError):
+                    delay = None
+            if delay is not None:
+                return min(max(delay, 0.0), options.max_backoff)
+
+        delay = options.backoff_factor * (2 ** attempt)
+        return min(delay + random.uniform(0, delay / 2), options.max_backoff)
 
     def _request(
         self,
@@ -53,13 +163,38 @@ class CrossmintWalletsAPI:
             **(kwargs.pop("headers", {}))
         }
 
+        options = self.http_options
+        is_idempotent = method.upper() in options.retry_methods or any(
+            key.lower() == "x-idempotency-key" for key in headers
+        )
+
         try:
-            kwargs["timeout"] = timeout if timeout is not None else 30
-            response = requests.request(method, url, headers=headers, **kwargs)
+            kwargs["timeout"] = timeout if timeout is not None else options.timeout
+            attempt = 0
+            while True:
+                try:
+                    response = self._session.request(method, url, headers=headers, **kwargs)
+                except self._transport_errors:
+                    if not is_idempotent or attempt >= options.max_retries:
+                        raise
+                    time.sleep(self._retry_delay(attempt))
+                    attempt += 1
+                    continue
+
+                status = response.status_code
+                should_retry = status in options.retry_statuses and (is_idempotent or status == 429)
+                if not should_retry or attempt >= options.max_retries:
+                    break
+
+                time.sleep(self._retry_delay(attempt, response.headers.get("Retry-After")))
+                response.close()
+                attempt += 1
+
             response_body = response.json()
 
-            if not response.ok:
-                error_message = f"Error {response.status_code}: {response.reason}"
+            if response.status_code >= 400:
+                reason = getattr(response, "reason", None) or getattr(response, "reason_phrase", "")
+                error_message = f"Error {response.status_code}: {reason}"
                 if response_body:
                     error_message += f"\n\n{json.dumps(response_body, indent=2)}"
                 raise Exception(error_message)
@@ -703,86 +838,164 @@ class CrossmintWalletsAPI:
         endpoint = f"/wallets/{quote(wallet_locator)}/signers/{quote(signer_locator)}"
         return self._request(endpoint, method="GET")
 
-    def wait_for_action(self, action_id: str, interval: float = 1.0, max_attempts: int = 60) -> Dict[str, Any]:
+    def _wait_policy(self, interval: Optional[float], max_attempts: Optional[int]) -> BackoffPolicy:
+        policy = self.wait_policy
+        if interval is not None:
+            policy = replace(policy, initial_delay=interval)
+        if max_attempts is not None:
+            policy = replace(policy, max_attempts=max_attempts)
+        return policy
+
+    def wait_for_action(
+        self,
+        action_id: str,
+        interval: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+    ) -> Dict[str, Any]:
         """Wait for an action to complete.
 
         Args:
             action_id: Action ID to wait for
-            interval: Time to wait between attempts in seconds
-            max_attempts: Maximum number of attempts to check status
+            interval: Initial delay between attempts in seconds, defaults to the client's wait policy
+            max_attempts: Maximum number of attempts to check status, defaults to the client's wait policy
 
         Returns:
             Action response when completed
 
         Raises:
-            Exception: If action times out or fails
+            WaitTimeoutError: If the action does not complete in time
         """
-        attempts = 0
-        while attempts < max_attempts:
-            attempts += 1
-            endpoint = f"/actions/{quote(action_id)}"
-            response = self._request(endpoint)
+        return wait_until(
+            lambda: self._request(f"/actions/{quote(action_id)}"),
+            _is_action_done,
+            self._wait_policy(interval, max_attempts),
+            "action",
+        )
 
-            if response.get("status") == "succeeded":
-                return response
+    def wait_for_transaction(
+        self,
+        locator: str,
+        transaction_id: str,
+        interval: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Wait for a transaction to complete.
 
-            time.sleep(interval)
+        Args:
+            locator: Wallet locator string
+            transaction_id: Transaction ID to wait for
+            interval: Initial delay between attempts in seconds, defaults to the client's wait policy
+            max_attempts: Maximum number of attempts to check status, defaults to the client's wait policy
 
-        raise Exception("Timed out waiting for action")
+        Returns:
+            Transaction response when completed or failed
 
-    def wait_for_transaction(self, locator: str, transaction_id: str, interval: float = 1.0, max_attempts: int = 60) -> Dict[str, Any]:
-        """Wait for a transaction to complete.
+        Raises:
+            WaitTimeoutError: If the transaction does not complete in time
+        """
+        return wait_until(
+            lambda: self.check_transaction_status(locator, transaction_id),
+            _is_status_final,
+            self._wait_policy(interval, max_attempts),
+            "transaction",
+        )
+
+    def wait_for_signature(
+        self,
+        locator: str,
+        signature_id: str,
+        interval: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Wait for a signature request to complete.
 
         Args:
             locator: Wallet locator string
-            transaction_id: Transaction ID to wait for
-            interval: Time to wait between attempts in seconds
-            max_attempts: Maximum number of attempts to check status
+            signature_id: Signature ID to wait for
+            interval: Initial delay between attempts in seconds, defaults to the client's wait policy
+            max_attempts: Maximum number of attempts to check status, defaults to the client's wait policy
 
         Returns:
-            Transaction response when completed
+            Signature response when completed or failed
 
         Raises:
-            Exception: If transaction times out or fails
+            WaitTimeoutError: If the signature request does not complete in time
         """
-        attempts = 0
-        while attempts < max_attempts:
-            attempts += 1
-            response = self.check_transaction_status(locator, transaction_id)
+        return wait_until(
+            lambda: self.check_signature_status(signature_id, locator),
+            _is_status_final,
+            self._wait_policy(interval, max_attempts),
+            "signature",
+        )
 
-            if response["status"] in ["success", "completed", "failed"]:
-                return response
+    async def watch_action(self, action_id: str) -> Dict[str, Any]:
+        """Asynchronously wait for an action to complete.
 
-            time.sleep(interval)
+        Args:
+            action_id: Action ID to wait for
 
-        raise Exception("Timed out waiting for transaction")
+        Returns:
+            Action response when completed
 
-    def wait_for_signature(self, locator: str, signature_id: str, interval: float = 1.0, max_attempts: int = 60) -> Dict[str, Any]:
-        """Wait for a signature request to complete.
+        Raises:
+            WaitTimeoutError: If the action does not complete in time
+        """
+        return await self._watcher("action").wait(action_id)
+
+    async def watch_transaction(self, locator: str, transaction_id: str) -> Dict[str, Any]:
+        """Asynchronously wait for a transaction to complete.
+
+        All transactions watched on the same event loop are tracked by one task that polls
+        them together, so many in-flight transactions can be awaited concurrently.
 
         Args:
             locator: Wallet locator string
-            signature_id: Signature ID to wait for
-            interval: Time to wait between attempts in seconds
-            max_attempts: Maximum number of attempts to check status
+            transaction_id: Transaction ID to wait for
 
         Returns:
-            Signature response when completed
+            Transaction response when completed or failed
 
         Raises:
-            Exception: If signature request times out or fails
+            WaitTimeoutError: If the transaction does not complete in time
         """
-        attempts = 0
-        while attempts < max_attempts:
-            attempts += 1
-            response = self.check_signature_status(signature_id, locator)
+        return await self._watcher("transaction").wait((locator, transaction_id))
 
-            if response["status"] in ["success", "completed", "failed"]:
-                return response
+    async def watch_signature(self, locator: str, signature_id: str) -> Dict[str, Any]:
+        """Asynchronously wait for a signature request to complete.
+
+        Args:
+            locator: Wallet locator string
+            signature_id: Signature ID to wait for
 
-            time.sleep(interval)
+        Returns:
+            Signature response when completed or failed
 
-        raise Exception("Timed out waiting for signature")
+        Raises:
+            WaitTimeoutError: If the signature request does not complete in time
+        """
+        return await self._watcher("signature").wait((locator, signature_id))
+
+    def _watcher(self, kind: str) -> StatusWatcher:
+        watchers = self._watchers.setdefault(asyncio.get_running_loop(), {})
+        watcher = watchers.get(kind)
+        if watcher is None:
+            if kind == "action":
+                watcher = StatusWatcher(
+                    lambda action_id: self._request(f"/actions/{quote(action_id)}"),
+                    _is_action_done, self.wait_policy, description=kind,
+                )
+            elif kind == "transaction":
+                watcher = StatusWatcher(
+                    lambda key: self.check_transaction_status(*key),
+                    _is_status_final, self.wait_policy, description=kind,
+                )
+            else:
+                watcher = StatusWatcher(
+                    lambda key: self.check_signature_status(key[1], key[0]),
+                    _is_status_final, self.wait_policy, description=kind,
+                )
+            watchers[kind] = watcher
+        return watcher
 
     def create_wallet(self, wallet_type: str, linked_user: Optional[str] = None, config: Optional[Dict[str, Any]] = None, idempotency_key: Optional[str] = None) -> Dict[str, Any]:
         """Create a new wallet.
@@ -836,3 +1049,11 @@ class CrossmintWalletsAPI:
             wallet_type=f"{chain}-mpc-wallet",
             linked_user=f"userId:{user_id}"
         )
+
+
+def _is_action_done(response: Dict[str, Any]) -> bool:
+    return response.get("status") == "succeeded"
+
+
+def _is_status_final(response: Dict[str, Any]) -> bool:
+    return response["status"] in ("success", "completed", "failed")
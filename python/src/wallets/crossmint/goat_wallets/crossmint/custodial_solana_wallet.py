@@ -1,4 +1,3 @@
-import time
 from typing import Dict, Optional
 import base58
 from solders.instruction import Instruction
@@ -71,22 +70,13 @@ class CustodialSolanaWalletClient(SolanaWalletClient):
                 message
             )
             
-            while True:
-                status = self._client.check_signature_status(
-                    response["id"],
-                    self._address
-                )
-                
-                if status["status"] == "success":
-                    if not status.get("outputSignature"):
-                        raise ValueError("Signature is undefined")
-                    return Signature(signature=status["outputSignature"])
-                
-                if status["status"] == "failed":
-                    raise ValueError("Signature failed")
-                
-                time.sleep(3)  # Wait 3 seconds before checking again
-                
+            status = self._client.wait_for_signature(self._address, response["id"])
+            if status["status"] == "failed":
+                raise ValueError("Signature failed")
+            if not status.get("outputSignature"):
+                raise ValueError("Signature is undefined")
+            return Signature(signature=status["outputSignature"])
+
         except Exception as e:
             raise ValueError(f"Failed to sign message: {e}")
     
@@ -137,25 +127,18 @@ class CustodialSolanaWalletClient(SolanaWalletClient):
         
         # Wait for completion
         print(f"\nTransaction submitted with ID: {response['id']}")
-        while True:
-            status = self._client.check_transaction_status(
-                self._locator,
-                response["id"]
+        status = self._client.wait_for_transaction(self._locator, response["id"])
+        print(f"\nTransaction status: {status}")
+
+        if status["status"] == "failed":
+            raise ValueError(
+                f"Transaction failed: {status.get('onChain', {}).get('txId')}, details: {status}"
             )
-            print(f"\nTransaction status: {status}")
-            
-            if status["status"] == "success":
-                return {
-                    "status": "success",
-                    "hash": status.get("onChain", {}).get("txId", "")
-                }
-            
-            if status["status"] == "failed":
-                raise ValueError(
-                    f"Transaction failed: {status.get('onChain', {}).get('txId')}, details: {status}"
-                )
-            
-            time.sleep(3)
+
+        return {
+            "status": "success",
+            "hash": status.get("onChain", {}).get("txId", "")
+        }
     
     def balance_of(self, address: str, token_address: Optional[str] = None) -> Balance:
         """Get the SOL balance of an address.
@@ -191,24 +174,16 @@ class CustodialSolanaWalletClient(SolanaWalletClient):
             transaction
         )
         
-        while True:
-            status = self._client.check_transaction_status(
-                self._locator,
-                response["id"]
+        status = self._client.wait_for_transaction(self._locator, response["id"])
+        if status["status"] == "failed":
+            raise ValueError(
+                f"Transaction failed: {status.get('onChain', {}).get('txId')}"
             )
-            
-            if status["status"] == "success":
-                return {
-                    "status": "success",
-                    "hash": status.get("onChain", {}).get("txId", "")
-                }
-            
-            if status["status"] == "failed":
-                raise ValueError(
-                    f"Transaction failed: {status.get('onChain', {}).get('txId')}"
-                )
-            
-            time.sleep(3)
+
+        return {
+            "status": "success",
+            "hash": status.get("onChain", {}).get("txId", "")
+        }
 
 
 def custodial_factory(api_client: CrossmintWalletsAPI):
@@ -1,10 +1,11 @@
-import time
+import threading
 from typing import Any, Dict, List, Optional, TypedDict, Union, cast, NewType
 from goat.classes.wallet_client_base import Balance, Signature
 from goat.types.chain import EvmChain, NativeCurrency
 from goat_wallets.evm.types import EVMTypedData
-from goat_wallets.crossmint.solana_smart_wallet import LinkedUser
-from goat_wallets.evm import EVMWalletClient, EVMTransaction, EVMReadRequest, EVMReadResult
+from goat_wallets.crossmint.types import LinkedUser
+from goat_wallets.evm import ContractCache, EVMWalletClient, EVMTransaction, EVMReadRequest, EVMReadResult, parse_abi
+from goat_wallets.evm.multicall import encode_function_call
 from web3.main import Web3
 from web3.providers.rpc import HTTPProvider
 from eth_typing import ChecksumAddress
@@ -34,6 +35,20 @@ Signer = Union[CustodialSigner, KeyPairSigner]
 # Use sync Web3 for encoding and address utilities
 w3_sync = Web3()
 
+# ENS providers by URL, shared by every wallet resolving names through the same endpoint
+_ens_providers: Dict[str, ENS] = {}
+_ens_providers_lock = threading.Lock()
+
+
+def get_ens_provider(url: str) -> ENS:
+    """Returns the ENS provider for an RPC URL, creating it on first use."""
+    with _ens_providers_lock:
+        ens = _ens_providers.get(url)
+        if ens is None:
+            ens = ENS.from_web3(Web3(HTTPProvider(url)))
+            _ens_providers[url] = ens
+        return ens
+
 def build_transaction_data(
     recipient_address: str,
     abi: Optional[List] = None,
@@ -51,16 +66,16 @@ def build_transaction_data(
     if not function_name:
         raise ValueError("Function name is required when ABI is provided")
     
-    contract = w3_sync.eth.contract(
-        address=w3_sync.to_checksum_address(recipient_address),
-        abi=abi
-    )
-    data = contract.get_function_by_name(function_name)(*args or []).build_transaction()['data']
+    # Validates the recipient the way building a contract object did
+    w3_sync.to_checksum_address(recipient_address)
+    # Selectors and argument types are computed once per ABI, only the arguments are encoded per call
+    function = parse_abi(abi).function(function_name, len(args or []))
+    data = encode_function_call(function, args or [])
     
     return Call(
         to=recipient_address,
         value=str(value or 0),
-        data=data.hex()
+        data="0x" + data.hex()
     )
 
 
@@ -95,11 +110,9 @@ class EVMSmartWalletClient(EVMWalletClient, BaseWalletClient):
         self._signer = signer
         
         self._w3 = Web3(HTTPProvider(provider_url))
-        if ens_provider_url:
-            ens_w3 = Web3(HTTPProvider(ens_provider_url))
-            self._ens = ENS.from_web3(ens_w3)
-        else:
-            self._ens = None
+        self._contracts = ContractCache(lambda address, abi: self._w3.eth.contract(address=address, abi=abi))
+        self._ens_provider_url = ens_provider_url
+        self._ens = get_ens_provider(ens_provider_url) if ens_provider_url else None
         
         self._locator = get_evm_locator(address)
     
@@ -128,7 +141,7 @@ class EVMSmartWalletClient(EVMWalletClient, BaseWalletClient):
         """Get chain information."""
         return EvmChain(
             type="evm",
-            id=self._w3.eth.chain_id,
+            id=self.get_chain_id(),
             nativeCurrency=NativeCurrency(
                 name="Ether",
                 symbol="ETH",
@@ -138,7 +151,7 @@ class EVMSmartWalletClient(EVMWalletClient, BaseWalletClient):
     
     def get_chain_id(self) -> int:
         """Get chain ID."""
-        return self._w3.eth.chain_id
+        return self._get_cached_chain_id(lambda: self._w3.eth.chain_id)
     
     def get_native_balance(self) -> int:
         """Get native balance of this wallet in base units."""
@@ -154,12 +167,38 @@ class EVMSmartWalletClient(EVMWalletClient, BaseWalletClient):
                 raise ValueError("ENS provider is not configured")
             
             try:
-                resolved = self._ens.address(address)
+                resolved = self.ens_cache.resolve(f"ens:{self._ens_provider_url}", address, self._ens.address)
                 if not resolved:
                     raise ValueError("ENS name could not be resolved")
                 return w3_sync.to_checksum_address(resolved)
             except Exception as e:
                 raise ValueError(f"Failed to resolve ENS name: {e}")
+
+    def resolve_many(self, addresses: List[str]) -> List[str]:
+        """Resolve many addresses or ENS names, looking up the uncached names concurrently."""
+        names = [address for address in addresses if not w3_sync.is_address(address)]
+        if names and not self._ens:
+            raise ValueError("ENS provider is not configured")
+
+        try:
+            resolved = (
+                self.ens_cache.resolve_many(f"ens:{self._ens_provider_url}", names, self._ens.address)
+                if names and self._ens
+                else []
+            )
+        except Exception as e:
+            raise ValueError(f"Failed to resolve ENS name: {e}")
+
+        by_name = dict(zip(names, resolved))
+        result = []
+        for address in addresses:
+            if w3_sync.is_address(address):
+                result.append(w3_sync.to_checksum_address(address))
+                continue
+            if not by_name[address]:
+                raise ValueError(f"Failed to resolve ENS name: {address} could not be resolved")
+            result.append(w3_sync.to_checksum_address(by_name[address]))
+        return result
     
     def sign_message(self, message: str) -> Signature:
         """Sign a message with the wallet's private key.
@@ -213,21 +252,12 @@ class EVMSmartWalletClient(EVMWalletClient, BaseWalletClient):
                 signature
             )
         
-        while True:
-            status = self._client.check_signature_status(
-                signature_id,
-                self._address
-            )
-            
-            if status["status"] == "success":
-                if not status.get("outputSignature"):
-                    raise ValueError("Signature is undefined")
-                return {"signature": status["outputSignature"]}
-            
-            if status["status"] == "failed":
-                raise ValueError("Signature failed")
-            
-            time.sleep(2)
+        status = self._client.wait_for_signature(self._address, signature_id)
+        if status["status"] == "failed":
+            raise ValueError("Signature failed")
+        if not status.get("outputSignature"):
+            raise ValueError("Signature is undefined")
+        return {"signature": status["outputSignature"]}
     
     def sign_typed_data(self, types: Dict[str, Any], primary_type: str, domain: Dict[str, Any], value: Dict[str, Any]) -> Signature:
         """Sign typed data."""
@@ -265,21 +295,12 @@ class EVMSmartWalletClient(EVMWalletClient, BaseWalletClient):
                 signature
             )
         
-        while True:
-            status = self._client.check_signature_status(
-                response["id"],
-                self._address
-            )
-            
-            if status["status"] == "success":
-                if not status.get("outputSignature"):
-                    raise ValueError("Signature is undefined")
-                return {"signature": status["outputSignature"]}
-            
-            if status["status"] == "failed":
-                raise ValueError("Signature failed")
-            
-            time.sleep(2)
+        status = self._client.wait_for_signature(self._address, response["id"])
+        if status["status"] == "failed":
+            raise ValueError("Signature failed")
+        if not status.get("outputSignature"):
+            raise ValueError("Signature is undefined")
+        return {"signature": status["outputSignature"]}
     
     def send_transaction(self, transaction: EVMTransaction) -> Dict[str, str]:
         """Send a single transaction."""
@@ -311,14 +332,15 @@ class EVMSmartWalletClient(EVMWalletClient, BaseWalletClient):
         if not abi:
             raise ValueError("Read request must include ABI for EVM")
 
-        contract = self._w3.eth.contract(
-            address=self.resolve_address(address),
-            abi=abi
-        )
+        contract = self._contracts.get(self.resolve_address(address), abi)
 
         result = contract.get_function_by_name(function_name)(*args).call()
         
         return {"value": result}
+
+    def get_code(self, address: str) -> bytes:
+        """Get the code deployed at an address, empty if there is none."""
+        return bytes(self._w3.eth.get_code(self.resolve_address(address)))
     
     def balance_of(self, address: str, token_address: Optional[str] = None) -> Balance:
         """Get ETH balance of an address."""
@@ -381,19 +403,11 @@ class EVMSmartWalletClient(EVMWalletClient, BaseWalletClient):
                 }]
             )
         
-        while True:
-            status = self._client.check_transaction_status(
-                self._locator,
-                response["id"]
-            )
-            
-            if status["status"] in ["success", "failed"]:
-                return {
-                    "hash": status.get("onChain", {}).get("txId", ""),
-                    "status": status["status"]
-                }
-            
-            time.sleep(2)
+        status = self._client.wait_for_transaction(self._locator, response["id"])
+        return {
+            "hash": status.get("onChain", {}).get("txId", ""),
+            "status": status["status"]
+        }
 
 
 def get_evm_locator(address: Optional[str] = None, linked_user: Optional[LinkedUser] = None) -> str:
@@ -1,4 +1,3 @@
-from time import sleep
 from typing import Dict, List, Optional, Any, TypedDict, Union
 import base58
 import base64
@@ -14,6 +13,7 @@ from goat.classes.wallet_client_base import Signature
 from goat_wallets.solana import SolanaWalletClient, SolanaTransaction
 from .api_client import CrossmintWalletsAPI
 from .parameters import SolanaSmartWalletTransactionParams
+from .waiter import wait_until
 from .base_wallet import BaseWalletClient, get_locator
 from .types import LinkedUser, SolanaFireblocksSigner, SolanaKeypairSigner, SupportedToken, UnsupportedOperationException
 from goat.classes.wallet_client_base import Balance
@@ -214,24 +214,21 @@ class SolanaSmartWalletClient(SolanaWalletClient, BaseWalletClient):
                 )
 
         # Wait for transaction success
-        while status["status"] != "success":
-            status = self._client.check_transaction_status(
-                self._locator,
-                transaction_id
+        if status["status"] != "success":
+            status = wait_until(
+                lambda: self._client.check_transaction_status(self._locator, transaction_id),
+                lambda current: current["status"] in ("success", "failed", "awaiting-approval"),
+                self._client.wait_policy,
+                f"transaction {transaction_id}",
             )
 
-            if status["status"] == "failed":
-                error = status.get("error", {})
-                raise ValueError(f"{error_prefix} failed: {error}")
-
-            if status["status"] == "awaiting-approval":
-                raise ValueError(
-                    f"{error_prefix} still awaiting approval after submission")
-
-            if status["status"] == "success":
-                break
+        if status["status"] == "failed":
+            error = status.get("error", {})
+            raise ValueError(f"{error_prefix} failed: {error}")
 
-            sleep(1)
+        if status["status"] == "awaiting-approval":
+            raise ValueError(
+                f"{error_prefix} still awaiting approval after submission")
 
         return status
 
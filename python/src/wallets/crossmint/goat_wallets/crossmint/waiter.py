@@ -0,0 +1,276 @@
+import asyncio
+import inspect
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, Iterator, Optional, TypeVar, Union
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+
+class WaitTimeoutError(TimeoutError):
+    """Raised when a polled operation does not reach a terminal state before its deadline."""
+
+
+@dataclass(frozen=True)
+class BackoffPolicy:
+    """Exponential backoff with jitter for polling Crossmint status endpoints.
+
+    Attributes:
+        initial_delay: Delay in seconds before the second poll
+        max_delay: Upper bound in seconds for a single delay
+        multiplier: Factor applied to the delay after every poll
+        jitter: Fraction of each delay that is randomized, between 0 and 1
+        timeout: Seconds after the first poll before giving up, None to wait indefinitely
+        max_attempts: Maximum number of polls, None for no limit
+    """
+
+    initial_delay: float = 0.5
+    max_delay: float = 5.0
+    multiplier: float = 2.0
+    jitter: float = 0.2
+    timeout: Optional[float] = 300.0
+    max_attempts: Optional[int] = None
+
+    def delays(self) -> Iterator[float]:
+        """Yields the jittered delays to sleep between consecutive polls."""
+        delay = self.initial_delay
+        while True:
+            spread = delay * self.jitter
+            yield max(0.0, delay + random.uniform(-spread, spread))
+            delay = min(delay * self.multiplier, self.max_delay)
+
+    def deadline(self, start: float) -> Optional[float]:
+        """Returns the monotonic deadline for a wait started at `start`."""
+        return None if self.timeout is None else start + self.timeout
+
+
+DEFAULT_BACKOFF_POLICY = BackoffPolicy()
+
+
+def wait_until(
+    poll: Callable[[], T],
+    is_done: Callable[[T], bool],
+    policy: Optional[BackoffPolicy] = None,
+    description: str = "operation",
+) -> T:
+    """Polls until a result reaches a terminal state, backing off between polls.
+
+    Args:
+        poll: Fetches the current state
+        is_done: Returns True once the state is terminal
+        policy: Backoff and deadline settings
+        description: Name of the awaited operation used in the timeout message
+
+    Returns:
+        The first terminal state returned by `poll`
+
+    Raises:
+        WaitTimeoutError: If the deadline or maximum number of attempts is reached first
+    """
+    policy = policy or DEFAULT_BACKOFF_POLICY
+    deadline = policy.deadline(time.monotonic())
+    delays = policy.delays()
+    attempts = 0
+
+    while True:
+        result = poll()
+        attempts += 1
+        if is_done(result):
+            return result
+
+        delay = next(delays)
+        if _exhausted(policy, attempts, deadline, delay):
+            raise WaitTimeoutError(f"Timed out waiting for {description}")
+        time.sleep(delay)
+
+
+async def async_wait_until(
+    poll: Callable[[], Union[T, Awaitable[T]]],
+    is_done: Callable[[T], bool],
+    policy: Optional[BackoffPolicy] = None,
+    description: str = "operation",
+) -> T:
+    """Async variant of `wait_until`. Synchronous `poll` functions run in a worker thread.
+
+    Args:
+        poll: Fetches the current state
+        is_done: Returns True once the state is terminal
+        policy: Backoff and deadline settings
+        description: Name of the awaited operation used in the timeout message
+
+    Returns:
+        The first terminal state returned by `poll`
+
+    Raises:
+        WaitTimeoutError: If the deadline or maximum number of attempts is reached first
+    """
+    policy = policy or DEFAULT_BACKOFF_POLICY
+    deadline = policy.deadline(time.monotonic())
+    delays = policy.delays()
+    attempts = 0
+
+    while True:
+        result = await _call(poll)
+        attempts += 1
+        if is_done(result):
+            return result
+
+        delay = next(delays)
+        if _exhausted(policy, attempts, deadline, delay):
+            raise WaitTimeoutError(f"Timed out waiting for {description}")
+        await asyncio.sleep(delay)
+
+
+@dataclass
+class _PendingStatus(Generic[T]):
+    future: "asyncio.Future[T]"
+    delays: Iterator[float]
+    deadline: Optional[float]
+    next_poll: float
+    attempts: int = 0
+    description: str = field(default="operation")
+
+
+class StatusWatcher(Generic[K, T]):
+    """Tracks many pending operations from a single task on the running event loop.
+
+    Callers await `wait(key)`. Concurrent waits for the same key share one set of polls,
+    all due keys are polled together in rounds with a bounded number of requests in flight,
+    and every key backs off independently, so hundreds of in-flight transactions cost one
+    task and a handful of worker threads rather than a blocked thread each.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[K], Union[T, Awaitable[T]]],
+        is_done: Callable[[T], bool],
+        policy: Optional[BackoffPolicy] = None,
+        max_concurrency: int = 8,
+        description: str = "operation",
+    ):
+        """Creates a new watcher bound to the event loop it is first used on.
+
+        Args:
+            fetch: Fetches the current state for a key. Synchronous functions run in a worker thread.
+            is_done: Returns True once a state is terminal
+            policy: Backoff and deadline settings applied to each key
+            max_concurrency: Maximum number of status requests in flight at once
+            description: Name of the awaited operations used in timeout messages
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self._fetch = fetch
+        self._is_done = is_done
+        self.policy = policy or DEFAULT_BACKOFF_POLICY
+        self.description = description
+        self._max_concurrency = max_concurrency
+        self._pending: Dict[K, _PendingStatus[T]] = {}
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def pending(self) -> int:
+        """Number of keys currently being tracked."""
+        return len(self._pending)
+
+    async def wait(self, key: K) -> T:
+        """Waits until the operation identified by `key` reaches a terminal state.
+
+        Args:
+            key: Identifier passed to `fetch`
+
+        Returns:
+            The terminal state
+
+        Raises:
+            WaitTimeoutError: If the key's deadline or maximum number of attempts is reached first
+        """
+        loop = asyncio.get_running_loop()
+        entry = self._pending.get(key)
+        if entry is None:
+            now = time.monotonic()
+            entry = _PendingStatus(
+                future=loop.create_future(),
+                delays=self.policy.delays(),
+                deadline=self.policy.deadline(now),
+                next_poll=now,
+                description=f"{self.description} {key}",
+            )
+            self._pending[key] = entry
+            self._ensure_running()
+
+        # Shield the shared future so one cancelled waiter does not cancel it for the others
+        return await asyncio.shield(entry.future)
+
+    def _ensure_running(self) -> None:
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        self._wakeup.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        assert self._wakeup is not None
+        while self._pending:
+            now = time.monotonic()
+            due = [key for key, entry in self._pending.items() if entry.next_poll <= now]
+            if due:
+                await asyncio.gather(*(self._poll(key) for key in due))
+                continue
+
+            self._wakeup.clear()
+            next_poll = min(entry.next_poll for entry in self._pending.values())
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=max(0.0, next_poll - time.monotonic()))
+            except asyncio.TimeoutError:
+                pass
+
+    async def _poll(self, key: K) -> None:
+        entry = self._pending[key]
+        assert self._semaphore is not None
+        try:
+            async with self._semaphore:
+                result = await _call(self._fetch, key)
+        except Exception as e:
+            self._resolve(key, exception=e)
+            return
+
+        entry.attempts += 1
+        if self._is_done(result):
+            self._resolve(key, result=result)
+            return
+
+        delay = next(entry.delays)
+        if _exhausted(self.policy, entry.attempts, entry.deadline, delay):
+            self._resolve(key, exception=WaitTimeoutError(f"Timed out waiting for {entry.description}"))
+            return
+        entry.next_poll = time.monotonic() + delay
+
+    def _resolve(self, key: K, result: Any = None, exception: Optional[BaseException] = None) -> None:
+        entry = self._pending.pop(key)
+        if entry.future.done():
+            return
+        if exception is not None:
+            entry.future.set_exception(exception)
+        else:
+            entry.future.set_result(result)
+
+
+def _exhausted(policy: BackoffPolicy, attempts: int, deadline: Optional[float], delay: float) -> bool:
+    if policy.max_attempts is not None and attempts >= policy.max_attempts:
+        return True
+    return deadline is not None and time.monotonic() + delay > deadline
+
+
+async def _call(fn: Callable[..., Any], *args: Any) -> Any:
+    if inspect.iscoroutinefunction(fn):
+        return await fn(*args)
+    result = await asyncio.to_thread(fn, *args)
+    if inspect.isawaitable(result):
+        return await result
+    return result
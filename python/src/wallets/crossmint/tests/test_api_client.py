@@ -2,7 +2,7 @@ import pytest
 import os
 import requests
 from urllib.parse import quote
-from goat_wallets.crossmint import CrossmintWalletsAPI
+from goat_wallets.crossmint import CrossmintWalletsAPI, HttpClientOptions
 
 
 def test_authentication_headers(custodial_api, test_email):
@@ -128,3 +128,98 @@ def test_request_timeout_handling(custodial_api, test_email):
         )
     error_msg = str(exc.value).lower()
     assert any(msg in error_msg for msg in ["timeout", "timed out", "unreachable"])
+
+
+class _FakeResponse:
+    def __init__(self, status_code, body=None, headers=None):
+        self.status_code = status_code
+        self.reason = "Too Many Requests" if status_code == 429 else "Error" if status_code >= 400 else "OK"
+        self.headers = headers or {}
+        self._body = body if body is not None else {}
+        self.closed = False
+
+    def json(self):
+        return self._body
+
+    def close(self):
+        self.closed = True
+
+
+class _FakeSession:
+    """Stand-in for the pooled session that returns queued responses in order."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def request(self, method, url, headers=None, **kwargs):
+        self.requests.append((method, url))
+        return self.responses.pop(0)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def mocked_api(monkeypatch):
+    """CrossmintWalletsAPI with a fake session, recording retry delays instead of sleeping."""
+    delays = []
+    monkeypatch.setattr("goat_wallets.crossmint.api_client.time.sleep", delays.append)
+    api = CrossmintWalletsAPI(
+        api_key="test-key",
+        http_options=HttpClientOptions(max_retries=2, backoff_factor=0.5, max_backoff=10.0),
+    )
+
+    def with_responses(*responses):
+        api._session = _FakeSession(responses)
+        return api
+
+    return with_responses, delays
+
+
+def test_retries_then_succeeds(mocked_api):
+    """Test retryable statuses are retried until the request succeeds."""
+    with_responses, delays = mocked_api
+    failed = _FakeResponse(503)
+    api = with_responses(failed, _FakeResponse(200, {"address": "0x1"}))
+
+    assert api._request("/wallets/me") == {"address": "0x1"}
+    assert len(api._session.requests) == 2
+    assert len(delays) == 1 and 0.5 <= delays[0] <= 0.75
+    assert failed.closed
+
+
+def test_honours_retry_after(mocked_api):
+    """Test the Retry-After header sets the delay and is capped by max_backoff."""
+    with_responses, delays = mocked_api
+    api = with_responses(
+        _FakeResponse(429, headers={"Retry-After": "3"}),
+        _FakeResponse(429, headers={"Retry-After": "120"}),
+        _FakeResponse(200, {"id": "tx"}),
+    )
+
+    # 429 responses are retried even for POST requests without an idempotency key
+    assert api._request("/wallets/me/transactions", method="POST", json={}) == {"id": "tx"}
+    assert delays == [3.0, 10.0]
+
+
+def test_gives_up_after_max_retries(mocked_api):
+    """Test the last error response is raised once max_retries is exhausted."""
+    with_responses, delays = mocked_api
+    api = with_responses(*[_FakeResponse(500, {"message": "boom"}) for _ in range(3)], _FakeResponse(200))
+
+    with pytest.raises(Exception, match="Failed to get /wallets/me: Error 500"):
+        api._request("/wallets/me")
+    assert len(api._session.requests) == 3
+    assert len(delays) == 2
+
+
+def test_does_not_retry_non_idempotent_server_errors(mocked_api):
+    """Test POST requests without an idempotency key are not retried on 5xx responses."""
+    with_responses, delays = mocked_api
+    api = with_responses(_FakeResponse(502), _FakeResponse(200))
+
+    with pytest.raises(Exception, match="Error 502"):
+        api._request("/wallets", method="POST", json={})
+    assert len(api._session.requests) == 1
+    assert delays == []
@@ -0,0 +1,63 @@
+import importlib
+import os
+import subprocess
+import sys
+import textwrap
+from types import ModuleType
+
+import pytest
+
+import goat_wallets.crossmint as crossmint_package
+
+FACTORIES = {
+    "custodial_factory": ("goat_wallets.crossmint.custodial_solana_wallet", "custodial_factory"),
+    "evm_smart_wallet_factory": ("goat_wallets.crossmint.evm_smart_wallet", "smart_wallet_factory"),
+    "SolanaSmartWalletFactory": ("goat_wallets.crossmint.solana_smart_wallet_factory", "SolanaSmartWalletFactory"),
+    "faucet_plugin": ("goat_wallets.crossmint.faucet_plugin", "faucet_plugin"),
+    "mint_plugin": ("goat_wallets.crossmint.mint_plugin", "mint_plugin"),
+    "wallets_plugin": ("goat_wallets.crossmint.wallet_plugin", "wallets_plugin"),
+}
+
+
+@pytest.mark.parametrize("name", sorted(FACTORIES))
+def test_factories_are_exported(name):
+    """Test the factories exported by the package before lazy loading are still importable from it."""
+    module, attribute = FACTORIES[name]
+    value = getattr(crossmint_package, name)
+
+    assert not isinstance(value, ModuleType)
+    assert value is getattr(importlib.import_module(module), attribute)
+    assert name in crossmint_package.__all__
+    assert name in dir(crossmint_package)
+
+
+def test_submodule_import_does_not_hide_factory():
+    """Test importing a submodule named like its factory keeps the factory on the package."""
+    from goat_wallets.crossmint import crossmint, faucet_plugin, mint_plugin
+
+    crossmint("sk_staging_test")
+
+    assert callable(faucet_plugin) and not isinstance(faucet_plugin, ModuleType)
+    assert crossmint_package.faucet_plugin is faucet_plugin
+    assert crossmint_package.mint_plugin is mint_plugin
+
+
+def test_unknown_attribute_raises():
+    """Test names that are not exported raise AttributeError."""
+    with pytest.raises(AttributeError):
+        crossmint_package.does_not_exist
+
+
+def test_evm_factory_does_not_load_solana_wallets():
+    """Test the package and its EVM factory can be used without importing the Solana wallets."""
+    code = textwrap.dedent(
+        """
+        import sys
+        from goat_wallets.crossmint import evm_smart_wallet_factory
+        assert evm_smart_wallet_factory.__name__ == "smart_wallet_factory"
+        loaded = [name for name in sys.modules if name.startswith(("goat_wallets.solana", "goat_wallets.crossmint.solana"))]
+        assert not loaded, loaded
+        """
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)
@@ -0,0 +1,88 @@
+import asyncio
+import pytest
+from goat_wallets.crossmint.waiter import BackoffPolicy, StatusWatcher, WaitTimeoutError, async_wait_until, wait_until
+
+
+FAST_POLICY = BackoffPolicy(initial_delay=0.01, max_delay=0.02, timeout=1.0)
+
+
+def test_backoff_delays_grow_and_are_capped():
+    """Test delays grow exponentially up to max_delay."""
+    policy = BackoffPolicy(initial_delay=1.0, max_delay=4.0, multiplier=2.0, jitter=0.0)
+    delays = policy.delays()
+    assert [next(delays) for _ in range(5)] == [1.0, 2.0, 4.0, 4.0, 4.0]
+
+
+def test_backoff_delays_are_jittered():
+    """Test jittered delays stay within the configured spread."""
+    policy = BackoffPolicy(initial_delay=1.0, max_delay=1.0, jitter=0.5)
+    delays = policy.delays()
+    assert all(0.5 <= next(delays) <= 1.5 for _ in range(100))
+
+
+def test_wait_until_returns_terminal_state():
+    """Test polling stops at the first terminal state."""
+    states = iter(["pending", "pending", "success", "unreachable"])
+    assert wait_until(lambda: next(states), lambda s: s == "success", FAST_POLICY) == "success"
+
+
+def test_wait_until_honors_max_attempts():
+    """Test polling gives up after max_attempts."""
+    calls = []
+    policy = BackoffPolicy(initial_delay=0.0, max_attempts=3)
+    with pytest.raises(WaitTimeoutError, match="transaction"):
+        wait_until(lambda: calls.append(1), lambda _: False, policy, "transaction")
+    assert len(calls) == 3
+
+
+def test_wait_until_honors_deadline():
+    """Test polling gives up once the deadline would be exceeded."""
+    policy = BackoffPolicy(initial_delay=0.05, max_delay=0.05, timeout=0.12)
+    with pytest.raises(WaitTimeoutError):
+        wait_until(lambda: None, lambda _: False, policy)
+
+
+@pytest.mark.asyncio
+async def test_async_wait_until_runs_sync_poll_in_thread():
+    """Test the async variant accepts synchronous poll functions."""
+    states = iter(["pending", "completed"])
+    assert await async_wait_until(lambda: next(states), lambda s: s == "completed", FAST_POLICY) == "completed"
+
+
+@pytest.mark.asyncio
+async def test_status_watcher_tracks_many_keys():
+    """Test one watcher resolves many keys and deduplicates concurrent waits."""
+    polls = {}
+
+    async def fetch(key):
+        polls[key] = polls.get(key, 0) + 1
+        return "success" if polls[key] >= 3 else "pending"
+
+    watcher = StatusWatcher(fetch, lambda s: s == "success", FAST_POLICY)
+    keys = [f"tx-{i}" for i in range(200)]
+    results = await asyncio.gather(*(watcher.wait(key) for key in keys + keys))
+
+    assert results == ["success"] * 400
+    assert all(count == 3 for count in polls.values())
+    assert watcher.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_status_watcher_propagates_errors_and_timeouts():
+    """Test fetch errors and deadlines fail only the affected key."""
+
+    def fetch(key):
+        if key == "broken":
+            raise ValueError("boom")
+        return "success" if key == "done" else "pending"
+
+    policy = BackoffPolicy(initial_delay=0.01, max_delay=0.01, max_attempts=3)
+    watcher = StatusWatcher(fetch, lambda s: s == "success", policy, description="transaction")
+    done, broken, stuck = await asyncio.gather(
+        watcher.wait("done"), watcher.wait("broken"), watcher.wait("stuck"), return_exceptions=True
+    )
+
+    assert done == "success"
+    assert isinstance(broken, ValueError)
+    assert isinstance(stuck, WaitTimeoutError)
+    assert "transaction stuck" in str(stuck)
@@ -4,8 +4,11 @@ from .types import (
 )
 from .evm_wallet_client import EVMWalletClient
 from .evm_smart_wallet_client import EVMSmartWalletClient
-from .tokens import USDC, PEPE, PREDEFINED_TOKENS, Token
-from .abi import ERC20_ABI
+from .tokens import USDC, PEPE, PREDEFINED_TOKENS, PREDEFINED_TOKEN_REGISTRY, Token, TokenRegistry
+from .abi import ERC20_ABI, MULTICALL3_ABI, MULTICALL3_ADDRESS
+from .abi_cache import ContractCache, ParsedAbi, abi_fingerprint, parse_abi, register_abi
+from .nonce_manager import NonceManager, is_nonce_conflict
+from .ens_cache import ENSCache, get_ens_cache
 
 __all__ = [
     "EVMTransaction",
@@ -20,6 +23,19 @@ __all__ = [
     "USDC",
     "PEPE",
     "PREDEFINED_TOKENS",
+    "PREDEFINED_TOKEN_REGISTRY",
     "Token",
+    "TokenRegistry",
     "ERC20_ABI",
+    "MULTICALL3_ABI",
+    "MULTICALL3_ADDRESS",
+    "ContractCache",
+    "ParsedAbi",
+    "abi_fingerprint",
+    "parse_abi",
+    "register_abi",
+    "NonceManager",
+    "is_nonce_conflict",
+    "ENSCache",
+    "get_ens_cache",
 ]
@@ -0,0 +1,166 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, TypeVar
+
+from eth_utils import function_abi_to_4byte_selector
+from eth_utils.abi import collapse_if_tuple
+
+from .abi import ERC20_ABI, MULTICALL3_ABI
+
+ABI = List[Dict[str, Any]]
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class _LRU(Generic[K, V]):
+    """A small thread-safe LRU mapping."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._items: "OrderedDict[K, V]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> Optional[V]:
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def put(self, key: K, value: V) -> V:
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+            return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class ParsedFunction:
+    """A function ABI entry with its selector and collapsed input and output types."""
+
+    __slots__ = ("abi", "name", "selector", "input_types", "output_types")
+
+    def __init__(self, function_abi: Dict[str, Any]):
+        self.abi = function_abi
+        self.name: str = function_abi["name"]
+        self.selector: bytes = function_abi_to_4byte_selector(function_abi)
+        self.input_types: List[str] = [collapse_if_tuple(item) for item in function_abi.get("inputs", [])]
+        self.output_types: List[str] = [collapse_if_tuple(item) for item in function_abi.get("outputs", [])]
+
+
+class ParsedAbi:
+    """An ABI with its functions indexed by name, argument count and selector."""
+
+    def __init__(self, abi: ABI, fingerprint: str):
+        self.abi = abi
+        self.fingerprint = fingerprint
+        self._by_signature: Dict[Tuple[str, int], ParsedFunction] = {}
+        self._by_selector: Dict[bytes, ParsedFunction] = {}
+
+        for item in abi:
+            if item.get("type", "function") != "function" or "name" not in item:
+                continue
+            function = ParsedFunction(item)
+            self._by_signature.setdefault((function.name, len(function.input_types)), function)
+            self._by_selector.setdefault(function.selector, function)
+
+    def function(self, name: str, arg_count: int) -> ParsedFunction:
+        """Returns the function with the given name and number of arguments.
+
+        Raises:
+            ValueError: If the ABI has no such function
+        """
+        function = self._by_signature.get((name, arg_count))
+        if function is None:
+            raise ValueError(f"Function {name} with {arg_count} arguments not found in ABI")
+        return function
+
+    def function_by_selector(self, selector: bytes) -> Optional[ParsedFunction]:
+        """Returns the function with the given 4-byte selector, if any."""
+        return self._by_selector.get(selector)
+
+
+_fingerprints: "_LRU[int, Tuple[ABI, str]]" = _LRU(512)
+_parsed_abis: "_LRU[str, ParsedAbi]" = _LRU(256)
+_registered_abis: Dict[str, ParsedAbi] = {}
+
+
+def abi_fingerprint(abi: ABI) -> str:
+    """Returns a stable hash of an ABI.
+
+    Hashes are memoized per ABI object, so ABIs must not be modified after first use.
+    """
+    memo = _fingerprints.get(id(abi))
+    if memo is not None and memo[0] is abi:
+        return memo[1]
+    fingerprint = hashlib.sha256(json.dumps(abi, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+    # Keeping a reference to the ABI guarantees its id is not reused while memoized
+    _fingerprints.put(id(abi), (abi, fingerprint))
+    return fingerprint
+
+
+def parse_abi(abi: ABI) -> ParsedAbi:
+    """Returns the parsed form of an ABI, computing function selectors only once per ABI."""
+    fingerprint = abi_fingerprint(abi)
+    parsed = _registered_abis.get(fingerprint) or _parsed_abis.get(fingerprint)
+    if parsed is None:
+        parsed = _parsed_abis.put(fingerprint, ParsedAbi(abi, fingerprint))
+    return parsed
+
+
+def register_abi(abi: ABI) -> ParsedAbi:
+    """Parses a well-known ABI up front and keeps it out of LRU eviction.
+
+    Plugins call this for the ABIs their tools use on every call.
+    """
+    parsed = parse_abi(abi)
+    _registered_abis[parsed.fingerprint] = parsed
+    return parsed
+
+
+class ContractCache:
+    """Bounded cache of contract objects keyed by address and ABI fingerprint.
+
+    Building a web3 contract parses its ABI and creates the function lookups, which is
+    wasted work when the same contract is called repeatedly. Contract objects are tied to
+    one Web3 instance, so every wallet client keeps its own cache.
+    """
+
+    def __init__(self, factory: Callable[[str, ABI], Any], max_size: int = 256):
+        """Creates a new cache.
+
+        Args:
+            factory: Builds a contract object from a checksum address and an ABI
+            max_size: Maximum number of contracts kept before the least recently used is evicted
+        """
+        self._factory = factory
+        self._contracts: "_LRU[Tuple[str, str], Any]" = _LRU(max_size)
+
+    def get(self, address: str, abi: ABI) -> Any:
+        """Returns the contract at `address` with the given ABI, building it on first use."""
+        key = (address, abi_fingerprint(abi))
+        contract = self._contracts.get(key)
+        if contract is None:
+            contract = self._contracts.put(key, self._factory(address, abi))
+        return contract
+
+    def clear(self) -> None:
+        """Drops every cached contract."""
+        self._contracts.clear()
+
+    def __len__(self) -> int:
+        return len(self._contracts)
+
+
+register_abi(ERC20_ABI)
+register_abi(MULTICALL3_ABI)
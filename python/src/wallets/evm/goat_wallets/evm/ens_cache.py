@@ -0,0 +1,199 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+DEFAULT_MAX_SIZE = 4096
+DEFAULT_TTL = 5 * 60
+DEFAULT_NEGATIVE_TTL = 60
+# Concurrent lookups when `resolve_many` has several names to resolve
+DEFAULT_MAX_WORKERS = 8
+
+
+class ENSCache:
+    """LRU cache of ENS name resolutions shared by wallet clients.
+
+    Resolving a name takes several calls (registry, resolver, address record), which wallets
+    used to repeat for every transaction. Resolved addresses are kept for `ttl` seconds and
+    names without an address for `negative_ttl` seconds, so records that get set later are
+    picked up quickly. Failed lookups, e.g. RPC errors, are never cached.
+
+    Entries are keyed by a namespace identifying the ENS deployment, such as `evm:1` for the
+    registry of the connected chain or the URL of a dedicated ENS provider, and the name.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttl: float = DEFAULT_TTL,
+        negative_ttl: float = DEFAULT_NEGATIVE_TTL,
+    ):
+        """Creates a new cache.
+
+        Args:
+            max_size: Maximum number of names kept before the least recently used is evicted
+            ttl: Seconds a resolved address stays valid
+            negative_ttl: Seconds a name that resolved to no address is remembered, 0 to disable
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        # Key -> (address or None, expires at)
+        self._entries: "OrderedDict[str, Tuple[Optional[str], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, namespace: str, name: str) -> Tuple[bool, Optional[str]]:
+        """Returns whether the name is cached and, if so, its address (None for unresolvable names).
+
+        Args:
+            namespace: ENS deployment namespace, e.g. `evm:1`
+            name: The ENS name
+        """
+        key = self._key(namespace, name)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            address, expires_at = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            return True, address
+
+    def set(self, namespace: str, name: str, address: Optional[str]) -> None:
+        """Stores a resolution.
+
+        Args:
+            namespace: ENS deployment namespace, e.g. `evm:1`
+            name: The ENS name
+            address: The resolved address, or None if the name has no address
+        """
+        ttl = self.ttl if address is not None else self.negative_ttl
+        if ttl <= 0:
+            return
+        key = self._key(namespace, name)
+        with self._lock:
+            self._entries[key] = (address, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def resolve(self, namespace: str, name: str, lookup: Callable[[str], Optional[str]]) -> Optional[str]:
+        """Returns the cached address of a name, calling `lookup` and caching its result on a miss.
+
+        Args:
+            namespace: ENS deployment namespace, e.g. `evm:1`
+            name: The ENS name
+            lookup: Resolves the name, returning None when it has no address
+
+        Returns:
+            The address, or None if the name does not resolve
+        """
+        hit, address = self.get(namespace, name)
+        if not hit:
+            address = lookup(name)
+            self.set(namespace, name, address)
+        return address
+
+    async def aresolve(
+        self, namespace: str, name: str, lookup: Callable[[str], Awaitable[Optional[str]]]
+    ) -> Optional[str]:
+        """Async variant of `resolve`."""
+        hit, address = self.get(namespace, name)
+        if not hit:
+            address = await lookup(name)
+            self.set(namespace, name, address)
+        return address
+
+    def resolve_many(
+        self,
+        namespace: str,
+        names: Sequence[str],
+        lookup: Callable[[str], Optional[str]],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> List[Optional[str]]:
+        """Resolves many names, looking up the uncached ones concurrently.
+
+        Args:
+            namespace: ENS deployment namespace, e.g. `evm:1`
+            names: The ENS names. Duplicates are only looked up once.
+            lookup: Resolves a name, returning None when it has no address
+            max_workers: Maximum number of concurrent lookups
+
+        Returns:
+            One address per name, in the same order, None for names that do not resolve
+        """
+        resolved, missing = self._get_many(namespace, names)
+        if len(missing) == 1:
+            resolved[missing[0]] = self.resolve(namespace, missing[0], lookup)
+        elif missing:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(missing))) as executor:
+                for name, address in zip(missing, executor.map(lookup, missing)):
+                    self.set(namespace, name, address)
+                    resolved[name] = address
+        return [resolved[self._normalize(name)] for name in names]
+
+    async def aresolve_many(
+        self, namespace: str, names: Sequence[str], lookup: Callable[[str], Awaitable[Optional[str]]]
+    ) -> List[Optional[str]]:
+        """Async variant of `resolve_many`. The uncached names are looked up concurrently."""
+        resolved, missing = self._get_many(namespace, names)
+        for name, address in zip(missing, await asyncio.gather(*(lookup(name) for name in missing))):
+            self.set(namespace, name, address)
+            resolved[name] = address
+        return [resolved[self._normalize(name)] for name in names]
+
+    def invalidate(self, namespace: Optional[str] = None, name: Optional[str] = None) -> None:
+        """Removes entries from the cache.
+
+        Args:
+            namespace: Only remove entries of this namespace, or every entry when omitted
+            name: Only remove this name (requires `namespace`)
+        """
+        with self._lock:
+            if namespace is None:
+                self._entries.clear()
+            elif name is not None:
+                self._entries.pop(self._key(namespace, name), None)
+            else:
+                prefix = f"{namespace}/"
+                for key in [key for key in self._entries if key.startswith(prefix)]:
+                    del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get_many(self, namespace: str, names: Sequence[str]) -> Tuple[Dict[str, Optional[str]], List[str]]:
+        """Returns the cached addresses by normalized name and the normalized names to look up."""
+        resolved: Dict[str, Optional[str]] = {}
+        missing: List[str] = []
+        for name in dict.fromkeys(self._normalize(name) for name in names):
+            hit, address = self.get(namespace, name)
+            if hit:
+                resolved[name] = address
+            else:
+                missing.append(name)
+        return resolved, missing
+
+    @classmethod
+    def _key(cls, namespace: str, name: str) -> str:
+        return f"{namespace}/{cls._normalize(name)}"
+
+    @staticmethod
+    def _normalize(name: str) -> str:
+        # ENS names are case-insensitive, normalization lowercases them before hashing
+        return name.strip().lower()
+
+
+_default_cache = ENSCache()
+
+
+def get_ens_cache() -> ENSCache:
+    """Returns the process-wide ENS cache used by wallet clients by default."""
+    return _default_cache
@@ -1,14 +1,20 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Optional, List, Any
+import asyncio
+from typing import Callable, Dict, Optional, List, Any, Tuple
 from decimal import Decimal
 import re
 
 from goat.classes.wallet_client_base import Balance, Signature, WalletClientBase
 from goat.types.chain import EvmChain
 from goat.classes.tool_base import ToolBase, create_tool
+from goat.types.token import Token as TokenMetadata
+from goat.utils.token_metadata_cache import TokenMetadataCache, get_token_metadata_cache
 
-from .abi import ERC20_ABI
-from .tokens import PREDEFINED_TOKENS
+from .abi import ERC20_ABI, MULTICALL3_ABI, MULTICALL3_ADDRESS
+from .abi_cache import ParsedFunction, parse_abi
+from .ens_cache import ENSCache, get_ens_cache
+from .multicall import decode_function_result, encode_function_call
+from .tokens import PREDEFINED_TOKEN_REGISTRY, TokenRegistry
 from .types import EVMTransaction, EVMReadRequest, EVMReadResult
 from .params import (
     GetBalanceParameters,
@@ -30,16 +36,40 @@ class EVMOptions:
 class EVMWalletClient(WalletClientBase, ABC):
     """Base class for EVM wallet implementations."""
 
-    def __init__(self, tokens=None, enable_send=True):
+    # None until the first multicall, False once Multicall3 turned out to be unusable on this chain
+    _multicall_supported: Optional[bool] = None
+    # Chain ID of the connected network, looked up once, see `invalidate_chain_cache`
+    _chain_id: Optional[int] = None
+
+    def __init__(
+        self,
+        tokens=None,
+        enable_send=True,
+        token_metadata_cache: Optional[TokenMetadataCache] = None,
+        ens_cache: Optional[ENSCache] = None,
+    ):
         """Initialize the EVM wallet client.
         
         Args:
-            tokens: List of token configurations
+            tokens: List of token configurations, or a TokenRegistry to share between wallets
             enable_send: Whether to enable send functionality
+            token_metadata_cache: Cache for ERC20 name, symbol and decimals, defaults to the shared cache
+            ens_cache: Cache for ENS name resolutions, defaults to the shared cache
         """
         WalletClientBase.__init__(self)
-        self.tokens = tokens or PREDEFINED_TOKENS
+        if isinstance(tokens, TokenRegistry):
+            self.token_registry = tokens
+        elif tokens:
+            self.token_registry = TokenRegistry(tokens)
+        else:
+            self.token_registry = PREDEFINED_TOKEN_REGISTRY
+        self.tokens = self.token_registry.tokens
         self.enable_send = enable_send
+        # Empty caches are falsy, compare with None
+        self.token_metadata_cache = (
+            token_metadata_cache if token_metadata_cache is not None else get_token_metadata_cache()
+        )
+        self.ens_cache = ens_cache if ens_cache is not None else get_ens_cache()
 
     def get_chain(self) -> EvmChain:
         """Get the chain type for EVM."""
@@ -89,6 +119,131 @@ class EVMWalletClient(WalletClientBase, ABC):
         """Get the native balance of the wallet in wei."""
         pass
 
+    def resolve_address(self, address: str) -> str:
+        """Resolve an address or name to a hex address. Subclasses add ENS support."""
+        return address
+
+    def resolve_many(self, addresses: List[str]) -> List[str]:
+        """Resolve many addresses or names, one hex address per input in the same order."""
+        return [self.resolve_address(address) for address in addresses]
+
+    def invalidate_chain_cache(self) -> None:
+        """Forget the cached chain identity.
+
+        Call this after pointing the client's provider at a different network. The chain ID
+        and Multicall3 availability are looked up again on next use.
+        """
+        self._chain_id = None
+        self._multicall_supported = None
+
+    def _get_cached_chain_id(self, fetch: Callable[[], int]) -> int:
+        """Return the cached chain ID, calling `fetch` to look it up the first time."""
+        if self._chain_id is None:
+            self._chain_id = int(fetch())
+        return self._chain_id
+
+    def read_many(self, requests: List[EVMReadRequest], allow_failure: bool = False) -> List[EVMReadResult]:
+        """Read data from several smart contracts in a single Multicall3 call.
+
+        Falls back to one `read` per request when Multicall3 is not available on the chain.
+
+        Args:
+            requests: Read requests, each with address, ABI, function name and args
+            allow_failure: Return a None value for reads that revert instead of raising
+
+        Returns:
+            One result per request, in the same order
+        """
+        if len(requests) < 2 or self._multicall_supported is False:
+            return self._read_sequentially(requests, allow_failure)
+
+        prepared = self._prepare_multicall(requests)
+        if prepared is None:
+            return self._read_sequentially(requests, allow_failure)
+        functions, multicall_request = prepared
+
+        try:
+            responses = self.read(multicall_request)["value"]
+            self._multicall_supported = True
+        except Exception as error:
+            try:
+                deployed = bool(self.get_code(MULTICALL3_ADDRESS))
+            except NotImplementedError:
+                deployed = True
+            except Exception:
+                # The node is not answering, reading one by one would fail the same way
+                raise error
+            if not deployed:
+                # Multicall3 is not deployed on every chain
+                self._multicall_supported = False
+            # Otherwise only this batch failed, e.g. it was too large, so only it is read one by one
+            return self._read_sequentially(requests, allow_failure)
+
+        results: List[EVMReadResult] = []
+        for request, function, response in zip(requests, functions, responses):
+            result = self._decode_multicall_response(function, response)
+            # Re-run failed reads on their own so the caller gets the contract's own error
+            results.extend([result] if result is not None else self._read_sequentially([request], allow_failure))
+        return results
+
+    def get_code(self, address: str) -> bytes:
+        """Return the code deployed at an address, empty if there is none.
+
+        Used to tell a chain without Multicall3 apart from a failed aggregate call. Subclasses
+        connected to a node override it.
+        """
+        raise NotImplementedError
+
+    def _prepare_multicall(
+        self, requests: List[EVMReadRequest]
+    ) -> Optional[Tuple[List[ParsedFunction], EVMReadRequest]]:
+        """Encode read requests into one aggregate3 read, or None if they cannot be encoded locally."""
+        try:
+            functions = [
+                parse_abi(request["abi"]).function(request["functionName"], len(request.get("args", [])))
+                for request in requests
+            ]
+            calls = [
+                (
+                    self.resolve_address(request["address"]),
+                    True,
+                    encode_function_call(function, request.get("args", []), self.resolve_address),
+                )
+                for request, function in zip(requests, functions)
+            ]
+        except Exception:
+            # Arguments web3 could still coerce, let the regular read path handle them
+            return None
+
+        return functions, {
+            "address": MULTICALL3_ADDRESS,
+            "abi": MULTICALL3_ABI,
+            "functionName": "aggregate3",
+            "args": [calls],
+        }
+
+    @staticmethod
+    def _decode_multicall_response(function: ParsedFunction, response: Any) -> Optional[EVMReadResult]:
+        """Decode one aggregate3 result, or None if the call failed."""
+        success, return_data = response
+        if not success:
+            return None
+        try:
+            return {"value": decode_function_result(function, return_data)}
+        except Exception:
+            return None
+
+    def _read_sequentially(self, requests: List[EVMReadRequest], allow_failure: bool) -> List[EVMReadResult]:
+        results: List[EVMReadResult] = []
+        for request in requests:
+            try:
+                results.append(self.read(request))
+            except Exception:
+                if not allow_failure:
+                    raise
+                results.append({"value": None})
+        return results
+
     def balance_of(self, address: str, token_address: Optional[str] = None) -> Balance:
         """Get the balance of an address for native or ERC20 tokens.
         
@@ -102,45 +257,34 @@ class EVMWalletClient(WalletClientBase, ABC):
         
         if token_address:
             try:
-                balance_result = self.read({
+                balance_request: EVMReadRequest = {
                     "address": token_address,
                     "abi": ERC20_ABI,
                     "functionName": "balanceOf",
                     "args": [address],
-                })
-                
-                decimals_result = self.read({
-                    "address": token_address,
-                    "abi": ERC20_ABI,
-                    "functionName": "decimals",
-                    "args": []
-                })
-                
-                name_result = self.read({
-                    "address": token_address,
-                    "abi": ERC20_ABI,
-                    "functionName": "name",
-                    "args": []
-                })
-                
-                symbol_result = self.read({
-                    "address": token_address,
-                    "abi": ERC20_ABI,
-                    "functionName": "symbol",
-                    "args": []
-                })
-                
+                }
+                metadata = self._get_known_token_metadata(chain["id"], token_address)
+
+                if metadata is None:
+                    balance_result, *metadata_results = self.read_many(
+                        [balance_request, *self._token_metadata_requests(token_address)]
+                    )
+                    metadata = self._parse_token_metadata(metadata_results)
+                    self.token_metadata_cache.set(
+                        self._token_metadata_namespace(chain["id"]), token_address.lower(), metadata
+                    )
+                else:
+                    balance_result = self.read(balance_request)
+
                 balance_in_base_units = str(balance_result["value"])
-                token_decimals = int(decimals_result["value"])
-                token_name = str(name_result["value"])
-                token_symbol = str(symbol_result["value"])
-                
+                token_decimals = metadata["decimals"]
+
                 balance_value = str(Decimal(balance_in_base_units) / (10 ** token_decimals))
                 
                 return {
                     "decimals": token_decimals,
-                    "symbol": token_symbol,
-                    "name": token_name,
+                    "symbol": metadata["symbol"],
+                    "name": metadata["name"],
                     "value": balance_value,
                     "in_base_units": balance_in_base_units,
                 }
@@ -162,6 +306,42 @@ class EVMWalletClient(WalletClientBase, ABC):
             except Exception as e:
                 raise ValueError(f"Failed to fetch native balance: {str(e)}")
 
+    # Async variants. These run the synchronous implementation in a worker thread so
+    # async tools never block the event loop; clients backed by an async provider
+    # override them with native coroutines.
+
+    async def aget_chain(self) -> EvmChain:
+        """Async variant of `get_chain`."""
+        return await asyncio.to_thread(self.get_chain)
+
+    async def aresolve_address(self, address: str) -> str:
+        """Async variant of `resolve_address`."""
+        return await asyncio.to_thread(self.resolve_address, address)
+
+    async def aresolve_many(self, addresses: List[str]) -> List[str]:
+        """Async variant of `resolve_many`."""
+        return await asyncio.to_thread(self.resolve_many, addresses)
+
+    async def aread(self, request: EVMReadRequest) -> EVMReadResult:
+        """Async variant of `read`."""
+        return await asyncio.to_thread(self.read, request)
+
+    async def aread_many(self, requests: List[EVMReadRequest], allow_failure: bool = False) -> List[EVMReadResult]:
+        """Async variant of `read_many`."""
+        return await asyncio.to_thread(self.read_many, requests, allow_failure)
+
+    async def aget_code(self, address: str) -> bytes:
+        """Async variant of `get_code`."""
+        return await asyncio.to_thread(self.get_code, address)
+
+    async def abalance_of(self, address: str, token_address: Optional[str] = None) -> Balance:
+        """Async variant of `balance_of`."""
+        return await asyncio.to_thread(self.balance_of, address, token_address)
+
+    async def asend_transaction(self, transaction: EVMTransaction) -> Dict[str, str]:
+        """Async variant of `send_transaction`."""
+        return await asyncio.to_thread(self.send_transaction, transaction)
+
     def get_token_info_by_ticker(self, ticker: str) -> Dict[str, Any]:
         """Get token information by ticker symbol.
         
@@ -175,16 +355,16 @@ class EVMWalletClient(WalletClientBase, ABC):
         chain_id = chain["id"]
         upper_ticker = ticker.upper()
         
-        for token in self.tokens:
-            if token["symbol"].upper() == upper_ticker:
-                if chain_id in token["chains"]:
-                    return {
-                        "symbol": token["symbol"],
-                        "contractAddress": token["chains"][chain_id]["contractAddress"],
-                        "decimals": token["decimals"],
-                        "name": token["name"],
-                    }
-                raise ValueError(f"Token {ticker} not configured for chain {chain_id}")
+        token = self.token_registry.get_by_symbol(ticker, chain_id)
+        if token:
+            if chain_id in token["chains"]:
+                return {
+                    "symbol": token["symbol"],
+                    "contractAddress": token["chains"][chain_id]["contractAddress"],
+                    "decimals": token["decimals"],
+                    "name": token["name"],
+                }
+            raise ValueError(f"Token {ticker} not configured for chain {chain_id}")
         
         if upper_ticker == chain["nativeCurrency"]["symbol"].upper() or upper_ticker == "ETH":
             return {
@@ -207,18 +387,58 @@ class EVMWalletClient(WalletClientBase, ABC):
         """
         if token_address:
             try:
-                decimals_result = self.read({
-                    "address": token_address,
-                    "abi": ERC20_ABI,
-                    "functionName": "decimals",
-                    "args": []
-                })
-                return int(decimals_result["value"])
+                return self.get_token_metadata(token_address)["decimals"]
             except Exception as e:
                 raise ValueError(f"Failed to fetch token decimals: {str(e)}")
         
         return self.get_chain()["nativeCurrency"]["decimals"]
 
+    def get_token_metadata(self, token_address: str) -> TokenMetadata:
+        """Get the name, symbol and decimals of an ERC20 token.
+
+        Configured tokens are answered from the token registry. Other tokens are read from the
+        chain once and then served from the token metadata cache.
+
+        Args:
+            token_address: The token contract address
+
+        Returns:
+            Token name, symbol and decimals
+        """
+        chain_id = self.get_chain_id()
+        metadata = self._get_known_token_metadata(chain_id, token_address)
+        if metadata is None:
+            metadata = self._parse_token_metadata(self.read_many(self._token_metadata_requests(token_address)))
+            self.token_metadata_cache.set(self._token_metadata_namespace(chain_id), token_address.lower(), metadata)
+        return metadata
+
+    def _get_known_token_metadata(self, chain_id: int, token_address: str) -> Optional[TokenMetadata]:
+        """Look up token metadata in the registry or cache without touching the network."""
+        token = self.token_registry.get_by_address(chain_id, token_address)
+        if token:
+            return {"name": token["name"], "symbol": token["symbol"], "decimals": token["decimals"]}
+        return self.token_metadata_cache.get(self._token_metadata_namespace(chain_id), token_address.lower())
+
+    @staticmethod
+    def _token_metadata_namespace(chain_id: int) -> str:
+        return f"evm:{chain_id}"
+
+    @staticmethod
+    def _token_metadata_requests(token_address: str) -> List[EVMReadRequest]:
+        return [
+            {"address": token_address, "abi": ERC20_ABI, "functionName": function_name, "args": []}
+            for function_name in ("decimals", "name", "symbol")
+        ]
+
+    @staticmethod
+    def _parse_token_metadata(results: List[EVMReadResult]) -> TokenMetadata:
+        decimals_result, name_result, symbol_result = results
+        return {
+            "decimals": int(decimals_result["value"]),
+            "name": str(name_result["value"]),
+            "symbol": str(symbol_result["value"]),
+        }
+
     def convert_to_base_units(self, params: Dict[str, Any]) -> str:
         """Convert a token amount to base units.
         
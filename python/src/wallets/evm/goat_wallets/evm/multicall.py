@@ -0,0 +1,55 @@
+from typing import Any, Callable, Optional, Sequence
+
+from eth_abi import decode, encode
+from eth_utils import to_checksum_address
+
+from .abi_cache import ParsedFunction
+
+
+def encode_function_call(
+    function: ParsedFunction,
+    args: Sequence[Any],
+    resolve_address: Optional[Callable[[str], str]] = None,
+) -> bytes:
+    """Encode calldata (selector followed by ABI-encoded arguments) for a function call.
+
+    Args:
+        function: The parsed function, see `abi_cache.parse_abi`
+        args: Arguments to encode
+        resolve_address: Optional resolver applied to address arguments, e.g. for ENS names
+
+    Returns:
+        The calldata
+    """
+    values = [_normalize_arg(abi_type, value, resolve_address) for abi_type, value in zip(function.input_types, args)]
+    return function.selector + encode(function.input_types, values)
+
+
+def decode_function_result(function: ParsedFunction, data: bytes) -> Any:
+    """Decode the return data of a function call the way a web3 contract call would.
+
+    Args:
+        function: The parsed function, see `abi_cache.parse_abi`
+        data: Raw return data
+
+    Returns:
+        The single output value, a list of values for functions with several outputs, or None
+    """
+    types = function.output_types
+    values = [
+        to_checksum_address(value) if abi_type == "address" else value
+        for abi_type, value in zip(types, decode(types, data))
+    ]
+    if not values:
+        return None
+    if len(values) == 1:
+        return values[0]
+    return values
+
+
+def _normalize_arg(abi_type: str, value: Any, resolve_address: Optional[Callable[[str], str]]) -> Any:
+    if abi_type == "address" and isinstance(value, str) and resolve_address is not None:
+        return resolve_address(value)
+    if abi_type.startswith("bytes") and "[" not in abi_type and isinstance(value, str):
+        return bytes.fromhex(value[2:] if value.startswith("0x") else value)
+    return value
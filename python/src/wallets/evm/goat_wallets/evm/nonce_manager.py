@@ -0,0 +1,100 @@
+import heapq
+import threading
+from typing import Callable, List, Optional, Set
+
+# Fragments of node error messages (geth, erigon, nethermind, anvil) meaning the nonce we used
+# is already taken, either mined or occupied by another pending transaction. Errors such as
+# "transaction underpriced" or "invalid nonce" say nothing about the nonce being used, so the
+# transaction was not accepted and its nonce is released instead.
+NONCE_CONFLICT_ERRORS = (
+    "nonce too low",
+    "already known",
+    "nonce has already been used",
+)
+
+
+def is_nonce_conflict(error: BaseException) -> bool:
+    """Returns True if a send failed because its nonce was already used."""
+    message = str(error).lower()
+    return any(fragment in message for fragment in NONCE_CONFLICT_ERRORS)
+
+
+class NonceManager:
+    """Assigns transaction nonces locally for a single account.
+
+    The first nonce is read from the node (the pending transaction count). After that nonces
+    are handed out from memory, so sending does not need a round trip per transaction and
+    several transactions can be pending at once. Nonces of transactions that were never
+    broadcast are released and reused first, so a failed send does not leave a gap that
+    blocks every later transaction. When the node reports a nonce conflict (a transaction
+    sent from elsewhere, or a replaced one), `resync` re-reads the count from the node.
+    """
+
+    def __init__(self, fetch_pending_count: Callable[[], int]):
+        """Creates a new nonce manager.
+
+        Args:
+            fetch_pending_count: Returns the account's transaction count including pending transactions
+        """
+        self._fetch_pending_count = fetch_pending_count
+        self._next_nonce: Optional[int] = None
+        self._released: List[int] = []
+        self._in_flight: Set[int] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of nonces handed out whose transactions are not confirmed yet."""
+        return len(self._in_flight)
+
+    def next_nonce(self) -> int:
+        """Reserves the next nonce to use."""
+        with self._lock:
+            if self._next_nonce is None:
+                self._next_nonce = self._fetch_pending_count()
+
+            while self._released:
+                nonce = heapq.heappop(self._released)
+                if nonce < self._next_nonce:
+                    break
+            else:
+                nonce = self._next_nonce
+                self._next_nonce += 1
+
+            self._in_flight.add(nonce)
+            return nonce
+
+    def confirm(self, nonce: int) -> None:
+        """Marks a nonce as used by a mined transaction."""
+        with self._lock:
+            self._in_flight.discard(nonce)
+
+    def release(self, nonce: int) -> None:
+        """Returns a nonce whose transaction was never broadcast, so it is handed out again."""
+        with self._lock:
+            if nonce not in self._in_flight:
+                return
+            self._in_flight.discard(nonce)
+            if self._next_nonce is not None and nonce == self._next_nonce - 1:
+                self._next_nonce = nonce
+            else:
+                heapq.heappush(self._released, nonce)
+
+    def resync(self) -> None:
+        """Re-reads the pending transaction count from the node.
+
+        Nonces of transactions still in flight are kept, so they are not handed out twice.
+        """
+        with self._lock:
+            pending_count = self._fetch_pending_count()
+            in_flight_next = max(self._in_flight) + 1 if self._in_flight else 0
+            self._next_nonce = max(pending_count, in_flight_next)
+            self._released = [nonce for nonce in self._released if nonce >= pending_count]
+            heapq.heapify(self._released)
+
+    def reset(self) -> None:
+        """Forgets all local state. The next nonce is read from the node again."""
+        with self._lock:
+            self._next_nonce = None
+            self._released = []
+            self._in_flight.clear()
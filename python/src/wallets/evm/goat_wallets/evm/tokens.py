@@ -1,4 +1,4 @@
-from typing import Dict, List, TypedDict, Literal, Optional
+from typing import Dict, Iterable, Iterator, List, TypedDict, Literal, Optional, Tuple
 
 from goat.types.token import Token as CoreToken
 
@@ -32,3 +32,64 @@ PEPE: Token = {
 }
 
 PREDEFINED_TOKENS: List[Token] = [USDC, PEPE]
+
+
+class TokenRegistry:
+    """Read-only index over a token list, built once and shareable between wallet clients.
+
+    Lookups by ticker symbol and by (chain ID, contract address) are dictionary lookups
+    instead of scans over the list. The token dictionaries themselves are not copied.
+    """
+
+    def __init__(self, tokens: Iterable[Token]):
+        """Build the indexes for a token list.
+
+        Args:
+            tokens: Token configurations. When several share a symbol, earlier tokens take precedence.
+        """
+        self._tokens: List[Token] = list(tokens)
+        self._by_symbol: Dict[str, List[Token]] = {}
+        self._by_address: Dict[Tuple[int, str], Token] = {}
+
+        for token in self._tokens:
+            self._by_symbol.setdefault(token["symbol"].upper(), []).append(token)
+            for chain_id, chain_info in token["chains"].items():
+                self._by_address.setdefault((chain_id, chain_info["contractAddress"].lower()), token)
+
+    @property
+    def tokens(self) -> List[Token]:
+        """The indexed tokens, in their original order. Must not be modified."""
+        return self._tokens
+
+    def get_by_symbol(self, symbol: str, chain_id: Optional[int] = None) -> Optional[Token]:
+        """Find a token by ticker symbol (case-insensitive).
+
+        Args:
+            symbol: The ticker symbol, e.g. USDC
+            chain_id: Prefer a token configured for this chain
+
+        Returns:
+            The first matching token configured for `chain_id`, otherwise the first token with
+            that symbol, or None
+        """
+        candidates = self._by_symbol.get(symbol.upper())
+        if not candidates:
+            return None
+        if chain_id is not None:
+            for token in candidates:
+                if chain_id in token["chains"]:
+                    return token
+        return candidates[0]
+
+    def get_by_address(self, chain_id: int, address: str) -> Optional[Token]:
+        """Find a token by its contract address on a chain (case-insensitive)."""
+        return self._by_address.get((chain_id, address.lower()))
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def __iter__(self) -> Iterator[Token]:
+        return iter(self._tokens)
+
+
+PREDEFINED_TOKEN_REGISTRY = TokenRegistry(PREDEFINED_TOKENS)
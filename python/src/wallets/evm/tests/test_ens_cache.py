@@ -0,0 +1,209 @@
+import asyncio
+import threading
+from collections import Counter
+
+import pytest
+
+from goat_wallets.evm import ens_cache
+from goat_wallets.evm.ens_cache import ENSCache
+
+ALICE = "0x" + "a1" * 20
+BOB = "0x" + "b0" * 20
+ADDRESSES = {"alice.eth": ALICE, "bob.eth": BOB, "nobody.eth": None}
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000.0):
+        self.now = now
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+class FakeResolver:
+    """Resolves names from ADDRESSES, counting lookups per name and failing the names in `failing`."""
+
+    def __init__(self, failing=()):
+        self.lookups = Counter()
+        self.failing = set(failing)
+        self._lock = threading.Lock()
+
+    def __call__(self, name):
+        with self._lock:
+            self.lookups[name] += 1
+        if name in self.failing:
+            raise ConnectionError(f"could not reach resolver for {name}")
+        return ADDRESSES[name]
+
+    async def alookup(self, name):
+        await asyncio.sleep(0)
+        return self(name)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(ens_cache.time, "monotonic", clock.monotonic)
+    return clock
+
+
+def test_resolutions_expire_after_ttl(clock):
+    """Test a resolved address is served until its TTL has passed and looked up again afterwards."""
+    cache = ENSCache(ttl=300)
+    resolver = FakeResolver()
+
+    assert cache.resolve("evm:1", "alice.eth", resolver) == ALICE
+    clock.now += 299
+    assert cache.resolve("evm:1", "alice.eth", resolver) == ALICE
+    assert resolver.lookups["alice.eth"] == 1
+
+    clock.now += 1
+    assert cache.get("evm:1", "alice.eth") == (False, None)
+    assert cache.resolve("evm:1", "alice.eth", resolver) == ALICE
+    assert resolver.lookups["alice.eth"] == 2
+
+
+def test_unresolvable_names_use_negative_ttl(clock):
+    """Test names without an address are remembered for the shorter negative TTL."""
+    cache = ENSCache(ttl=300, negative_ttl=60)
+    resolver = FakeResolver()
+
+    assert cache.resolve("evm:1", "nobody.eth", resolver) is None
+    assert cache.get("evm:1", "nobody.eth") == (True, None)
+
+    clock.now += 60
+    assert cache.get("evm:1", "nobody.eth") == (False, None)
+    cache.resolve("evm:1", "nobody.eth", resolver)
+    assert resolver.lookups["nobody.eth"] == 2
+
+
+def test_negative_caching_can_be_disabled():
+    """Test a negative TTL of 0 looks up unresolvable names every time."""
+    cache = ENSCache(negative_ttl=0)
+    resolver = FakeResolver()
+
+    cache.resolve("evm:1", "nobody.eth", resolver)
+    cache.resolve("evm:1", "nobody.eth", resolver)
+
+    assert resolver.lookups["nobody.eth"] == 2
+    assert len(cache) == 0
+
+
+def test_failed_lookups_are_not_cached():
+    """Test a lookup error is raised and the name is looked up again on the next request."""
+    cache = ENSCache()
+    resolver = FakeResolver(failing={"alice.eth"})
+
+    with pytest.raises(ConnectionError):
+        cache.resolve("evm:1", "alice.eth", resolver)
+    assert cache.get("evm:1", "alice.eth") == (False, None)
+
+    resolver.failing.clear()
+    assert cache.resolve("evm:1", "alice.eth", resolver) == ALICE
+    assert resolver.lookups["alice.eth"] == 2
+
+
+def test_failed_lookups_in_batches_are_not_cached():
+    """Test a failing name in resolve_many raises without caching it, while names that resolved are kept."""
+    cache = ENSCache()
+    resolver = FakeResolver(failing={"bob.eth"})
+
+    with pytest.raises(ConnectionError):
+        cache.resolve_many("evm:1", ["alice.eth", "bob.eth"], resolver)
+
+    assert cache.get("evm:1", "bob.eth") == (False, None)
+    assert cache.get("evm:1", "alice.eth") == (True, ALICE)
+
+
+def test_names_are_normalized():
+    """Test names differing only in case or surrounding whitespace share one entry."""
+    cache = ENSCache()
+    resolver = FakeResolver()
+
+    cache.resolve("evm:1", "alice.eth", resolver)
+
+    assert cache.get("evm:1", "  Alice.ETH ") == (True, ALICE)
+    assert cache.resolve("evm:1", "ALICE.eth", resolver) == ALICE
+    assert resolver.lookups["alice.eth"] == 1
+    cache.invalidate("evm:1", "Alice.eth")
+    assert len(cache) == 0
+
+
+def test_namespaces_are_kept_apart():
+    """Test the same name is cached separately per ENS deployment."""
+    cache = ENSCache()
+    cache.set("evm:1", "alice.eth", ALICE)
+    cache.set("evm:8453", "alice.eth", BOB)
+
+    cache.invalidate("evm:1")
+
+    assert cache.get("evm:1", "alice.eth") == (False, None)
+    assert cache.get("evm:8453", "alice.eth") == (True, BOB)
+
+
+def test_least_recently_used_name_is_evicted():
+    """Test the cache is bounded and evicts the name read least recently."""
+    cache = ENSCache(max_size=2)
+    cache.set("evm:1", "alice.eth", ALICE)
+    cache.set("evm:1", "bob.eth", BOB)
+    cache.get("evm:1", "alice.eth")
+
+    cache.set("evm:1", "nobody.eth", None)
+
+    assert len(cache) == 2
+    assert cache.get("evm:1", "bob.eth") == (False, None)
+    assert cache.get("evm:1", "alice.eth") == (True, ALICE)
+
+
+def test_resolve_many_keeps_order_and_deduplicates():
+    """Test every name is looked up once, cached names are not looked up, and results follow the input order."""
+    cache = ENSCache()
+    cache.set("evm:1", "bob.eth", BOB)
+    resolver = FakeResolver()
+
+    names = ["nobody.eth", "Alice.eth", "bob.eth", "alice.eth", "nobody.eth"]
+    assert cache.resolve_many("evm:1", names, resolver) == [None, ALICE, BOB, ALICE, None]
+
+    assert resolver.lookups == Counter({"nobody.eth": 1, "alice.eth": 1})
+    assert cache.resolve_many("evm:1", names, resolver) == [None, ALICE, BOB, ALICE, None]
+    assert sum(resolver.lookups.values()) == 2
+
+
+def test_resolve_many_looks_up_concurrently():
+    """Test uncached names are looked up at the same time rather than one after the other."""
+    cache = ENSCache()
+    barrier = threading.Barrier(2, timeout=2)
+
+    def lookup(name):
+        # Only passes when both lookups are in flight together
+        barrier.wait()
+        return ADDRESSES[name]
+
+    assert cache.resolve_many("evm:1", ["alice.eth", "bob.eth"], lookup) == [ALICE, BOB]
+
+
+@pytest.mark.asyncio
+async def test_aresolve_many_keeps_order_and_deduplicates():
+    """Test the async variant looks up each uncached name once and keeps the input order."""
+    cache = ENSCache()
+    cache.set("evm:1", "nobody.eth", None)
+    resolver = FakeResolver()
+
+    names = ["bob.eth", "NOBODY.eth", "alice.eth", "Bob.eth"]
+    assert await cache.aresolve_many("evm:1", names, resolver.alookup) == [BOB, None, ALICE, BOB]
+    assert resolver.lookups == Counter({"bob.eth": 1, "alice.eth": 1})
+
+
+@pytest.mark.asyncio
+async def test_aresolve_does_not_cache_errors():
+    """Test a failed async lookup is raised and not cached."""
+    cache = ENSCache()
+    resolver = FakeResolver(failing={"alice.eth"})
+
+    with pytest.raises(ConnectionError):
+        await cache.aresolve("evm:1", "alice.eth", resolver.alookup)
+    resolver.failing.clear()
+
+    assert await cache.aresolve("evm:1", "alice.eth", resolver.alookup) == ALICE
+    assert await cache.aresolve("evm:1", "alice.eth", resolver.alookup) == ALICE
+    assert resolver.lookups["alice.eth"] == 2
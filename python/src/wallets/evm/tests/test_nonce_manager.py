@@ -0,0 +1,184 @@
+import threading
+
+import pytest
+
+from goat_wallets.evm import NonceManager, is_nonce_conflict
+
+
+class FakeNode:
+    """Answers the pending transaction count and counts how often it is asked."""
+
+    def __init__(self, pending_count: int = 5):
+        self.pending_count = pending_count
+        self.fetches = 0
+
+    def fetch_pending_count(self) -> int:
+        self.fetches += 1
+        return self.pending_count
+
+
+def _manager(pending_count: int = 5):
+    node = FakeNode(pending_count)
+    return NonceManager(node.fetch_pending_count), node
+
+
+def test_nonces_are_assigned_locally_after_first_fetch():
+    """Test only the first nonce is read from the node and later ones are counted up."""
+    manager, node = _manager(5)
+
+    assert [manager.next_nonce() for _ in range(3)] == [5, 6, 7]
+    assert node.fetches == 1
+    assert manager.in_flight == 3
+
+
+def test_confirm_removes_nonce_from_in_flight():
+    """Test confirmed nonces are no longer in flight and cannot be released afterwards."""
+    manager, _ = _manager(5)
+    nonce = manager.next_nonce()
+
+    manager.confirm(nonce)
+    manager.release(nonce)
+
+    assert manager.in_flight == 0
+    assert manager.next_nonce() == 6
+
+
+def test_release_of_latest_nonce_reuses_it():
+    """Test releasing the most recent nonce hands it out again."""
+    manager, _ = _manager(5)
+    manager.next_nonce()
+    nonce = manager.next_nonce()
+
+    manager.release(nonce)
+
+    assert manager.in_flight == 1
+    assert manager.next_nonce() == 6
+    assert manager.next_nonce() == 7
+
+
+def test_released_nonces_are_reused_lowest_first():
+    """Test released nonces below the next one are handed out in ascending order before new ones."""
+    manager, _ = _manager(5)
+    nonces = [manager.next_nonce() for _ in range(5)]
+
+    for nonce in (8, 6, 7):
+        manager.release(nonce)
+
+    assert [manager.next_nonce() for _ in range(4)] == [6, 7, 8, 10]
+    assert manager.in_flight == 6
+    assert nonces == [5, 6, 7, 8, 9]
+
+
+def test_failed_send_does_not_leave_a_gap():
+    """Test a nonce whose send failed is filled before later nonces, so pending transactions can be mined."""
+    manager, _ = _manager(5)
+    # Three transactions are sent concurrently, the node rejects the second one (e.g. underpriced)
+    assert [manager.next_nonce() for _ in range(3)] == [5, 6, 7]
+    manager.release(6)
+
+    # Without reusing 6, the transaction with nonce 7 would never be mined
+    assert manager.next_nonce() == 6
+    assert manager.next_nonce() == 8
+    assert manager.in_flight == 4
+
+
+def test_resync_keeps_in_flight_nonces():
+    """Test a node lagging behind the local nonces does not make in flight nonces be handed out twice."""
+    manager, node = _manager(5)
+    for _ in range(3):
+        manager.next_nonce()
+
+    # The node has only seen the first transaction so far
+    node.pending_count = 6
+    manager.resync()
+
+    assert node.fetches == 2
+    assert manager.next_nonce() == 8
+
+
+def test_resync_skips_nonces_used_elsewhere():
+    """Test resync jumps ahead to the node's count and drops released nonces it already used."""
+    manager, node = _manager(5)
+    for _ in range(4):
+        manager.next_nonce()
+    manager.release(5)
+    manager.release(7)
+    manager.confirm(6)
+    manager.confirm(8)
+
+    # Transactions sent from another process took nonces 5 to 9
+    node.pending_count = 10
+    manager.resync()
+
+    assert manager.next_nonce() == 10
+    assert manager.next_nonce() == 11
+
+
+def test_resync_keeps_released_nonces_the_node_has_not_seen():
+    """Test released nonces at or above the node's count are still reused after a resync."""
+    manager, node = _manager(5)
+    for _ in range(3):
+        manager.next_nonce()
+    manager.release(6)
+    manager.confirm(5)
+
+    node.pending_count = 6
+    manager.resync()
+
+    assert manager.next_nonce() == 6
+    assert manager.next_nonce() == 8
+
+
+def test_reset_reads_count_from_node_again():
+    """Test reset forgets local state and fetches the count on the next nonce."""
+    manager, node = _manager(5)
+    manager.next_nonce()
+    manager.next_nonce()
+    manager.release(5)
+
+    node.pending_count = 20
+    manager.reset()
+
+    assert manager.in_flight == 0
+    assert manager.next_nonce() == 20
+    assert node.fetches == 2
+
+
+def test_concurrent_callers_get_distinct_nonces():
+    """Test nonces handed out from many threads are unique and contiguous."""
+    manager, node = _manager(0)
+    nonces = []
+    lock = threading.Lock()
+
+    def take():
+        for _ in range(100):
+            nonce = manager.next_nonce()
+            with lock:
+                nonces.append(nonce)
+
+    threads = [threading.Thread(target=take) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(nonces) == list(range(800))
+    assert node.fetches == 1
+
+
+@pytest.mark.parametrize(
+    "message",
+    ["nonce too low: next nonce 7, tx nonce 5", "already known", "Nonce has already been used"],
+)
+def test_nonce_conflicts_are_detected(message):
+    """Test node errors meaning the nonce is taken are reported as conflicts."""
+    assert is_nonce_conflict(ValueError({"code": -32000, "message": message}))
+
+
+@pytest.mark.parametrize(
+    "message",
+    ["transaction underpriced", "replacement transaction underpriced", "invalid nonce", "insufficient funds"],
+)
+def test_other_errors_are_not_nonce_conflicts(message):
+    """Test errors that do not mean the nonce was used are not reported as conflicts."""
+    assert not is_nonce_conflict(ValueError({"code": -32000, "message": message}))
@@ -5,7 +5,12 @@ from .wallet import (
     SolanaOptions,
     solana,
 )
-from .tokens import USDC, USDT, BONK, SPL_TOKENS, Token, SolanaNetwork
+from .async_wallet import AsyncSolanaKeypairWalletClient, async_solana
+from .accounts import AccountLoader, MAX_MULTIPLE_ACCOUNTS
+from .blockhash import BlockhashProvider
+from .confirmation import confirm_signatures
+from .lookup_table_cache import AddressLookupTableCache
+from .tokens import USDC, USDT, BONK, SPL_TOKENS, SPL_TOKEN_REGISTRIES, Token, TokenRegistry, SolanaNetwork
 
 __all__ = [
     "SolanaWalletClient",
@@ -13,10 +18,19 @@ __all__ = [
     "SolanaTransaction",
     "SolanaOptions",
     "solana",
+    "AsyncSolanaKeypairWalletClient",
+    "async_solana",
     "USDC",
     "USDT",
     "BONK",
     "SPL_TOKENS",
+    "SPL_TOKEN_REGISTRIES",
     "Token",
-    "SolanaNetwork"
+    "TokenRegistry",
+    "SolanaNetwork",
+    "AccountLoader",
+    "MAX_MULTIPLE_ACCOUNTS",
+    "AddressLookupTableCache",
+    "BlockhashProvider",
+    "confirm_signatures",
 ]
@@ -0,0 +1,100 @@
+import asyncio
+from typing import Dict, List, Optional, Sequence, Union
+
+from solana.rpc.api import Client as SolanaClient
+from solana.rpc.async_api import AsyncClient
+from solders.account import Account
+from solders.pubkey import Pubkey
+
+# Maximum number of accounts a single getMultipleAccounts request may ask for
+MAX_MULTIPLE_ACCOUNTS = 100
+
+# Offset of the `amount` field (u64) in an SPL Token account: mint (32 bytes) followed by owner (32 bytes)
+TOKEN_ACCOUNT_AMOUNT_OFFSET = 64
+# Offset of the `decimals` field in an SPL Token (and Token-2022) mint account:
+# mint_authority (COption<Pubkey>, 36 bytes) followed by supply (u64, 8 bytes)
+MINT_DECIMALS_OFFSET = 44
+
+PubkeyLike = Union[Pubkey, str]
+
+
+class AccountLoader:
+    """Fetches many accounts with as few `getMultipleAccounts` requests as possible.
+
+    Requests are split at the RPC limit of accounts per call. Token accounts and mints are
+    decoded by the functions below, address lookup tables by `AddressLookupTableCache`.
+    """
+
+    def __init__(
+        self,
+        client: SolanaClient,
+        batch_size: int = MAX_MULTIPLE_ACCOUNTS,
+        async_client: Optional[AsyncClient] = None,
+    ):
+        """Creates a new loader.
+
+        Args:
+            client: Solana RPC client
+            batch_size: Accounts per request, at most `MAX_MULTIPLE_ACCOUNTS`
+            async_client: Async Solana RPC client used by `aget_accounts`
+        """
+        if not 1 <= batch_size <= MAX_MULTIPLE_ACCOUNTS:
+            raise ValueError(f"batch_size must be between 1 and {MAX_MULTIPLE_ACCOUNTS}")
+        self.client = client
+        self.async_client = async_client
+        self.batch_size = batch_size
+
+    def get_accounts(self, pubkeys: Sequence[PubkeyLike]) -> List[Optional[Account]]:
+        """Fetches accounts, None for the ones that do not exist.
+
+        Duplicate keys are only requested once.
+
+        Args:
+            pubkeys: Account addresses
+
+        Returns:
+            One account per key, in the same order
+        """
+        keys = [_to_pubkey(pubkey) for pubkey in pubkeys]
+        unique_keys = list(dict.fromkeys(keys))
+
+        accounts = {}
+        for start in range(0, len(unique_keys), self.batch_size):
+            chunk = unique_keys[start:start + self.batch_size]
+            accounts.update(zip(chunk, self.client.get_multiple_accounts(chunk).value))
+
+        return [accounts[key] for key in keys]
+
+    async def aget_accounts(self, pubkeys: Sequence[PubkeyLike]) -> List[Optional[Account]]:
+        """Async variant of `get_accounts`. Batches are requested concurrently."""
+        if self.async_client is None:
+            raise ValueError("AccountLoader has no async client")
+        keys = [_to_pubkey(pubkey) for pubkey in pubkeys]
+        unique_keys = list(dict.fromkeys(keys))
+        chunks = [unique_keys[start:start + self.batch_size] for start in range(0, len(unique_keys), self.batch_size)]
+        responses = await asyncio.gather(*(self.async_client.get_multiple_accounts(chunk) for chunk in chunks))
+
+        accounts: Dict[Pubkey, Optional[Account]] = {}
+        for chunk, response in zip(chunks, responses):
+            accounts.update(zip(chunk, response.value))
+        return [accounts[key] for key in keys]
+
+
+def decode_token_account_amount(data: bytes) -> int:
+    """Decodes the balance, in base units, of an SPL token account."""
+    data = bytes(data)
+    if len(data) < TOKEN_ACCOUNT_AMOUNT_OFFSET + 8:
+        raise ValueError("Account is not an SPL token account")
+    return int.from_bytes(data[TOKEN_ACCOUNT_AMOUNT_OFFSET:TOKEN_ACCOUNT_AMOUNT_OFFSET + 8], "little")
+
+
+def decode_mint_decimals(data: bytes) -> int:
+    """Decodes the decimals of an SPL token mint account."""
+    data = bytes(data)
+    if len(data) <= MINT_DECIMALS_OFFSET:
+        raise ValueError("Account is not an SPL token mint")
+    return data[MINT_DECIMALS_OFFSET]
+
+
+def _to_pubkey(pubkey: PubkeyLike) -> Pubkey:
+    return pubkey if isinstance(pubkey, Pubkey) else Pubkey.from_string(pubkey)
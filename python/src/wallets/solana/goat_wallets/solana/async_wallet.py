@@ -0,0 +1,147 @@
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+from solana.rpc.api import Client as SolanaClient
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Confirmed
+from solders.address_lookup_table_account import AddressLookupTableAccount
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
+from solders.transaction import Transaction
+
+from goat.classes.wallet_client_base import Balance
+
+from .blockhash import is_blockhash_expired_error
+from .tokens import Token
+from .wallet import SEND_OPTIONS, SolanaKeypairWalletClient, SolanaOptions, SolanaTransaction
+
+
+class AsyncSolanaKeypairWalletClient(SolanaKeypairWalletClient):
+    """Solana keypair wallet client backed by a `solana.rpc.async_api.AsyncClient`.
+
+    The `a*` methods are native coroutines on the async client, so async tools can send and
+    confirm transactions without stalling the event loop. The synchronous methods keep
+    working through a blocking client to the same endpoint, and both share the wallet's
+    blockhash, account and lookup table caches.
+    """
+
+    def __init__(
+        self,
+        client: AsyncClient,
+        keypair: Keypair,
+        options: Optional[SolanaOptions] = None,
+        tokens: Optional[List[Token]] = None,
+        enable_send: Optional[bool] = None,
+        sync_client: Optional[SolanaClient] = None,
+    ):
+        """Initialize the async Solana keypair wallet client.
+
+        Args:
+            client: An async Solana RPC client instance
+            keypair: A Solders Keypair object
+            options: Configuration options
+            tokens: List of token configurations (overrides options.tokens if provided)
+            enable_send: Whether to enable send functionality (overrides options.enable_send if provided)
+            sync_client: Client used by the synchronous methods, defaults to one with the same
+                endpoint, commitment, timeout and headers as `client`
+        """
+        super().__init__(sync_client or _blocking_client(client), keypair, options, tokens, enable_send)
+        self.async_client = client
+        self.accounts.async_client = client
+        self.blockhash_provider.async_client = client
+
+    async def abalance_of(self, address: str, token_address: Optional[str] = None) -> Balance:
+        """Async variant of `balance_of`."""
+        if token_address:
+            try:
+                return (await self.abalances_of(address, [token_address]))[0]
+            except Exception as e:
+                raise ValueError(f"Failed to fetch token balance: {str(e)}")
+
+        balance_lamports = (await self.async_client.get_balance(Pubkey.from_string(address))).value
+        return {
+            "decimals": 9,
+            "symbol": "SOL",
+            "name": "Solana",
+            "value": str(Decimal(balance_lamports) / 10**9),
+            "in_base_units": str(balance_lamports),
+        }
+
+    async def abalances_of(self, address: str, mints: List[str]) -> List[Balance]:
+        """Async variant of `balances_of`."""
+        token_accounts, unknown_mints, metadata = self._prepare_token_balances(address, mints)
+        accounts = await self.accounts.aget_accounts([*token_accounts, *unknown_mints])
+        return self._token_balances_from_accounts(mints, unknown_mints, metadata, accounts)
+
+    async def asend_transaction(self, transaction: SolanaTransaction) -> Dict[str, str]:
+        """Async variant of `send_transaction`."""
+        tx = await self._asign_transaction(transaction)
+        try:
+            result = await self.async_client.send_transaction(tx, opts=SEND_OPTIONS)
+        except Exception as e:
+            if not is_blockhash_expired_error(e):
+                raise
+            # The cached blockhash expired, sign again with a fresh one
+            self.blockhash_provider.invalidate()
+            tx = await self._asign_transaction(transaction)
+            result = await self.async_client.send_transaction(tx, opts=SEND_OPTIONS)
+
+        await self.async_client.confirm_transaction(result.value, commitment=Confirmed)
+        return {"hash": str(result.value)}
+
+    async def asend_raw_transaction(self, transaction: str) -> Dict[str, str]:
+        """Async variant of `send_raw_transaction`.
+
+        Args:
+            transaction: Base64 encoded transaction string
+
+        Returns:
+            Dict containing the transaction hash
+        """
+        tx_signed = self._sign_raw_transaction(transaction)
+        result = await self.async_client.send_transaction(tx_signed, opts=SEND_OPTIONS)
+        await self.async_client.confirm_transaction(result.value, commitment=Confirmed)
+        return {"hash": str(result.value)}
+
+    async def _asign_transaction(self, transaction: SolanaTransaction) -> Transaction:
+        recent_blockhash, _ = await self.blockhash_provider.aget_with_block_height()
+        return self._build_transaction(transaction, recent_blockhash)
+
+    async def _aget_lookup_tables(
+        self, keys: List, min_lengths: Optional[List[int]] = None
+    ) -> List[Optional[AddressLookupTableAccount]]:
+        try:
+            return await self.lookup_tables.aget_many(keys, min_lengths)
+        except Exception as e:
+            print(f"Error getting lookup table accounts {[str(key) for key in keys]}: {e}")
+            return [None] * len(keys)
+
+
+def _blocking_client(client: AsyncClient) -> SolanaClient:
+    provider = client._provider
+    # The async provider only applies its timeout to its httpx session, `provider.timeout` keeps the default
+    session = getattr(provider, "session", None)
+    timeout = session.timeout.read if session is not None else provider.timeout
+    return SolanaClient(provider.endpoint_uri, client.commitment, timeout, provider.extra_headers)
+
+
+def async_solana(
+    client: AsyncClient,
+    keypair: Keypair,
+    options: Optional[SolanaOptions] = None,
+    tokens: Optional[List[Token]] = None,
+    enable_send: Optional[bool] = None,
+) -> AsyncSolanaKeypairWalletClient:
+    """Create an async Solana wallet client with keypair.
+
+    Args:
+        client: An async Solana RPC client
+        keypair: A Solders Keypair object
+        options: Configuration options
+        tokens: List of token configurations (overrides options.tokens if provided)
+        enable_send: Whether to enable send functionality (overrides options.enable_send if provided)
+
+    Returns:
+        An async Solana wallet client
+    """
+    return AsyncSolanaKeypairWalletClient(client, keypair, options, tokens, enable_send)
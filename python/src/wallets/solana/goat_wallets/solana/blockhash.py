@@ -0,0 +1,126 @@
+import threading
+import time
+from typing import Optional, Tuple
+
+from solana.rpc.api import Client as SolanaClient
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Commitment, Confirmed
+from solders.hash import Hash
+
+# A blockhash stays valid for 150 blocks, roughly a minute. Serve cached hashes well within that.
+DEFAULT_MAX_AGE = 30.0
+DEFAULT_REFRESH_INTERVAL = 10.0
+# The refresh thread stops after this long without requests and restarts on the next one
+DEFAULT_IDLE_TIMEOUT = 120.0
+
+
+def is_blockhash_expired_error(error: BaseException) -> bool:
+    """Returns True if a send failed because its blockhash is unknown or expired."""
+    message = str(error).lower()
+    return "blockhash not found" in message or "blockhashnotfound" in message
+
+
+class BlockhashProvider:
+    """Serves a recent blockhash from memory, refreshing it in the background.
+
+    The first request fetches a blockhash synchronously and starts a daemon thread that keeps
+    it fresh while the wallet is sending, so transactions no longer wait for a
+    `getLatestBlockhash` round trip each.
+    """
+
+    def __init__(
+        self,
+        client: SolanaClient,
+        commitment: Commitment = Confirmed,
+        max_age: float = DEFAULT_MAX_AGE,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        async_client: Optional[AsyncClient] = None,
+    ):
+        """Creates a new provider.
+
+        Args:
+            client: Solana RPC client
+            commitment: Commitment used to fetch blockhashes
+            max_age: Seconds a cached blockhash is served before it is fetched again on request
+            refresh_interval: Seconds between background refreshes
+            idle_timeout: Seconds without requests after which background refreshing stops
+            async_client: Async Solana RPC client used by `aget_with_block_height`
+        """
+        if refresh_interval >= max_age:
+            raise ValueError("refresh_interval must be shorter than max_age")
+
+        self.client = client
+        self.async_client = async_client
+        self.commitment = commitment
+        self.max_age = max_age
+        self.refresh_interval = refresh_interval
+        self.idle_timeout = idle_timeout
+        # (blockhash, last valid block height, fetched at)
+        self._latest: Optional[Tuple[Hash, int, float]] = None
+        self._last_request = 0.0
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._fetch_lock = threading.Lock()
+
+    def get(self) -> Hash:
+        """Returns a recent blockhash."""
+        return self.get_with_block_height()[0]
+
+    def get_with_block_height(self) -> Tuple[Hash, int]:
+        """Returns a recent blockhash and the last block height at which it is valid."""
+        now = time.monotonic()
+        self._last_request = now
+        latest = self._latest
+        if latest is None or now - latest[2] > self.max_age:
+            latest = self._refresh()
+        self._ensure_refreshing()
+        return latest[0], latest[1]
+
+    async def aget_with_block_height(self) -> Tuple[Hash, int]:
+        """Async variant of `get_with_block_height`, fetching through the provider's async client."""
+        if self.async_client is None:
+            raise ValueError("BlockhashProvider has no async client")
+        now = time.monotonic()
+        self._last_request = now
+        latest = self._latest
+        if latest is None or now - latest[2] > self.max_age:
+            value = (await self.async_client.get_latest_blockhash(self.commitment)).value
+            latest = (value.blockhash, value.last_valid_block_height, time.monotonic())
+            self._latest = latest
+        self._ensure_refreshing()
+        return latest[0], latest[1]
+
+    def invalidate(self) -> None:
+        """Drops the cached blockhash, e.g. after the cluster rejected it as not found."""
+        self._latest = None
+
+    def _refresh(self) -> Tuple[Hash, int, float]:
+        with self._fetch_lock:
+            # Another thread may have refreshed while we waited for the lock
+            latest = self._latest
+            if latest is not None and time.monotonic() - latest[2] < self.refresh_interval:
+                return latest
+            value = self.client.get_latest_blockhash(self.commitment).value
+            latest = (value.blockhash, value.last_valid_block_height, time.monotonic())
+            self._latest = latest
+            return latest
+
+    def _ensure_refreshing(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="goat-blockhash-provider", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.refresh_interval)
+            with self._lock:
+                if time.monotonic() - self._last_request > self.idle_timeout:
+                    self._thread = None
+                    return
+            try:
+                self._refresh()
+            except Exception:
+                # Requests fall back to a synchronous fetch once the cached hash is too old
+                pass
@@ -0,0 +1,78 @@
+import time
+from typing import Dict, List, Optional, Sequence
+
+from solana.rpc.api import Client as SolanaClient
+from solders.signature import Signature as SolanaSignature
+from solders.transaction_status import TransactionConfirmationStatus
+
+# Maximum number of signatures a single getSignatureStatuses request may ask for
+MAX_SIGNATURE_STATUSES = 256
+DEFAULT_CONFIRM_TIMEOUT = 90.0
+DEFAULT_POLL_INTERVAL = 0.5
+
+_CONFIRMED_STATUSES = (TransactionConfirmationStatus.Confirmed, TransactionConfirmationStatus.Finalized)
+
+
+def confirm_signatures(
+    client: SolanaClient,
+    signatures: Sequence[SolanaSignature],
+    last_valid_block_height: Optional[int] = None,
+    timeout: float = DEFAULT_CONFIRM_TIMEOUT,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+) -> List[Dict[str, str]]:
+    """Waits for many transactions to be confirmed, polling their statuses in bulk.
+
+    Every poll asks for all unconfirmed signatures with one `getSignatureStatuses` request per
+    256 signatures, instead of one confirmation loop per transaction.
+
+    Args:
+        client: Solana RPC client
+        signatures: Signatures of the submitted transactions
+        last_valid_block_height: Block height after which the transactions' blockhash expired.
+            Transactions still unconfirmed then can no longer land and are reported as expired.
+        timeout: Seconds to wait before reporting the remaining transactions as timed out
+        poll_interval: Seconds between polls
+
+    Returns:
+        One result per signature, in the same order, with the transaction `hash` and a `status`
+        of `confirmed`, `failed` (with an `error`), `expired` or `timeout`
+    """
+    results: Dict[SolanaSignature, Dict[str, str]] = {}
+    pending = list(dict.fromkeys(signatures))
+    deadline = time.monotonic() + timeout
+    expired = False
+
+    while pending:
+        statuses = []
+        for start in range(0, len(pending), MAX_SIGNATURE_STATUSES):
+            chunk = pending[start:start + MAX_SIGNATURE_STATUSES]
+            statuses.extend(client.get_signature_statuses(chunk).value)
+
+        still_pending = []
+        for signature, status in zip(pending, statuses):
+            if status is not None and status.err is not None:
+                results[signature] = {"hash": str(signature), "status": "failed", "error": str(status.err)}
+            elif status is not None and status.confirmation_status in _CONFIRMED_STATUSES:
+                results[signature] = {"hash": str(signature), "status": "confirmed"}
+            else:
+                still_pending.append(signature)
+        pending = still_pending
+        if not pending:
+            break
+
+        if expired:
+            for signature in pending:
+                results[signature] = {"hash": str(signature), "status": "expired"}
+            break
+        if last_valid_block_height is not None:
+            # Poll once more after expiry, a transaction may have landed in the last valid block
+            expired = client.get_block_height().value > last_valid_block_height
+            if expired:
+                continue
+        if time.monotonic() + poll_interval > deadline:
+            for signature in pending:
+                results[signature] = {"hash": str(signature), "status": "timeout"}
+            break
+        time.sleep(poll_interval)
+
+    return [results[signature] for signature in signatures]
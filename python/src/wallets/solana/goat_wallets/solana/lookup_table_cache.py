@@ -0,0 +1,142 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from solders.account import Account
+from solders.address_lookup_table_account import AddressLookupTable, AddressLookupTableAccount
+from solders.pubkey import Pubkey
+
+from .accounts import AccountLoader, PubkeyLike
+
+DEFAULT_MAX_SIZE = 256
+# Deactivation slot of a table that has not been deactivated
+ACTIVE_TABLE_DEACTIVATION_SLOT = 2**64 - 1
+
+
+class AddressLookupTableCache:
+    """LRU cache of decoded address lookup tables.
+
+    Lookup tables are append-only: extending a table adds addresses at the end and bumps its
+    last-extended slot, but never changes an existing index. A cached table therefore stays
+    valid for every lookup whose indexes it already covers, and is only fetched again when a
+    transaction references an index past its end. Deactivated tables can be closed and their
+    address reused, so they are never cached.
+    """
+
+    def __init__(self, loader: AccountLoader, max_size: int = DEFAULT_MAX_SIZE):
+        """Creates a new cache.
+
+        Args:
+            loader: Account loader used to fetch tables that are missing or too short
+            max_size: Maximum number of tables kept before the least recently used is evicted
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self.loader = loader
+        self.max_size = max_size
+        # Table address -> (table, last extended slot)
+        self._tables: "OrderedDict[Pubkey, Tuple[AddressLookupTableAccount, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(
+        self, keys: Sequence[PubkeyLike], min_lengths: Optional[Sequence[int]] = None
+    ) -> List[Optional[AddressLookupTableAccount]]:
+        """Returns lookup tables, fetching the ones not cached in a single batched lookup.
+
+        Args:
+            keys: Lookup table addresses
+            min_lengths: Number of addresses each table must have to serve the caller's
+                lookups. Cached tables that are shorter were extended since and are refetched.
+
+        Returns:
+            One table per key, None for tables that do not exist or could not be decoded
+        """
+        pubkeys, tables, missing = self._lookup(keys, min_lengths)
+        if not missing:
+            return tables
+        return self._merge(pubkeys, tables, self._decode_and_store(missing, self.loader.get_accounts(missing)))
+
+    async def aget_many(
+        self, keys: Sequence[PubkeyLike], min_lengths: Optional[Sequence[int]] = None
+    ) -> List[Optional[AddressLookupTableAccount]]:
+        """Async variant of `get_many`, fetching through the loader's async client."""
+        pubkeys, tables, missing = self._lookup(keys, min_lengths)
+        if not missing:
+            return tables
+        accounts = await self.loader.aget_accounts(missing)
+        return self._merge(pubkeys, tables, self._decode_and_store(missing, accounts))
+
+    def warmup(self, keys: Sequence[PubkeyLike]) -> None:
+        """Loads tables ahead of time, e.g. the ones a frequently used program always references."""
+        self.get_many(keys)
+
+    def invalidate(self, key: Optional[PubkeyLike] = None) -> None:
+        """Removes one table, or every table when no key is given."""
+        with self._lock:
+            if key is None:
+                self._tables.clear()
+            else:
+                self._tables.pop(key if isinstance(key, Pubkey) else Pubkey.from_string(key), None)
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def _lookup(
+        self, keys: Sequence[PubkeyLike], min_lengths: Optional[Sequence[int]]
+    ) -> Tuple[List[Pubkey], List[Optional[AddressLookupTableAccount]], List[Pubkey]]:
+        """Returns the keys as pubkeys, the cached tables (None where missing) and the keys to fetch."""
+        pubkeys = [key if isinstance(key, Pubkey) else Pubkey.from_string(key) for key in keys]
+        lengths = list(min_lengths) if min_lengths is not None else [0] * len(pubkeys)
+
+        tables: List[Optional[AddressLookupTableAccount]] = []
+        missing: List[Pubkey] = []
+        with self._lock:
+            for pubkey, min_length in zip(pubkeys, lengths):
+                entry = self._tables.get(pubkey)
+                if entry is not None and len(entry[0].addresses) >= min_length:
+                    self._tables.move_to_end(pubkey)
+                    tables.append(entry[0])
+                else:
+                    tables.append(None)
+                    missing.append(pubkey)
+        return pubkeys, tables, missing
+
+    @staticmethod
+    def _merge(
+        pubkeys: List[Pubkey],
+        tables: List[Optional[AddressLookupTableAccount]],
+        fetched: Dict[Pubkey, Optional[AddressLookupTableAccount]],
+    ) -> List[Optional[AddressLookupTableAccount]]:
+        return [table if table is not None else fetched.get(pubkey) for pubkey, table in zip(pubkeys, tables)]
+
+    def _decode_and_store(
+        self, pubkeys: List[Pubkey], accounts: List[Optional[Account]]
+    ) -> Dict[Pubkey, Optional[AddressLookupTableAccount]]:
+        tables: Dict[Pubkey, Optional[AddressLookupTableAccount]] = {}
+        for pubkey, account in zip(pubkeys, accounts):
+            tables[pubkey] = None
+            if account is None:
+                continue
+            try:
+                decoded = AddressLookupTable.deserialize(bytes(account.data))
+            except Exception as e:
+                print(f"Error decoding lookup table for {pubkey}: {e}")
+                continue
+
+            table = AddressLookupTableAccount(pubkey, list(decoded.addresses))
+            tables[pubkey] = table
+            if decoded.meta.deactivation_slot == ACTIVE_TABLE_DEACTIVATION_SLOT:
+                self._store(pubkey, table, decoded.meta.last_extended_slot)
+        return tables
+
+    def _store(self, pubkey: Pubkey, table: AddressLookupTableAccount, last_extended_slot: int) -> None:
+        with self._lock:
+            entry = self._tables.get(pubkey)
+            # A concurrent fetch may already have stored a more recent version
+            if entry is not None and entry[1] > last_extended_slot:
+                return
+            self._tables[pubkey] = (table, last_extended_slot)
+            self._tables.move_to_end(pubkey)
+            while len(self._tables) > self.max_size:
+                self._tables.popitem(last=False)
@@ -1,4 +1,4 @@
-from typing import Dict, List, Literal
+from typing import Dict, Iterable, Iterator, List, Literal, Optional
 
 from goat.types.token import Token as CoreToken
 
@@ -40,3 +40,49 @@ SPL_TOKENS: Dict[SolanaNetwork, List[Token]] = {
     "devnet": [USDC_DEVNET],
     "testnet": [],
 }
+
+
+class TokenRegistry:
+    """Read-only index over a token list, built once and shareable between wallet clients.
+
+    Lookups by ticker symbol and by mint address are dictionary lookups instead of scans
+    over the list. The token dictionaries themselves are not copied.
+    """
+
+    def __init__(self, tokens: Iterable[Token]):
+        """Build the indexes for a token list.
+
+        Args:
+            tokens: Token configurations. When several share a symbol or mint, earlier tokens take precedence.
+        """
+        self._tokens: List[Token] = list(tokens)
+        self._by_symbol: Dict[str, Token] = {}
+        self._by_mint: Dict[str, Token] = {}
+
+        for token in self._tokens:
+            self._by_symbol.setdefault(token["symbol"].upper(), token)
+            self._by_mint.setdefault(token["mintAddress"], token)
+
+    @property
+    def tokens(self) -> List[Token]:
+        """The indexed tokens, in their original order. Must not be modified."""
+        return self._tokens
+
+    def get_by_symbol(self, symbol: str) -> Optional[Token]:
+        """Find a token by ticker symbol (case-insensitive)."""
+        return self._by_symbol.get(symbol.upper())
+
+    def get_by_mint(self, mint_address: str) -> Optional[Token]:
+        """Find a token by mint address."""
+        return self._by_mint.get(mint_address)
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def __iter__(self) -> Iterator[Token]:
+        return iter(self._tokens)
+
+
+SPL_TOKEN_REGISTRIES: Dict[SolanaNetwork, TokenRegistry] = {
+    network: TokenRegistry(tokens) for network, tokens in SPL_TOKENS.items()
+}
@@ -1,12 +1,16 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Optional, TypedDict, List, Any, Union
+from typing import Dict, Optional, TypedDict, List, Any, Tuple, Union
 from decimal import Decimal
 import re
+import asyncio
 import base64
+from concurrent.futures import Executor
 
 from solana.rpc.api import Client as SolanaClient
 from solana.rpc.types import TxOpts
 from solana.rpc.commitment import Confirmed
+from solders.account import Account
+from solders.hash import Hash
 from solders.pubkey import Pubkey
 from solders.keypair import Keypair
 from solders.instruction import Instruction, AccountMeta, CompiledInstruction
@@ -15,14 +19,19 @@ from solders.address_lookup_table_account import AddressLookupTableAccount
 from solders.transaction import VersionedTransaction, Transaction
 from spl.token.constants import TOKEN_PROGRAM_ID
 from spl.token.instructions import get_associated_token_address, create_associated_token_account, transfer_checked, TransferCheckedParams
-from spl.token.client import Token as SplToken
 import nacl.signing
 
 from goat.classes.wallet_client_base import Balance, Signature, WalletClientBase
 from goat.types.chain import Chain, SolanaChain
 from goat.classes.tool_base import ToolBase, create_tool
-
-from .tokens import SPL_TOKENS, Token, SolanaNetwork
+from goat.types.token import Token as TokenMetadata
+from goat.utils.token_metadata_cache import TokenMetadataCache, get_token_metadata_cache
+
+from .accounts import AccountLoader, decode_mint_decimals, decode_token_account_amount
+from .blockhash import BlockhashProvider, is_blockhash_expired_error
+from .confirmation import confirm_signatures
+from .lookup_table_cache import AddressLookupTableCache
+from .tokens import SPL_TOKEN_REGISTRIES, Token, TokenRegistry, SolanaNetwork
 from .params import (
     ConvertToBaseUnitsParameters,
     ConvertFromBaseUnitsParameters,
@@ -31,6 +40,15 @@ from .params import (
 )
 
 
+SEND_OPTIONS = TxOpts(
+    skip_preflight=False,
+    max_retries=10,
+    preflight_commitment=Confirmed,
+)
+# Messages per task when `sign_messages` offloads to an executor
+SIGN_MESSAGES_CHUNK_SIZE = 512
+
+
 class SolanaTransaction(TypedDict):
     """Transaction parameters for Solana transactions."""
 
@@ -43,30 +61,67 @@ class SolanaTransaction(TypedDict):
 class SolanaOptions:
     """Configuration options for Solana wallet clients."""
 
-    def __init__(self, network: SolanaNetwork = "mainnet", tokens: Optional[List[Token]] = None, enable_send: bool = True):
+    def __init__(
+        self,
+        network: SolanaNetwork = "mainnet",
+        tokens: Optional[Union[List[Token], TokenRegistry]] = None,
+        enable_send: bool = True,
+        lookup_tables: Optional[List[str]] = None,
+    ):
+        """Options for Solana wallet clients.
+
+        Args:
+            network: The Solana network
+            tokens: Tokens known to the wallet, defaults to the network's predefined tokens
+            enable_send: Whether to enable send functionality
+            lookup_tables: Address lookup tables to load into the wallet's cache up front
+        """
         self.network = network
-        self.tokens = tokens or SPL_TOKENS.get(network, [])
+        self.tokens = tokens or SPL_TOKEN_REGISTRIES.get(network) or TokenRegistry([])
         self.enable_send = enable_send
+        self.lookup_tables = lookup_tables or []
 
 
 class SolanaWalletClient(WalletClientBase, ABC):
     """Base class for Solana wallet implementations."""
 
-    def __init__(self, client: SolanaClient, options: Optional[SolanaOptions] = None, tokens: Optional[List[Token]] = None, enable_send: Optional[bool] = None):
+    def __init__(
+        self,
+        client: SolanaClient,
+        options: Optional[SolanaOptions] = None,
+        tokens: Optional[Union[List[Token], TokenRegistry]] = None,
+        enable_send: Optional[bool] = None,
+        token_metadata_cache: Optional[TokenMetadataCache] = None,
+    ):
         """Initialize the Solana wallet client.
 
         Args:
             client: A Solana RPC client instance
             options: Configuration options
-            tokens: List of token configurations (overrides options.tokens if provided)
+            tokens: List of token configurations, or a TokenRegistry to share between wallets
+                (overrides options.tokens if provided)
             enable_send: Whether to enable send functionality (overrides options.enable_send if provided)
+            token_metadata_cache: Cache for metadata of mints not in `tokens`, defaults to the shared cache
         """
         super().__init__()
         self.client = client
         self.options = options or SolanaOptions()
         self.network = self.options.network
-        self.tokens = tokens if tokens is not None else self.options.tokens
+        tokens = tokens if tokens is not None else self.options.tokens
+        self.token_registry = tokens if isinstance(tokens, TokenRegistry) else TokenRegistry(tokens)
+        self.tokens = self.token_registry.tokens
         self.enable_send = enable_send if enable_send is not None else self.options.enable_send
+        self.token_metadata_cache = (
+            token_metadata_cache if token_metadata_cache is not None else get_token_metadata_cache()
+        )
+        self.accounts = AccountLoader(client)
+        self.blockhash_provider = BlockhashProvider(client)
+        self.lookup_tables = AddressLookupTableCache(self.accounts)
+        if self.options.lookup_tables:
+            try:
+                self.lookup_tables.warmup(self.options.lookup_tables)
+            except Exception as e:
+                print(f"Error warming up lookup tables: {e}")
 
     def get_chain(self) -> SolanaChain:
         """Get the chain type for Solana."""
@@ -89,6 +144,10 @@ class SolanaWalletClient(WalletClientBase, ABC):
         """Sign a message with the wallet's private key."""
         pass
 
+    def sign_messages(self, messages: List[str]) -> List[Signature]:
+        """Sign many messages with the wallet's private key, one signature per message in order."""
+        return [self.sign_message(message) for message in messages]
+
     @abstractmethod
     def send_transaction(self, transaction: SolanaTransaction) -> Dict[str, str]:
         """Send a transaction on the Solana chain."""
@@ -99,6 +158,14 @@ class SolanaWalletClient(WalletClientBase, ABC):
         """Send a raw transaction on the Solana chain."""
         pass
 
+    async def asend_transaction(self, transaction: SolanaTransaction) -> Dict[str, str]:
+        """Async variant of `send_transaction`. Runs the synchronous call in a worker thread by default."""
+        return await asyncio.to_thread(self.send_transaction, transaction)
+
+    async def asend_raw_transaction(self, transaction: str) -> Dict[str, str]:
+        """Async variant of `send_raw_transaction`. Runs the synchronous call in a worker thread by default."""
+        return await asyncio.to_thread(self.send_raw_transaction, transaction)
+
     def balance_of(self, address: str, token_address: Optional[str] = None) -> Balance:
         """Get the balance of an address for SOL or SPL tokens.
         
@@ -113,39 +180,7 @@ class SolanaWalletClient(WalletClientBase, ABC):
         
         if token_address:
             try:
-                mint_pubkey = Pubkey.from_string(token_address)
-                token_account = get_associated_token_address(owner_pubkey, mint_pubkey)
-                
-                try:
-                    account_info = self.client.get_account_info(token_account)
-                    if account_info.value is None:
-                        balance_in_base_units = "0"
-                    else:
-                        token_balance = self.client.get_token_account_balance(token_account)
-                        balance_in_base_units = token_balance.value.amount
-                except Exception:
-                    balance_in_base_units = "0"
-                
-                token_info = next((t for t in self.tokens if t["mintAddress"] == token_address), None)
-                
-                if token_info:
-                    decimals = token_info["decimals"]
-                    symbol = token_info["symbol"]
-                    name = token_info["name"]
-                else:
-                    decimals = 9  # Default
-                    symbol = "TOKEN"
-                    name = "Unknown Token"
-                
-                balance_value = str(Decimal(balance_in_base_units) / (10 ** decimals))
-                
-                return {
-                    "decimals": decimals,
-                    "symbol": symbol,
-                    "name": name,
-                    "value": balance_value,
-                    "in_base_units": balance_in_base_units,
-                }
+                return self.balances_of(address, [token_address])[0]
             except Exception as e:
                 raise ValueError(f"Failed to fetch token balance: {str(e)}")
         else:
@@ -163,6 +198,71 @@ class SolanaWalletClient(WalletClientBase, ABC):
             except Exception as e:
                 raise ValueError(f"Failed to fetch SOL balance: {str(e)}")
 
+    async def abalance_of(self, address: str, token_address: Optional[str] = None) -> Balance:
+        """Async variant of `balance_of`. Runs the synchronous call in a worker thread by default."""
+        return await asyncio.to_thread(self.balance_of, address, token_address)
+
+    def balances_of(self, address: str, mints: List[str]) -> List[Balance]:
+        """Get the balances of an address for several SPL tokens at once.
+
+        The associated token accounts, and the mints whose metadata is not known yet, are
+        fetched with a single batched `getMultipleAccounts` lookup.
+
+        Args:
+            address: The address to get the balances of
+            mints: Token mint addresses
+
+        Returns:
+            One balance per mint, in the same order
+        """
+        token_accounts, unknown_mints, metadata = self._prepare_token_balances(address, mints)
+        accounts = self.accounts.get_accounts([*token_accounts, *unknown_mints])
+        return self._token_balances_from_accounts(mints, unknown_mints, metadata, accounts)
+
+    async def abalances_of(self, address: str, mints: List[str]) -> List[Balance]:
+        """Async variant of `balances_of`."""
+        return await asyncio.to_thread(self.balances_of, address, mints)
+
+    def _prepare_token_balances(
+        self, address: str, mints: List[str]
+    ) -> Tuple[List[Pubkey], List[str], Dict[str, Optional[TokenMetadata]]]:
+        """Returns the associated token accounts, the mints without known metadata and the known metadata."""
+        owner_pubkey = Pubkey.from_string(address)
+        token_accounts = [get_associated_token_address(owner_pubkey, Pubkey.from_string(mint)) for mint in mints]
+        metadata: Dict[str, Optional[TokenMetadata]] = {mint: self._get_known_token_metadata(mint) for mint in mints}
+        unknown_mints = [mint for mint in dict.fromkeys(mints) if metadata[mint] is None]
+        return token_accounts, unknown_mints, metadata
+
+    def _token_balances_from_accounts(
+        self,
+        mints: List[str],
+        unknown_mints: List[str],
+        metadata: Dict[str, Optional[TokenMetadata]],
+        accounts: List[Optional[Account]],
+    ) -> List[Balance]:
+        """Builds balances from the token accounts followed by the unknown mint accounts."""
+        token_account_infos, mint_infos = accounts[:len(mints)], accounts[len(mints):]
+
+        for mint, mint_info in zip(unknown_mints, mint_infos):
+            if mint_info is None:
+                raise ValueError(f"Mint account {mint} not found")
+            metadata[mint] = self._unknown_token_metadata(decode_mint_decimals(mint_info.data))
+            self.token_metadata_cache.set(self._token_metadata_namespace(), mint, metadata[mint])  # type: ignore
+
+        balances: List[Balance] = []
+        for mint, token_account_info in zip(mints, token_account_infos):
+            token_metadata = metadata[mint]
+            assert token_metadata is not None
+            amount = 0 if token_account_info is None else decode_token_account_amount(token_account_info.data)
+            balances.append({
+                "decimals": token_metadata["decimals"],
+                "symbol": token_metadata["symbol"],
+                "name": token_metadata["name"],
+                "value": str(Decimal(amount) / (10 ** token_metadata["decimals"])),
+                "in_base_units": str(amount),
+            })
+        return balances
+
     def get_token_info_by_ticker(self, ticker: str) -> Token:
         """Get token information by ticker.
         
@@ -183,14 +283,14 @@ class SolanaWalletClient(WalletClientBase, ABC):
                 "name": chain["nativeCurrency"]["name"],
             }
         
-        for token in self.tokens:
-            if token["symbol"].upper() == upper_ticker:
-                return {
-                    "symbol": token["symbol"],
-                    "mintAddress": token["mintAddress"],
-                    "decimals": token["decimals"],
-                    "name": token["name"],
-                }
+        token = self.token_registry.get_by_symbol(ticker)
+        if token:
+            return {
+                "symbol": token["symbol"],
+                "mintAddress": token["mintAddress"],
+                "decimals": token["decimals"],
+                "name": token["name"],
+            }
                 
         raise ValueError(f"Token with ticker {ticker} not found")
 
@@ -204,15 +304,54 @@ class SolanaWalletClient(WalletClientBase, ABC):
             Number of decimals
         """
         if token_address:
-            token_info = next((t for t in self.tokens if t["mintAddress"] == token_address), None)
-            
-            if token_info:
-                return token_info["decimals"]
-            
-            return 9
+            return self.get_token_metadata(token_address)["decimals"]
         
         return self.get_chain()["nativeCurrency"]["decimals"]
 
+    def get_token_metadata(self, mint_address: str) -> TokenMetadata:
+        """Get the name, symbol and decimals of an SPL token.
+
+        Configured tokens are answered from `self.tokens`. Other mints are resolved once from
+        the on-chain mint account and then served from the token metadata cache.
+
+        Args:
+            mint_address: The token mint address
+
+        Returns:
+            Token name, symbol and decimals
+
+        Raises:
+            ValueError: If the mint account does not exist or is not an SPL token mint
+        """
+        metadata = self._get_known_token_metadata(mint_address)
+        if metadata is not None:
+            return metadata
+        return self.token_metadata_cache.get_or_load(
+            self._token_metadata_namespace(),
+            mint_address,
+            lambda: self._fetch_mint_metadata(mint_address),
+        )
+
+    def _get_known_token_metadata(self, mint_address: str) -> Optional[TokenMetadata]:
+        """Look up token metadata without touching the network."""
+        token_info = self.token_registry.get_by_mint(mint_address)
+        if token_info:
+            return {"name": token_info["name"], "symbol": token_info["symbol"], "decimals": token_info["decimals"]}
+        return self.token_metadata_cache.get(self._token_metadata_namespace(), mint_address)
+
+    def _fetch_mint_metadata(self, mint_address: str) -> TokenMetadata:
+        account = self.client.get_account_info(Pubkey.from_string(mint_address)).value
+        if account is None:
+            raise ValueError(f"Mint account {mint_address} not found")
+        return self._unknown_token_metadata(decode_mint_decimals(account.data))
+
+    def _token_metadata_namespace(self) -> str:
+        return f"solana:{self.network}"
+
+    @staticmethod
+    def _unknown_token_metadata(decimals: int) -> TokenMetadata:
+        return {"name": "Unknown Token", "symbol": "TOKEN", "decimals": decimals}
+
     def convert_to_base_units(self, params: Dict[str, Any]) -> str:
         """Convert a token amount to base units.
         
@@ -293,32 +432,12 @@ class SolanaWalletClient(WalletClientBase, ABC):
                     )
                     instructions.append(create_ata_ix)
                 
-                token_info = next((t for t in self.tokens if t["mintAddress"] == token_address), None)
-                token_decimals = token_info["decimals"] if token_info else 9  # Default to 9 if not found
+                mint_decimals = self.get_token_metadata(token_address)["decimals"]
                 
                 # Use a much smaller amount for testing to avoid rate limits
                 max_test_amount = 1000  # Very small amount to avoid rate limits
                 test_amount = min(int(amount_in_base_units), max_test_amount)
                 
-                try:
-                    try:
-                        # We just need mint info, so we can create a dummy keypair for the SplToken
-                        # since we're only going to call get_mint_info() which doesn't require signing
-                        dummy_payer = Keypair()
-                        token = SplToken(
-                            self.client,
-                            mint_pubkey,
-                            TOKEN_PROGRAM_ID,
-                            dummy_payer
-                        )
-                        mint_data = token.get_mint_info()
-                        mint_decimals = mint_data.decimals
-                    except (ImportError, AttributeError):
-                        mint_decimals = token_decimals
-                except Exception as e:
-                    print(f"Warning: Could not get mint info, using token info: {str(e)}")
-                    mint_decimals = token_decimals
-                
                 # Create transfer checked instruction with mint info
                 transfer_ix = transfer_checked(
                     TransferCheckedParams(
@@ -466,15 +585,38 @@ class SolanaWalletClient(WalletClientBase, ABC):
             List of instructions from the transaction if successful, None if we can't
             properly decompile all instructions
         """
-        # Convert CompiledInstructions back to Instructions
         message = versioned_transaction.message
-        
-        # For MessageV0, we need to get all accounts including those from lookup tables
+        lookup_tables = None
         if isinstance(message, MessageV0) and message.address_table_lookups:
-            # Get lookup table accounts
-            lookup_table_keys = [str(lookup.account_key) for lookup in message.address_table_lookups]
-            lookup_tables = self.get_address_lookup_table_accounts(lookup_table_keys)
-            
+            lookup_tables = self._get_lookup_tables(*self._lookup_table_requests(message))
+        return self._decompile_message(message, lookup_tables)
+
+    async def adecompile_versioned_transaction_to_instructions(
+        self, versioned_transaction: VersionedTransaction
+    ) -> Optional[List[Instruction]]:
+        """Async variant of `decompile_versioned_transaction_to_instructions`."""
+        message = versioned_transaction.message
+        lookup_tables = None
+        if isinstance(message, MessageV0) and message.address_table_lookups:
+            lookup_tables = await self._aget_lookup_tables(*self._lookup_table_requests(message))
+        return self._decompile_message(message, lookup_tables)
+
+    @staticmethod
+    def _lookup_table_requests(message: MessageV0) -> Tuple[List[Pubkey], List[int]]:
+        """Returns the lookup tables a message references and the number of addresses each must have."""
+        lookup_table_keys = [lookup.account_key for lookup in message.address_table_lookups]
+        # Tables must cover the highest index used, cached tables that do not were extended since
+        min_lengths = [
+            max([*lookup.writable_indexes, *lookup.readonly_indexes], default=-1) + 1
+            for lookup in message.address_table_lookups
+        ]
+        return lookup_table_keys, min_lengths
+
+    def _decompile_message(
+        self, message: Any, lookup_tables: Optional[List[Optional[AddressLookupTableAccount]]]
+    ) -> List[Instruction]:
+        # For MessageV0, we need to get all accounts including those from lookup tables
+        if lookup_tables is not None:
             # Filter out None lookup tables and their corresponding lookups
             valid_lookups = []
             valid_tables = []
@@ -498,6 +640,7 @@ class SolanaWalletClient(WalletClientBase, ABC):
         else:
             account_keys = message.account_keys
 
+        # Convert CompiledInstructions back to Instructions
         instructions = []
         for compiled_ix in message.instructions:
             ix = self._decompile_instruction(compiled_ix, account_keys, message) # type: ignore
@@ -509,38 +652,35 @@ class SolanaWalletClient(WalletClientBase, ABC):
     def get_address_lookup_table_accounts(self, keys: List[str]) -> List[AddressLookupTableAccount]:
         """Get address lookup table accounts for the given addresses.
 
+        Tables are served from the wallet's lookup table cache, the rest are fetched with one
+        batched account lookup.
+
         Args:
-            addresses: List of lookup table addresses
+            keys: List of lookup table addresses
 
         Returns:
-            List of address lookup table accounts
+            List of address lookup table accounts, None for tables that could not be loaded
         """
-        lookup_table_accounts = []
-        
-        for key in keys:
-            # Convert address to Pubkey
-            pubkey = Pubkey.from_string(key)
-            
-            # Get account info
-            try:
-                account_info = self.client.get_account_info(pubkey).value
-            except Exception as e:
-                print(f"Error getting account info for {key}: {e}")
-                account_info = None
-            
-            if account_info is not None:
-                try:
-                    # The account data comes as base64, need to decode it first
-                    decoded_data = base64.b64decode(account_info.data)
-                    lookup_table_account = AddressLookupTableAccount.from_bytes(decoded_data)
-                    lookup_table_accounts.append(lookup_table_account)
-                except Exception as e:
-                    print(f"Error decoding lookup table for {key}: {e}")
-                    lookup_table_accounts.append(None)
-            else:
-                lookup_table_accounts.append(None)
-                
-        return lookup_table_accounts
+        return self._get_lookup_tables(keys)  # type: ignore
+
+    async def aget_address_lookup_table_accounts(self, keys: List[str]) -> List[AddressLookupTableAccount]:
+        """Async variant of `get_address_lookup_table_accounts`."""
+        return await self._aget_lookup_tables(keys)  # type: ignore
+
+    def _get_lookup_tables(
+        self, keys: List[Any], min_lengths: Optional[List[int]] = None
+    ) -> List[Optional[AddressLookupTableAccount]]:
+        try:
+            return self.lookup_tables.get_many(keys, min_lengths)
+        except Exception as e:
+            print(f"Error getting lookup table accounts {[str(key) for key in keys]}: {e}")
+            return [None] * len(keys)
+
+    async def _aget_lookup_tables(
+        self, keys: List[Any], min_lengths: Optional[List[int]] = None
+    ) -> List[Optional[AddressLookupTableAccount]]:
+        """Loads lookup tables without blocking the event loop, in a worker thread by default."""
+        return await asyncio.to_thread(self._get_lookup_tables, keys, min_lengths)
 
 
 class SolanaKeypairWalletClient(SolanaWalletClient):
@@ -558,6 +698,8 @@ class SolanaKeypairWalletClient(SolanaWalletClient):
         """
         super().__init__(client, options, tokens, enable_send)
         self.keypair = keypair
+        # Deriving the ed25519 signing key is costly, do it once rather than for every message
+        self._signing_key = nacl.signing.SigningKey(keypair.secret())
 
     def get_address(self) -> str:
         """Get the wallet's public address."""
@@ -565,10 +707,38 @@ class SolanaKeypairWalletClient(SolanaWalletClient):
 
     def sign_message(self, message: str) -> Signature:
         """Sign a message with the wallet's private key."""
-        message_bytes = message.encode("utf-8")
-        signed = nacl.signing.SigningKey(self.keypair.secret()).sign(message_bytes)
+        signed = self._signing_key.sign(message.encode("utf-8"))
         return {"signature": signed.signature.hex()}
 
+    def sign_messages(
+        self,
+        messages: List[str],
+        executor: Optional[Executor] = None,
+        chunk_size: int = SIGN_MESSAGES_CHUNK_SIZE,
+    ) -> List[Signature]:
+        """Sign many messages with the wallet's private key.
+
+        Args:
+            messages: The messages to sign
+            executor: Optional thread or process pool to sign large batches in parallel,
+                `chunk_size` messages per task. Signing runs in the calling thread by default.
+            chunk_size: Messages per executor task
+
+        Returns:
+            One signature per message, in the same order
+        """
+        if executor is None or len(messages) <= chunk_size:
+            return [{"signature": signature} for signature in _sign_messages(self._signing_key, messages)]
+
+        # Pass the 32 byte seed rather than the key, so chunks can also be sent to a process pool
+        seed = bytes(self._signing_key)
+        chunks = [messages[start:start + chunk_size] for start in range(0, len(messages), chunk_size)]
+        return [
+            {"signature": signature}
+            for signatures in executor.map(_sign_messages, [seed] * len(chunks), chunks)
+            for signature in signatures
+        ]
+
     def balance_of(self, address: str, token_address: Optional[str] = None) -> Balance:
         """Get the balance of an address for SOL or SPL tokens.
         
@@ -595,9 +765,68 @@ class SolanaKeypairWalletClient(SolanaWalletClient):
 
     def send_transaction(self, transaction: SolanaTransaction) -> Dict[str, str]:
         """Send a transaction on the Solana chain."""
-        # Get latest blockhash
-        recent_blockhash = self.client.get_latest_blockhash().value.blockhash
+        tx, _ = self._sign_transaction(transaction)
+        try:
+            result = self.client.send_transaction(tx, opts=SEND_OPTIONS)
+        except Exception as e:
+            if not is_blockhash_expired_error(e):
+                raise
+            # The cached blockhash expired, sign again with a fresh one
+            self.blockhash_provider.invalidate()
+            tx, _ = self._sign_transaction(transaction)
+            result = self.client.send_transaction(tx, opts=SEND_OPTIONS)
 
+        # Wait for confirmation
+        self.client.confirm_transaction(
+            result.value,
+            commitment=Confirmed,
+        )
+
+        return {"hash": str(result.value)}
+
+    def send_transactions(self, transactions: List[SolanaTransaction]) -> List[Dict[str, str]]:
+        """Sign and submit many transactions, then confirm them together.
+
+        All transactions are signed with the same cached blockhash and submitted back to back
+        without waiting for each other. Their confirmations are then polled in bulk with
+        `getSignatureStatuses`.
+
+        Args:
+            transactions: The transactions to send
+
+        Returns:
+            One result per transaction, in the same order, with the transaction `hash` and a
+            `status` of `confirmed`, `failed` (with an `error`), `expired` or `timeout`
+        """
+        results: List[Optional[Dict[str, str]]] = [None] * len(transactions)
+        submitted: List[int] = []
+        signatures = []
+        last_valid_block_height = 0
+
+        for index, transaction in enumerate(transactions):
+            tx, last_valid_block_height = self._sign_transaction(transaction)
+            try:
+                signatures.append(self.client.send_transaction(tx, opts=SEND_OPTIONS).value)
+                submitted.append(index)
+            except Exception as e:
+                results[index] = {"hash": str(tx.signatures[0]), "status": "failed", "error": str(e)}
+
+        if signatures:
+            confirmed = confirm_signatures(self.client, signatures, last_valid_block_height)
+            for index, result in zip(submitted, confirmed):
+                results[index] = result
+        return results  # type: ignore
+
+    def _sign_transaction(self, transaction: SolanaTransaction) -> Tuple[Transaction, int]:
+        """Sign a transaction with a cached blockhash.
+
+        Returns:
+            The signed transaction and the last block height at which its blockhash is valid
+        """
+        recent_blockhash, last_valid_block_height = self.blockhash_provider.get_with_block_height()
+        return self._build_transaction(transaction, recent_blockhash), last_valid_block_height
+
+    def _build_transaction(self, transaction: SolanaTransaction, recent_blockhash: Hash) -> Transaction:
         # Create transaction
         tx = Transaction.new_with_payer(
             instructions=transaction["instructions"],
@@ -610,24 +839,8 @@ class SolanaKeypairWalletClient(SolanaWalletClient):
         if additional_signers is not None:
             signers.extend(additional_signers)
 
-        # Sign and send transaction
         tx.sign(signers, recent_blockhash=recent_blockhash)
-        result = self.client.send_transaction(
-            tx,
-            opts=TxOpts(
-                skip_preflight=False,
-                max_retries=10,
-                preflight_commitment=Confirmed,
-            ),
-        )
-
-        # Wait for confirmation
-        self.client.confirm_transaction(
-            result.value,
-            commitment=Confirmed,
-        )
-
-        return {"hash": str(result.value)}
+        return tx
 
     def send_raw_transaction(self, transaction: str) -> Dict[str, str]:
         """Send a raw transaction on the Solana chain.
@@ -638,21 +851,10 @@ class SolanaKeypairWalletClient(SolanaWalletClient):
         Returns:
             Dict containing the transaction hash
         """
-        # Deserialize the transaction from base64
-        tx = VersionedTransaction.from_bytes(base64.b64decode(transaction))
-        
-        # Extract the message from the transaction and sign it, forming a new transaction
-        tx_signed = VersionedTransaction(tx.message, [self.keypair])
+        tx_signed = self._sign_raw_transaction(transaction)
         
         # Send the transaction
-        result = self.client.send_transaction(
-            tx_signed,
-            opts=TxOpts(
-                skip_preflight=False,
-                max_retries=10,
-                preflight_commitment=Confirmed,
-            ),
-        )
+        result = self.client.send_transaction(tx_signed, opts=SEND_OPTIONS)
         
         # Wait for confirmation
         self.client.confirm_transaction(
@@ -662,6 +864,18 @@ class SolanaKeypairWalletClient(SolanaWalletClient):
         
         return {"hash": str(result.value)}
 
+    def _sign_raw_transaction(self, transaction: str) -> VersionedTransaction:
+        # Deserialize the transaction from base64
+        tx = VersionedTransaction.from_bytes(base64.b64decode(transaction))
+
+        # Extract the message from the transaction and sign it, forming a new transaction
+        return VersionedTransaction(tx.message, [self.keypair])
+
+
+def _sign_messages(key: Union[nacl.signing.SigningKey, bytes], messages: List[str]) -> List[str]:
+    signing_key = key if isinstance(key, nacl.signing.SigningKey) else nacl.signing.SigningKey(key)
+    return [signing_key.sign(message.encode("utf-8")).signature.hex() for message in messages]
+
 
 def solana(client: SolanaClient, keypair: Keypair, options: Optional[SolanaOptions] = None, tokens: Optional[List[Token]] = None, enable_send: Optional[bool] = None) -> SolanaKeypairWalletClient:
     """Create a Solana wallet client with keypair.
@@ -0,0 +1,104 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from solders.account import Account
+from solders.pubkey import Pubkey
+
+from goat_wallets.solana import MAX_MULTIPLE_ACCOUNTS, AccountLoader
+
+OWNER = Pubkey.new_unique()
+
+
+def _account(lamports: int) -> Account:
+    return Account(lamports, b"", OWNER)
+
+
+class StubClient:
+    """Answers `getMultipleAccounts` from a dict of accounts and records every requested chunk."""
+
+    def __init__(self, accounts):
+        self.accounts = accounts
+        self.requests = []
+
+    def get_multiple_accounts(self, pubkeys):
+        self.requests.append(list(pubkeys))
+        return SimpleNamespace(value=[self.accounts.get(pubkey) for pubkey in pubkeys])
+
+
+class AsyncStubClient(StubClient):
+    """Async variant of StubClient, tracking how many requests are in flight at once."""
+
+    def __init__(self, accounts):
+        super().__init__(accounts)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_multiple_accounts(self, pubkeys):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return super().get_multiple_accounts(pubkeys)
+
+
+def _keys(count: int):
+    return [Pubkey.new_unique() for _ in range(count)]
+
+
+def test_requests_are_split_at_the_rpc_limit():
+    """Test accounts are fetched in chunks of at most MAX_MULTIPLE_ACCOUNTS, in request order."""
+    keys = _keys(250)
+    client = StubClient({key: _account(i) for i, key in enumerate(keys)})
+
+    accounts = AccountLoader(client).get_accounts(keys)
+
+    assert [len(chunk) for chunk in client.requests] == [MAX_MULTIPLE_ACCOUNTS, MAX_MULTIPLE_ACCOUNTS, 50]
+    assert [account.lamports for account in accounts] == list(range(250))
+
+
+def test_duplicates_are_requested_once_and_missing_accounts_are_none():
+    """Test a key repeated in the input is fetched once and returned at each of its positions."""
+    keys = _keys(3)
+    client = StubClient({keys[0]: _account(0), keys[2]: _account(2)})
+
+    accounts = AccountLoader(client, batch_size=2).get_accounts([keys[2], str(keys[0]), keys[1], keys[2]])
+
+    assert client.requests == [[keys[2], keys[0]], [keys[1]]]
+    assert [account and account.lamports for account in accounts] == [2, 0, None, 2]
+
+
+def test_no_request_for_no_keys():
+    """Test an empty input does not reach the node."""
+    client = StubClient({})
+
+    assert AccountLoader(client).get_accounts([]) == []
+    assert client.requests == []
+
+
+@pytest.mark.parametrize("batch_size", [0, MAX_MULTIPLE_ACCOUNTS + 1])
+def test_batch_size_is_validated(batch_size):
+    """Test batch sizes outside the RPC limit are rejected."""
+    with pytest.raises(ValueError):
+        AccountLoader(StubClient({}), batch_size=batch_size)
+
+
+@pytest.mark.asyncio
+async def test_async_chunks_are_requested_concurrently():
+    """Test the async loader sends every chunk at once and keeps the input order."""
+    keys = _keys(7)
+    async_client = AsyncStubClient({key: _account(i) for i, key in enumerate(keys)})
+    loader = AccountLoader(StubClient({}), batch_size=3, async_client=async_client)
+
+    accounts = await loader.aget_accounts(keys + keys[:2])
+
+    assert [len(chunk) for chunk in async_client.requests] == [3, 3, 1]
+    assert async_client.max_in_flight == 3
+    assert [account.lamports for account in accounts] == [0, 1, 2, 3, 4, 5, 6, 0, 1]
+
+
+@pytest.mark.asyncio
+async def test_async_requires_async_client():
+    """Test aget_accounts raises when the loader has no async client."""
+    with pytest.raises(ValueError, match="no async client"):
+        await AccountLoader(StubClient({})).aget_accounts(_keys(1))
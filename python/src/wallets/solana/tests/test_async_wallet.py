@@ -0,0 +1,172 @@
+from types import SimpleNamespace
+
+import pytest
+from solana.rpc.async_api import AsyncClient
+from solders.account import Account
+from solders.hash import Hash
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
+from solders.system_program import TransferParams, transfer
+from spl.token.constants import TOKEN_PROGRAM_ID
+from spl.token.instructions import get_associated_token_address
+
+from goat.utils.token_metadata_cache import TokenMetadataCache
+from goat_wallets.solana import AsyncSolanaKeypairWalletClient, SolanaOptions
+from goat_wallets.solana.accounts import MINT_DECIMALS_OFFSET, TOKEN_ACCOUNT_AMOUNT_OFFSET
+
+
+class BlockingClient:
+    """Sync client that fails the test when an async method falls back to a blocking call."""
+
+    def __getattr__(self, name):
+        raise AssertionError(f"blocking {name} called from an async method")
+
+
+class StubAsyncClient:
+    """Async client answering from in-memory accounts and recording the requests it receives."""
+
+    def __init__(self, accounts=None, send_errors=()):
+        self.accounts = accounts or {}
+        self.send_errors = list(send_errors)
+        self.account_requests = []
+        self.blockhash_fetches = 0
+        self.sent = []
+        self.confirmed = []
+
+    async def get_balance(self, pubkey):
+        return SimpleNamespace(value=self.accounts[pubkey].lamports)
+
+    async def get_multiple_accounts(self, pubkeys):
+        self.account_requests.append(list(pubkeys))
+        return SimpleNamespace(value=[self.accounts.get(pubkey) for pubkey in pubkeys])
+
+    async def get_latest_blockhash(self, commitment=None):
+        self.blockhash_fetches += 1
+        return SimpleNamespace(value=SimpleNamespace(blockhash=Hash.new_unique(), last_valid_block_height=100))
+
+    async def send_transaction(self, tx, opts=None):
+        self.sent.append(tx)
+        if self.send_errors:
+            raise self.send_errors.pop(0)
+        return SimpleNamespace(value=tx.signatures[0])
+
+    async def confirm_transaction(self, signature, commitment=None):
+        self.confirmed.append(signature)
+
+
+def _wallet(client, keypair=None):
+    wallet = AsyncSolanaKeypairWalletClient(
+        client, keypair or Keypair(), SolanaOptions(tokens=[]), sync_client=BlockingClient()
+    )
+    wallet.token_metadata_cache = TokenMetadataCache()
+    return wallet
+
+
+def _token_account(mint: Pubkey, owner: Pubkey, amount: int) -> Account:
+    data = bytes(mint) + bytes(owner) + amount.to_bytes(8, "little") + bytes(165 - TOKEN_ACCOUNT_AMOUNT_OFFSET - 8)
+    return Account(2039280, data, TOKEN_PROGRAM_ID)
+
+
+def _mint(decimals: int) -> Account:
+    data = bytes(MINT_DECIMALS_OFFSET) + bytes([decimals, 1]) + bytes(36)
+    return Account(1461600, data, TOKEN_PROGRAM_ID)
+
+
+def test_blocking_client_uses_the_same_endpoint():
+    """Test the client used by the synchronous methods talks to the async client's endpoint."""
+    client = AsyncClient("http://localhost:8899", timeout=7)
+
+    wallet = AsyncSolanaKeypairWalletClient(client, Keypair())
+
+    assert wallet.client._provider.endpoint_uri == "http://localhost:8899"
+    assert wallet.client._provider.session.timeout.read == 7
+    assert wallet.accounts.async_client is client
+    assert wallet.blockhash_provider.async_client is client
+
+
+@pytest.mark.asyncio
+async def test_native_balance_uses_async_client():
+    """Test the SOL balance is read through the async client."""
+    owner = Pubkey.new_unique()
+    wallet = _wallet(StubAsyncClient({owner: Account(2_500_000_000, b"", Pubkey.default())}))
+
+    balance = await wallet.abalance_of(str(owner))
+
+    assert balance["value"] == "2.5"
+    assert balance["in_base_units"] == "2500000000"
+
+
+@pytest.mark.asyncio
+async def test_token_balances_are_fetched_in_one_batch():
+    """Test token accounts and unknown mints are read with one request, and mint metadata is cached."""
+    owner = Pubkey.new_unique()
+    funded, empty = Pubkey.new_unique(), Pubkey.new_unique()
+    client = StubAsyncClient({
+        funded: _mint(6),
+        empty: _mint(9),
+        get_associated_token_address(owner, funded): _token_account(funded, owner, 1_500_000),
+    })
+    wallet = _wallet(client)
+
+    balances = await wallet.abalances_of(str(owner), [str(funded), str(empty)])
+
+    assert [(balance["value"], balance["decimals"]) for balance in balances] == [("1.5", 6), ("0", 9)]
+    assert len(client.account_requests) == 1
+    assert len(client.account_requests[0]) == 4
+
+    await wallet.abalances_of(str(owner), [str(funded)])
+    assert client.account_requests[-1] == [get_associated_token_address(owner, funded)]
+
+
+@pytest.mark.asyncio
+async def test_missing_mint_is_reported():
+    """Test a balance request for a mint that does not exist raises."""
+    wallet = _wallet(StubAsyncClient())
+
+    with pytest.raises(ValueError, match="not found"):
+        await wallet.abalance_of(str(Pubkey.new_unique()), str(Pubkey.new_unique()))
+
+
+def _transfer(keypair):
+    return {"instructions": [transfer(TransferParams(from_pubkey=keypair.pubkey(), to_pubkey=Keypair().pubkey(), lamports=1))]}
+
+
+@pytest.mark.asyncio
+async def test_send_reuses_cached_blockhash_and_confirms():
+    """Test transactions are signed with the cached blockhash and confirmed through the async client."""
+    keypair = Keypair()
+    client = StubAsyncClient()
+    wallet = _wallet(client, keypair)
+
+    first = await wallet.asend_transaction(_transfer(keypair))
+    second = await wallet.asend_transaction(_transfer(keypair))
+
+    assert client.blockhash_fetches == 1
+    assert client.sent[0].message.recent_blockhash == client.sent[1].message.recent_blockhash
+    assert [first["hash"], second["hash"]] == [str(signature) for signature in client.confirmed]
+
+
+@pytest.mark.asyncio
+async def test_send_signs_again_when_blockhash_not_found():
+    """Test a send rejected for an unknown blockhash is re-signed with a fresh blockhash."""
+    keypair = Keypair()
+    client = StubAsyncClient(send_errors=[Exception("Blockhash not found")])
+    wallet = _wallet(client, keypair)
+
+    result = await wallet.asend_transaction(_transfer(keypair))
+
+    assert client.blockhash_fetches == 2
+    assert client.sent[0].message.recent_blockhash != client.sent[1].message.recent_blockhash
+    assert result == {"hash": str(client.sent[1].signatures[0])}
+
+
+@pytest.mark.asyncio
+async def test_send_raises_other_errors():
+    """Test errors unrelated to the blockhash are raised without sending again."""
+    keypair = Keypair()
+    client = StubAsyncClient(send_errors=[Exception("insufficient funds for rent")])
+
+    with pytest.raises(Exception, match="insufficient funds"):
+        await _wallet(client, keypair).asend_transaction(_transfer(keypair))
+    assert len(client.sent) == 1
+    assert client.confirmed == []
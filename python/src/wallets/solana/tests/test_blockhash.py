@@ -0,0 +1,149 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from solders.hash import Hash
+from solders.keypair import Keypair
+from solders.system_program import TransferParams, transfer
+
+from goat_wallets.solana import BlockhashProvider, SolanaKeypairWalletClient
+
+
+class StubClient:
+    """Hands out a new blockhash on every `getLatestBlockhash` and records sent transactions."""
+
+    def __init__(self, send_errors=()):
+        self.fetches = 0
+        self.send_errors = list(send_errors)
+        self.sent = []
+        self.fail_fetches = False
+        self._lock = threading.Lock()
+
+    def get_latest_blockhash(self, commitment=None):
+        with self._lock:
+            if self.fail_fetches:
+                raise ConnectionError("node unreachable")
+            self.fetches += 1
+            return SimpleNamespace(value=SimpleNamespace(blockhash=Hash.new_unique(), last_valid_block_height=self.fetches))
+
+    def send_transaction(self, tx, opts=None):
+        self.sent.append(tx)
+        if self.send_errors:
+            raise self.send_errors.pop(0)
+        return SimpleNamespace(value=tx.signatures[0])
+
+    def confirm_transaction(self, signature, commitment=None):
+        pass
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def test_cached_blockhash_is_served_without_refetching():
+    """Test only the first request waits for getLatestBlockhash."""
+    client = StubClient()
+    provider = BlockhashProvider(client, refresh_interval=10, max_age=30)
+
+    first = provider.get_with_block_height()
+    assert [provider.get_with_block_height() for _ in range(10)] == [first] * 10
+    assert client.fetches == 1
+
+
+def test_blockhash_is_refreshed_in_background():
+    """Test the refresh thread replaces the cached blockhash while requests keep coming."""
+    client = StubClient()
+    provider = BlockhashProvider(client, refresh_interval=0.02, max_age=5)
+
+    first = provider.get()
+
+    assert _wait_for(lambda: client.fetches >= 3)
+    assert provider.get() != first
+
+
+def test_refresh_thread_stops_when_idle_and_restarts_on_request():
+    """Test background refreshing stops after idle_timeout without requests and resumes with the next one."""
+    client = StubClient()
+    provider = BlockhashProvider(client, refresh_interval=0.02, max_age=5, idle_timeout=0.1)
+
+    provider.get()
+    thread = provider._thread
+    assert thread is not None and thread.is_alive()
+
+    assert _wait_for(lambda: not thread.is_alive())
+    assert provider._thread is None
+    fetches = client.fetches
+    time.sleep(0.1)
+    assert client.fetches == fetches
+
+    provider.get()
+    assert provider._thread is not None and provider._thread is not thread
+    assert _wait_for(lambda: client.fetches > fetches)
+
+
+def test_failed_refresh_falls_back_to_fetch_on_request():
+    """Test a failing refresh keeps the thread alive and an outdated blockhash is fetched on request."""
+    client = StubClient()
+    provider = BlockhashProvider(client, refresh_interval=0.02, max_age=0.1)
+    first = provider.get()
+    client.fail_fetches = True
+
+    time.sleep(0.15)
+    assert provider._thread.is_alive()
+    client.fail_fetches = False
+
+    assert provider.get() != first
+
+
+def test_invalidate_forces_a_fetch():
+    """Test a blockhash rejected by the cluster is not served again."""
+    client = StubClient()
+    provider = BlockhashProvider(client, refresh_interval=10, max_age=30)
+    first = provider.get()
+
+    provider.invalidate()
+
+    assert provider.get() != first
+    assert client.fetches == 2
+
+
+def test_refresh_interval_must_be_shorter_than_max_age():
+    """Test a refresh interval that would let served hashes outlive max_age is rejected."""
+    with pytest.raises(ValueError):
+        BlockhashProvider(StubClient(), refresh_interval=30, max_age=30)
+
+
+def _transfer(keypair):
+    return {"instructions": [transfer(TransferParams(from_pubkey=keypair.pubkey(), to_pubkey=Keypair().pubkey(), lamports=1))]}
+
+
+def test_send_transaction_signs_again_when_blockhash_not_found():
+    """Test a send rejected for an unknown blockhash is re-signed with a fresh blockhash and sent once more."""
+    client = StubClient(send_errors=[Exception("Transaction simulation failed: Blockhash not found")])
+    keypair = Keypair()
+    wallet = SolanaKeypairWalletClient(client, keypair)
+
+    result = wallet.send_transaction(_transfer(keypair))
+
+    assert len(client.sent) == 2
+    assert client.sent[0].message.recent_blockhash != client.sent[1].message.recent_blockhash
+    assert result == {"hash": str(client.sent[1].signatures[0])}
+    assert client.fetches == 2
+
+
+def test_send_transaction_raises_other_errors():
+    """Test errors unrelated to the blockhash are raised without sending again."""
+    client = StubClient(send_errors=[Exception("insufficient funds for rent")])
+    keypair = Keypair()
+    wallet = SolanaKeypairWalletClient(client, keypair)
+
+    with pytest.raises(Exception, match="insufficient funds"):
+        wallet.send_transaction(_transfer(keypair))
+    assert len(client.sent) == 1
+    assert client.fetches == 1
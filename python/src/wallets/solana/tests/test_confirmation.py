@@ -0,0 +1,105 @@
+from types import SimpleNamespace
+
+from solders.signature import Signature
+from solders.transaction_status import TransactionConfirmationStatus
+
+from goat_wallets.solana import confirm_signatures
+from goat_wallets.solana.confirmation import MAX_SIGNATURE_STATUSES
+
+CONFIRMED = SimpleNamespace(err=None, confirmation_status=TransactionConfirmationStatus.Confirmed)
+PROCESSED = SimpleNamespace(err=None, confirmation_status=TransactionConfirmationStatus.Processed)
+
+
+def _failed(error):
+    return SimpleNamespace(err=error, confirmation_status=TransactionConfirmationStatus.Processed)
+
+
+class StubClient:
+    """Answers `getSignatureStatuses` from scripted statuses and reports a fixed block height.
+
+    `statuses` maps a signature to the statuses returned by successive polls, the last one is
+    repeated. Signatures without a script are unknown to the node.
+    """
+
+    def __init__(self, statuses=None, block_height=0):
+        self.statuses = statuses or {}
+        self.block_height = block_height
+        self.requests = []
+        self.polls = {}
+
+    def get_signature_statuses(self, signatures):
+        self.requests.append(list(signatures))
+        value = []
+        for signature in signatures:
+            script = self.statuses.get(signature, [None])
+            poll = self.polls.get(signature, 0)
+            self.polls[signature] = poll + 1
+            value.append(script[min(poll, len(script) - 1)])
+        return SimpleNamespace(value=value)
+
+    def get_block_height(self):
+        return SimpleNamespace(value=self.block_height)
+
+
+def _signatures(count):
+    return [Signature.new_unique() for _ in range(count)]
+
+
+def test_statuses_are_requested_in_chunks():
+    """Test one poll sends one getSignatureStatuses request per 256 signatures."""
+    signatures = _signatures(600)
+    client = StubClient({signature: [CONFIRMED] for signature in signatures})
+
+    results = confirm_signatures(client, signatures)
+
+    assert [len(chunk) for chunk in client.requests] == [MAX_SIGNATURE_STATUSES, MAX_SIGNATURE_STATUSES, 88]
+    assert [result["hash"] for result in results] == [str(signature) for signature in signatures]
+    assert {result["status"] for result in results} == {"confirmed"}
+
+
+def test_only_pending_signatures_are_polled_again():
+    """Test confirmed and failed signatures are dropped from later polls."""
+    confirmed, failed, slow = _signatures(3)
+    client = StubClient({confirmed: [CONFIRMED], failed: [_failed("InstructionError")], slow: [PROCESSED, CONFIRMED]})
+
+    results = confirm_signatures(client, [confirmed, failed, slow], poll_interval=0)
+
+    assert client.requests == [[confirmed, failed, slow], [slow]]
+    assert [result["status"] for result in results] == ["confirmed", "failed", "confirmed"]
+    assert results[1]["error"] == "InstructionError"
+
+
+def test_unconfirmed_signatures_expire_with_their_blockhash():
+    """Test signatures still unconfirmed after the last valid block height are reported as expired."""
+    landed, dropped = _signatures(2)
+    # The first transaction lands in the last valid block, seen by the poll after expiry
+    client = StubClient({landed: [None, CONFIRMED]}, block_height=101)
+
+    results = confirm_signatures(client, [landed, dropped], last_valid_block_height=100, poll_interval=0)
+
+    assert [result["status"] for result in results] == ["confirmed", "expired"]
+    assert len(client.requests) == 2
+
+
+def test_signatures_time_out():
+    """Test signatures still unconfirmed at the deadline are reported as timed out."""
+    pending, confirmed = _signatures(2)
+    client = StubClient({pending: [PROCESSED], confirmed: [CONFIRMED]}, block_height=50)
+
+    results = confirm_signatures(
+        client, [pending, confirmed], last_valid_block_height=100, timeout=0.05, poll_interval=0.01
+    )
+
+    assert results == [{"hash": str(pending), "status": "timeout"}, {"hash": str(confirmed), "status": "confirmed"}]
+    assert len(client.requests) > 1
+
+
+def test_duplicate_signatures_are_polled_once():
+    """Test a repeated signature is requested once and reported at each of its positions."""
+    signature, other = _signatures(2)
+    client = StubClient({signature: [CONFIRMED], other: [CONFIRMED]})
+
+    results = confirm_signatures(client, [signature, other, signature])
+
+    assert client.requests == [[signature, other]]
+    assert [result["hash"] for result in results] == [str(signature), str(other), str(signature)]
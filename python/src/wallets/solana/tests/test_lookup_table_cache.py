@@ -0,0 +1,156 @@
+import struct
+from types import SimpleNamespace
+
+import pytest
+from solders.account import Account
+from solders.pubkey import Pubkey
+
+from goat_wallets.solana import AccountLoader, AddressLookupTableCache
+
+ADDRESS_LOOKUP_TABLE_PROGRAM = Pubkey.from_string("AddressLookupTab1e1111111111111111111111111")
+ACTIVE = 2**64 - 1
+# Discriminator, deactivation slot, last extended slot, its start index and an absent authority,
+# padded to the 56 bytes preceding the addresses
+HEADER_LENGTH = 56
+
+
+def _table_account(addresses, last_extended_slot=1, deactivation_slot=ACTIVE) -> Account:
+    header = struct.pack("<IQQBB", 1, deactivation_slot, last_extended_slot, 0, 0).ljust(HEADER_LENGTH, b"\x00")
+    data = header + b"".join(bytes(address) for address in addresses)
+    return Account(10**6, data, ADDRESS_LOOKUP_TABLE_PROGRAM)
+
+
+class StubClient:
+    """Answers `getMultipleAccounts` from a dict of accounts and records every requested chunk."""
+
+    def __init__(self, accounts):
+        self.accounts = accounts
+        self.requests = []
+
+    def get_multiple_accounts(self, pubkeys):
+        self.requests.append(list(pubkeys))
+        return SimpleNamespace(value=[self.accounts.get(pubkey) for pubkey in pubkeys])
+
+
+class AsyncStubClient(StubClient):
+    async def get_multiple_accounts(self, pubkeys):
+        return super().get_multiple_accounts(pubkeys)
+
+
+def _addresses(count: int):
+    return [Pubkey.new_unique() for _ in range(count)]
+
+
+def _cache(accounts, max_size=256):
+    client = StubClient(accounts)
+    return AddressLookupTableCache(AccountLoader(client), max_size=max_size), client
+
+
+def test_tables_are_fetched_in_one_batch_and_cached():
+    """Test missing tables are fetched together and served from the cache afterwards."""
+    keys = _addresses(2)
+    addresses = _addresses(3)
+    cache, client = _cache({key: _table_account(addresses) for key in keys})
+
+    tables = cache.get_many([str(keys[0]), keys[1]])
+    cache.get_many(keys)
+
+    assert client.requests == [keys]
+    assert [table.key for table in tables] == keys
+    assert list(tables[0].addresses) == addresses
+
+
+def test_shorter_cached_table_is_refetched():
+    """Test a table is fetched again when a lookup needs more addresses than the cached copy has."""
+    key = Pubkey.new_unique()
+    addresses = _addresses(5)
+    cache, client = _cache({key: _table_account(addresses[:3], last_extended_slot=10)})
+    cache.get_many([key])
+
+    # Still covered by the cached copy
+    assert len(cache.get_many([key], min_lengths=[3])[0].addresses) == 3
+    assert len(client.requests) == 1
+
+    # The table was extended on chain
+    client.accounts[key] = _table_account(addresses, last_extended_slot=20)
+    table = cache.get_many([key], min_lengths=[5])[0]
+    assert list(table.addresses) == addresses
+    assert len(client.requests) == 2
+
+    cache.get_many([key], min_lengths=[5])
+    assert len(client.requests) == 2
+
+
+def test_only_short_tables_are_refetched():
+    """Test a refetch asks only for the tables whose cached copy is too short."""
+    short, long = Pubkey.new_unique(), Pubkey.new_unique()
+    cache, client = _cache({short: _table_account(_addresses(2)), long: _table_account(_addresses(4))})
+    cache.get_many([short, long])
+
+    cache.get_many([short, long], min_lengths=[3, 3])
+
+    assert client.requests[-1] == [short]
+
+
+def test_stale_fetch_does_not_replace_newer_table():
+    """Test a response from a lagging node does not overwrite a more recently extended cached table."""
+    key = Pubkey.new_unique()
+    addresses = _addresses(4)
+    cache, client = _cache({key: _table_account(addresses, last_extended_slot=20)})
+    cache.get_many([key])
+
+    client.accounts[key] = _table_account(addresses[:2], last_extended_slot=10)
+    cache.get_many([key], min_lengths=[5])
+
+    assert len(cache.get_many([key], min_lengths=[4])[0].addresses) == 4
+    assert len(client.requests) == 2
+
+
+def test_deactivated_missing_and_invalid_tables_are_not_cached():
+    """Test tables that may be closed, do not exist or cannot be decoded are returned as such and not kept."""
+    deactivated, missing, invalid = _addresses(3)
+    accounts = {
+        deactivated: _table_account(_addresses(2), deactivation_slot=100),
+        invalid: Account(10**6, b"\x01\x02", ADDRESS_LOOKUP_TABLE_PROGRAM),
+    }
+    cache, client = _cache(accounts)
+
+    tables = cache.get_many([deactivated, missing, invalid])
+
+    assert len(tables[0].addresses) == 2
+    assert tables[1:] == [None, None]
+    assert len(cache) == 0
+    cache.get_many([deactivated])
+    assert len(client.requests) == 2
+
+
+def test_least_recently_used_table_is_evicted():
+    """Test the cache is bounded and evicts the table used least recently."""
+    keys = _addresses(3)
+    cache, client = _cache({key: _table_account(_addresses(1)) for key in keys}, max_size=2)
+    cache.get_many(keys[:2])
+    cache.get_many(keys[:1])
+
+    cache.get_many(keys[2:])
+
+    assert len(cache) == 2
+    cache.get_many(keys[:1])
+    assert len(client.requests) == 2
+    cache.get_many(keys[1:2])
+    assert client.requests[-1] == [keys[1]]
+
+
+@pytest.mark.asyncio
+async def test_async_refetches_short_tables():
+    """Test aget_many uses the async client and honours min_lengths like get_many."""
+    key = Pubkey.new_unique()
+    addresses = _addresses(3)
+    async_client = AsyncStubClient({key: _table_account(addresses[:1])})
+    cache = AddressLookupTableCache(AccountLoader(StubClient({}), async_client=async_client))
+
+    await cache.aget_many([key])
+    async_client.accounts[key] = _table_account(addresses, last_extended_slot=2)
+    table = (await cache.aget_many([key], min_lengths=[3]))[0]
+
+    assert list(table.addresses) == addresses
+    assert len(async_client.requests) == 2
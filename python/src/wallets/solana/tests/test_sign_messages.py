@@ -0,0 +1,64 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import nacl.signing
+from solana.rpc.api import Client
+from solders.keypair import Keypair
+
+from goat_wallets.solana import SolanaKeypairWalletClient
+
+
+def _wallet():
+    return SolanaKeypairWalletClient(Client("http://localhost:8899"), Keypair())
+
+
+def _verify(wallet, message, signature):
+    verify_key = nacl.signing.VerifyKey(bytes(wallet.keypair.pubkey()))
+    verify_key.verify(message.encode("utf-8"), bytes.fromhex(signature["signature"]))
+    return True
+
+
+def test_batch_matches_single_signatures():
+    """Test signing a batch gives the same signatures as signing each message on its own."""
+    wallet = _wallet()
+    messages = [f"message {i}" for i in range(10)]
+
+    assert wallet.sign_messages(messages) == [wallet.sign_message(message) for message in messages]
+
+
+def test_thread_pool_keeps_message_order():
+    """Test chunks signed on a thread pool are returned in the order of the messages."""
+    wallet = _wallet()
+    messages = [f"message {i}" for i in range(103)]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        signatures = wallet.sign_messages(messages, executor=executor, chunk_size=10)
+
+    assert signatures == [wallet.sign_message(message) for message in messages]
+    assert all(_verify(wallet, message, signature) for message, signature in zip(messages, signatures))
+
+
+def test_process_pool_keeps_message_order():
+    """Test chunks can be sent to a process pool and come back in order."""
+    wallet = _wallet()
+    messages = [f"message {i}" for i in range(25)]
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        signatures = wallet.sign_messages(messages, executor=executor, chunk_size=4)
+
+    assert signatures == [wallet.sign_message(message) for message in messages]
+
+
+def test_small_batches_skip_the_executor():
+    """Test batches that fit in one chunk are signed in the calling thread."""
+
+    class FailingExecutor:
+        def map(self, *args):
+            raise AssertionError("executor used for a single chunk")
+
+    wallet = _wallet()
+    messages = ["a", "b", "c"]
+
+    assert wallet.sign_messages(messages, executor=FailingExecutor(), chunk_size=3) == [
+        wallet.sign_message(message) for message in messages
+    ]
+    assert wallet.sign_messages([], executor=FailingExecutor()) == []
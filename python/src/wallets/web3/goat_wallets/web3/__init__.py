@@ -1,3 +1,5 @@
 from .wallet import Web3EVMWalletClient, Web3Options, web3
+from .async_wallet import AsyncWeb3EVMWalletClient, async_web3
+from .receipt_tracker import ReceiptTracker
 
-__all__ = ["Web3EVMWalletClient", "Web3Options", "web3"]
+__all__ = ["Web3EVMWalletClient", "Web3Options", "web3", "AsyncWeb3EVMWalletClient", "async_web3", "ReceiptTracker"]
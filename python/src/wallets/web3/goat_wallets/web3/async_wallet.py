@@ -0,0 +1,352 @@
+import asyncio
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+from eth_account.messages import encode_defunct, encode_typed_data
+from eth_typing import ChecksumAddress, HexStr
+from eth_utils.address import to_checksum_address
+from web3 import AsyncWeb3
+from web3.types import TxParams, Wei
+
+from goat.classes.wallet_client_base import Balance, Signature
+from goat.types.chain import EvmChain
+from goat.utils.event_loop_executor import run_sync
+from goat_wallets.evm import ERC20_ABI, MULTICALL3_ADDRESS, ContractCache, EVMWalletClient
+from goat_wallets.evm.types import EVMReadRequest, EVMReadResult, EVMTransaction
+
+from .wallet import Web3Options
+
+
+class AsyncWeb3EVMWalletClient(EVMWalletClient):
+    """EVM wallet client backed by an `AsyncWeb3` instance.
+
+    The `a*` methods are native coroutines, so async tools can issue many chain reads
+    concurrently on one event loop. The synchronous methods required by `EVMWalletClient`
+    run those coroutines on the shared goat event loop.
+
+    Nonces are read from the node for every transaction, the nonce manager and
+    `send_transaction_nowait` are only available on `Web3EVMWalletClient`.
+    """
+
+    def __init__(self, web3: AsyncWeb3, options: Optional[Web3Options] = None, tokens=None, enable_send=True):
+        if options and options.nonce_manager:
+            raise ValueError("The nonce manager is not supported by AsyncWeb3EVMWalletClient, use Web3EVMWalletClient")
+        super().__init__(tokens=tokens, enable_send=enable_send, ens_cache=options.ens_cache if options else None)
+        self._web3 = web3
+        self._contracts = ContractCache(lambda address, abi: self._web3.eth.contract(address=address, abi=abi))
+        self._default_paymaster_address = (
+            options.paymaster["address"] if options and options.paymaster else None
+        )
+        self._default_paymaster_input = (
+            options.paymaster["input"] if options and options.paymaster else None
+        )
+        self._chain_id = options.chain_id if options else None
+
+    def get_address(self) -> str:
+        if not self._web3.eth.default_account:
+            return ""
+        return self._web3.eth.default_account
+
+    def get_chain_id(self) -> int:
+        if self._chain_id is not None:
+            return self._chain_id
+        return run_sync(self.aget_chain_id())
+
+    async def aget_chain_id(self) -> int:
+        """Async variant of `get_chain_id`."""
+        if self._chain_id is None:
+            self._chain_id = int(await self._web3.eth.chain_id)
+        return self._chain_id
+
+    def get_chain(self) -> EvmChain:
+        chain_id = self.get_chain_id()
+        return {"type": "evm", "id": chain_id, "nativeCurrency": {"name": "Ether", "symbol": "ETH", "decimals": 18}}
+
+    async def aget_chain(self) -> EvmChain:
+        chain_id = await self.aget_chain_id()
+        return {"type": "evm", "id": chain_id, "nativeCurrency": {"name": "Ether", "symbol": "ETH", "decimals": 18}}
+
+    def resolve_address(self, address: str) -> ChecksumAddress:
+        """Resolve an address to its canonical form."""
+        # Hex addresses never need the network, keep them off the event loop
+        if AsyncWeb3.is_address(address):
+            return to_checksum_address(address)
+        return run_sync(self.aresolve_address(address))
+
+    async def aresolve_address(self, address: str) -> ChecksumAddress:
+        """Async variant of `resolve_address`."""
+        if AsyncWeb3.is_address(address):
+            return to_checksum_address(address)
+
+        try:
+            resolved = await self.ens_cache.aresolve(
+                await self._aens_namespace(), address, self._web3.ens.address  # type: ignore
+            )
+            if not resolved:
+                raise ValueError("ENS name could not be resolved")
+            return to_checksum_address(resolved)
+        except Exception as e:
+            raise ValueError(f"Failed to resolve ENS name: {str(e)}")
+
+    def resolve_many(self, addresses: List[str]) -> List[str]:
+        """Resolve many addresses or names, looking up the uncached ENS names concurrently."""
+        if all(AsyncWeb3.is_address(address) for address in addresses):
+            return [to_checksum_address(address) for address in addresses]
+        return run_sync(self.aresolve_many(addresses))
+
+    async def aresolve_many(self, addresses: List[str]) -> List[str]:
+        """Async variant of `resolve_many`."""
+        names = [address for address in addresses if not AsyncWeb3.is_address(address)]
+        try:
+            resolved = await self.ens_cache.aresolve_many(
+                await self._aens_namespace(), names, self._web3.ens.address  # type: ignore
+            )
+        except Exception as e:
+            raise ValueError(f"Failed to resolve ENS name: {str(e)}")
+
+        by_name = dict(zip(names, resolved))
+        result = []
+        for address in addresses:
+            if AsyncWeb3.is_address(address):
+                result.append(to_checksum_address(address))
+                continue
+            if not by_name[address]:
+                raise ValueError(f"Failed to resolve ENS name: {address} could not be resolved")
+            result.append(to_checksum_address(by_name[address]))
+        return result
+
+    async def _aens_namespace(self) -> str:
+        # Each chain has its own ENS registry, if any
+        return f"evm:{await self.aget_chain_id()}"
+
+    def sign_message(self, message: str) -> Signature:
+        """Sign a message with the current account."""
+        if not self._web3.eth.default_account:
+            raise ValueError("No account connected")
+
+        signable_message = encode_defunct(text=message)
+        signed_message = self._web3.eth.default_local_account.sign_message(signable_message)  # type: ignore
+
+        return {"signature": self._web3.to_hex(signed_message.signature)}
+
+    def sign_typed_data(
+        self, types: Dict[str, Any], primary_type: str, domain: Dict[str, Any], value: Dict[str, Any]
+    ) -> Signature:
+        """Sign typed data according to EIP-712."""
+        if not self._web3.eth.default_account:
+            raise ValueError("No account connected")
+
+        if "chainId" in domain:
+            domain["chainId"] = int(domain["chainId"])
+
+        structured_data = encode_typed_data(types=types, primary_type=primary_type, domain=domain, value=value)  # type: ignore
+        signed_message = self._web3.eth.default_local_account.sign_message(structured_data)  # type: ignore
+
+        return {"signature": self._web3.to_hex(signed_message.signature)}
+
+    def send_transaction(self, transaction: EVMTransaction) -> Dict[str, str]:
+        """Send a transaction on the EVM chain."""
+        return run_sync(self.asend_transaction(transaction))
+
+    async def asend_transaction(self, transaction: EVMTransaction) -> Dict[str, str]:
+        """Async variant of `send_transaction`."""
+        account = self._web3.eth.default_account
+        if not account:
+            raise ValueError("No account connected")
+
+        to_address = await self.aresolve_address(transaction["to"])
+
+        paymaster = transaction.get("options", {}).get("paymaster", {})
+        paymaster_address = paymaster.get("address", self._default_paymaster_address)
+        paymaster_input = paymaster.get("input", self._default_paymaster_input)
+        if paymaster_address and paymaster_input:
+            raise NotImplementedError("Paymaster not supported")
+
+        chain_id = await self.aget_chain_id()
+
+        # Simple ETH transfer
+        if not transaction.get("abi"):
+            tx_params: TxParams = {
+                "from": account,
+                "to": to_address,
+                "chainId": chain_id,
+                "value": Wei(transaction.get("value", 0)),
+                "data": transaction.get("data", HexStr("")),
+            }
+            tx_hash = await self._web3.eth.send_transaction(tx_params)
+            return await self._wait_for_receipt(HexStr(tx_hash.hex()))
+
+        # Contract call
+        function_name = transaction.get("functionName")
+        if not function_name:
+            raise ValueError("Function name is required for contract calls")
+
+        contract = self._contracts.get(to_address, transaction["abi"])  # type: ignore
+        contract_function = getattr(contract.functions, function_name)(*transaction.get("args", []))
+
+        # Simulate the call and fetch the nonce at the same time
+        simulation, nonce = await asyncio.gather(
+            contract_function.call({"from": account, "value": Wei(transaction.get("value", 0))}),
+            self._web3.eth.get_transaction_count(account),
+            return_exceptions=True,
+        )
+        if isinstance(simulation, BaseException):
+            raise ValueError(f"Contract call simulation failed: {str(simulation)}")
+        if isinstance(nonce, BaseException):
+            raise nonce
+
+        tx = await contract_function.build_transaction({
+            "from": account,
+            "chainId": chain_id,
+            "value": Wei(transaction.get("value", 0)),
+        })
+        tx["nonce"] = nonce
+
+        tx_hash = await self._web3.eth.send_transaction(tx)
+        return await self._wait_for_receipt(HexStr(tx_hash.hex()))
+
+    def read(self, request: EVMReadRequest) -> EVMReadResult:
+        """Read data from a smart contract."""
+        return run_sync(self.aread(request))
+
+    async def aread(self, request: EVMReadRequest) -> EVMReadResult:
+        """Async variant of `read`."""
+        contract = self._contracts.get(await self.aresolve_address(request["address"]), request["abi"])
+
+        function = getattr(contract.functions, request["functionName"])
+        result = await function(*request.get("args", [])).call()
+
+        return {"value": result}
+
+    def get_code(self, address: str) -> bytes:
+        return run_sync(self.aget_code(address))
+
+    async def aget_code(self, address: str) -> bytes:
+        """Async variant of `get_code`."""
+        return bytes(await self._web3.eth.get_code(await self.aresolve_address(address)))
+
+    def read_many(self, requests: List[EVMReadRequest], allow_failure: bool = False) -> List[EVMReadResult]:
+        return run_sync(self.aread_many(requests, allow_failure))
+
+    async def aread_many(self, requests: List[EVMReadRequest], allow_failure: bool = False) -> List[EVMReadResult]:
+        """Async variant of `read_many`.
+
+        Reads are batched through Multicall3 like the synchronous version. When they cannot be
+        batched, they are sent concurrently instead of one after the other.
+        """
+        if len(requests) < 2 or self._multicall_supported is False:
+            return await self._read_concurrently(requests, allow_failure)
+
+        prepared = self._prepare_multicall(requests)
+        if prepared is None:
+            return await self._read_concurrently(requests, allow_failure)
+        functions, multicall_request = prepared
+
+        try:
+            responses = (await self.aread(multicall_request))["value"]
+            self._multicall_supported = True
+        except Exception as error:
+            try:
+                deployed = bool(await self.aget_code(MULTICALL3_ADDRESS))
+            except Exception:
+                # The node is not answering, reading one by one would fail the same way
+                raise error
+            if not deployed:
+                self._multicall_supported = False
+            return await self._read_concurrently(requests, allow_failure)
+
+        results: List[Optional[EVMReadResult]] = [
+            self._decode_multicall_response(function, response) for function, response in zip(functions, responses)
+        ]
+        failed = [index for index, result in enumerate(results) if result is None]
+        if failed:
+            # Re-run failed reads on their own so the caller gets the contract's own error
+            retried = await self._read_concurrently([requests[index] for index in failed], allow_failure)
+            for index, result in zip(failed, retried):
+                results[index] = result
+        return results  # type: ignore
+
+    async def _read_concurrently(self, requests: List[EVMReadRequest], allow_failure: bool) -> List[EVMReadResult]:
+        results = await asyncio.gather(*(self.aread(request) for request in requests), return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException) and not allow_failure:
+                raise result
+        return [{"value": None} if isinstance(result, BaseException) else result for result in results]
+
+    def get_native_balance(self) -> int:
+        """Get the native balance of the wallet in wei."""
+        return run_sync(self.aget_native_balance())
+
+    async def aget_native_balance(self) -> int:
+        """Async variant of `get_native_balance`."""
+        if not self._web3.eth.default_account:
+            raise ValueError("No account connected")
+        return await self._web3.eth.get_balance(self._web3.eth.default_account)
+
+    def balance_of(self, address: str, token_address: Optional[str] = None) -> Balance:
+        """Get the balance of an address for native or ERC20 tokens."""
+        return run_sync(self.abalance_of(address, token_address))
+
+    async def abalance_of(self, address: str, token_address: Optional[str] = None) -> Balance:
+        """Async variant of `balance_of`."""
+        chain = await self.aget_chain()
+
+        if not token_address:
+            try:
+                balance_wei = await self._web3.eth.get_balance(await self.aresolve_address(address))
+            except Exception as e:
+                raise ValueError(f"Failed to fetch native balance: {str(e)}")
+            decimals = chain["nativeCurrency"]["decimals"]
+            return {
+                "value": str(Decimal(balance_wei) / (10 ** decimals)),
+                "decimals": decimals,
+                "symbol": chain["nativeCurrency"]["symbol"],
+                "name": chain["nativeCurrency"]["name"],
+                "in_base_units": str(balance_wei),
+            }
+
+        try:
+            balance_request: EVMReadRequest = {
+                "address": token_address,
+                "abi": ERC20_ABI,
+                "functionName": "balanceOf",
+                "args": [address],
+            }
+            metadata = self._get_known_token_metadata(chain["id"], token_address)
+
+            if metadata is None:
+                balance_result, *metadata_results = await self.aread_many(
+                    [balance_request, *self._token_metadata_requests(token_address)]
+                )
+                metadata = self._parse_token_metadata(metadata_results)
+                self.token_metadata_cache.set(
+                    self._token_metadata_namespace(chain["id"]), token_address.lower(), metadata
+                )
+            else:
+                balance_result = await self.aread(balance_request)
+
+            balance_in_base_units = str(balance_result["value"])
+            return {
+                "decimals": metadata["decimals"],
+                "symbol": metadata["symbol"],
+                "name": metadata["name"],
+                "value": str(Decimal(balance_in_base_units) / (10 ** metadata["decimals"])),
+                "in_base_units": balance_in_base_units,
+            }
+        except Exception as e:
+            raise ValueError(f"Failed to fetch token balance: {str(e)}")
+
+    async def _wait_for_receipt(self, tx_hash: HexStr) -> Dict[str, str]:
+        """Wait for a transaction receipt and return standardized result."""
+        receipt = await self._web3.eth.wait_for_transaction_receipt(tx_hash)
+        return {
+            "hash": receipt["transactionHash"].hex(),
+            "status": "1" if receipt["status"] == 1 else "0",
+        }
+
+
+def async_web3(
+    client: AsyncWeb3, options: Optional[Web3Options] = None, tokens=None, enable_send=True
+) -> AsyncWeb3EVMWalletClient:
+    """Create a new AsyncWeb3EVMWalletClient instance."""
+    return AsyncWeb3EVMWalletClient(client, options, tokens, enable_send)
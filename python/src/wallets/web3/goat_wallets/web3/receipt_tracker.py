@@ -0,0 +1,210 @@
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from web3 import Web3
+from web3.exceptions import TimeExhausted
+from web3.types import TxReceipt
+
+DEFAULT_POLL_INTERVAL = 0.5
+DEFAULT_TIMEOUT = 120.0
+# Blocks scanned per poll when catching up, so a long stall does not turn into one huge burst
+MAX_BLOCKS_PER_POLL = 32
+# Polls a block is retried before it is skipped, so one bad block cannot stall the tracker
+MAX_BLOCK_ATTEMPTS = 3
+
+
+@dataclass
+class _PendingReceipt:
+    future: "Future[TxReceipt]"
+    deadline: float
+    timeout: float
+
+
+class ReceiptTracker:
+    """Resolves transaction receipts by watching new blocks.
+
+    Transactions are looked up once when tracking starts, so already mined ones resolve right
+    away. After that, instead of polling `eth_getTransactionReceipt` for every pending
+    transaction, a single background thread fetches each new block's transaction hashes and
+    only asks for receipts of the tracked transactions it finds there. The number of requests
+    grows with the number of blocks, not with the number of transactions in flight.
+    """
+
+    def __init__(
+        self,
+        web3: Web3,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        """Creates a new tracker. The watcher thread starts with the first tracked transaction.
+
+        Args:
+            web3: Web3 instance used to fetch blocks and receipts
+            poll_interval: Seconds between checks for new blocks
+            timeout: Seconds to wait for a transaction to be mined before failing its future
+        """
+        self._web3 = web3
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self._pending: Dict[str, _PendingReceipt] = {}
+        self._last_block: Optional[int] = None
+        # Failed attempts at scanning the block after `_last_block`
+        self._block_attempts = 0
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = False
+
+    @property
+    def pending(self) -> int:
+        """Number of transactions waiting to be mined."""
+        return len(self._pending)
+
+    def track(self, tx_hash: str, timeout: Optional[float] = None) -> "Future[TxReceipt]":
+        """Starts watching for a transaction's receipt.
+
+        Tracking the same hash twice returns the same future.
+
+        Args:
+            tx_hash: The transaction hash
+            timeout: Seconds to wait for this transaction, defaults to the tracker's timeout
+
+        Returns:
+            A future resolved with the receipt, or failed with `TimeExhausted`
+        """
+        key = self._normalize(tx_hash)
+        with self._lock:
+            if self._stopped:
+                raise RuntimeError("ReceiptTracker is stopped")
+            entry = self._pending.get(key)
+            if entry is not None:
+                return entry.future
+            timeout = self.timeout if timeout is None else timeout
+            entry = _PendingReceipt(future=Future(), deadline=time.monotonic() + timeout, timeout=timeout)
+            self._pending[key] = entry
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="goat-receipt-tracker", daemon=True)
+                self._thread.start()
+
+        # Block scans start near the head of the chain, so transactions mined earlier are only
+        # found by asking for them directly
+        try:
+            self._resolve(key, self._web3.eth.get_transaction_receipt(key))  # type: ignore
+        except Exception:
+            # Not mined yet, or a transient RPC error. The block scan and the deadline lookup cover both.
+            pass
+        return entry.future
+
+    def wait(self, tx_hash: str, timeout: Optional[float] = None) -> TxReceipt:
+        """Blocks until a transaction is mined and returns its receipt.
+
+        Raises:
+            TimeExhausted: If the transaction is not mined within the timeout
+        """
+        return self.track(tx_hash, timeout).result()
+
+    def stop(self) -> None:
+        """Stops the watcher thread and cancels every pending future."""
+        with self._lock:
+            self._stopped = True
+            pending, self._pending = self._pending, {}
+        self._wakeup.set()
+        for entry in pending.values():
+            entry.future.cancel()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if self._stopped or not self._pending:
+                    # Blocks are only scanned while something is tracked, start fresh next time
+                    self._last_block = None
+                    self._block_attempts = 0
+                    self._thread = None
+                    return
+
+            try:
+                self._poll()
+            except Exception:
+                # Transient RPC errors are retried on the next poll, deadlines still apply
+                pass
+            self._expire()
+
+            self._wakeup.wait(self.poll_interval)
+            self._wakeup.clear()
+
+    def _poll(self) -> None:
+        latest = self._web3.eth.block_number
+        if self._last_block is None:
+            # The transaction may have been mined in the block just before tracking began
+            self._last_block = max(latest - 2, -1)
+        for number in range(self._last_block + 1, min(latest, self._last_block + MAX_BLOCKS_PER_POLL) + 1):
+            try:
+                self._scan_block(number)
+            except Exception:
+                self._block_attempts += 1
+                if self._block_attempts < MAX_BLOCK_ATTEMPTS:
+                    # Retried on the next poll
+                    raise
+                # Skip the block, the lookup at each deadline still finds transactions mined in it
+            self._block_attempts = 0
+            self._last_block = number
+
+    def _scan_block(self, number: int) -> None:
+        block = self._web3.eth.get_block(number, full_transactions=False)
+        with self._lock:
+            found = [
+                key
+                for key in (self._normalize(tx_hash) for tx_hash in block["transactions"])
+                if key in self._pending
+            ]
+        if not found:
+            return
+
+        for key, receipt in zip(found, self._fetch_receipts(number, found)):
+            self._resolve(key, receipt)
+
+    def _fetch_receipts(self, number: int, tx_hashes: List[str]) -> List[TxReceipt]:
+        if len(tx_hashes) > 1:
+            try:
+                # One request for every receipt in the block, when the node supports it
+                by_hash = {
+                    self._normalize(receipt["transactionHash"]): receipt
+                    for receipt in self._web3.eth.get_block_receipts(number)
+                }
+                return [by_hash[tx_hash] for tx_hash in tx_hashes]
+            except Exception:
+                pass
+        return [self._web3.eth.get_transaction_receipt(tx_hash) for tx_hash in tx_hashes]  # type: ignore
+
+    def _expire(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            expired = [(key, entry.timeout) for key, entry in self._pending.items() if entry.deadline <= now]
+        for key, timeout in expired:
+            # A last direct lookup covers blocks skipped by reorgs or RPC errors
+            try:
+                self._resolve(key, self._web3.eth.get_transaction_receipt(key))  # type: ignore
+                continue
+            except Exception:
+                pass
+            self._resolve(key, exception=TimeExhausted(f"Transaction {key} is not in the chain after {timeout} seconds"))
+
+    def _resolve(self, key: str, receipt: Optional[TxReceipt] = None, exception: Optional[Exception] = None) -> None:
+        with self._lock:
+            entry = self._pending.pop(key, None)
+        if entry is None or entry.future.done():
+            return
+        if exception is not None:
+            entry.future.set_exception(exception)
+        else:
+            entry.future.set_result(receipt)  # type: ignore
+
+    @staticmethod
+    def _normalize(tx_hash) -> str:
+        if isinstance(tx_hash, (bytes, bytearray)):
+            return "0x" + bytes(tx_hash).hex()
+        tx_hash = str(tx_hash).lower()
+        return tx_hash if tx_hash.startswith("0x") else "0x" + tx_hash
@@ -1,13 +1,16 @@
-from typing import Any, Dict, Optional
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional
 from eth_typing import ChecksumAddress, HexStr
 from goat.classes.wallet_client_base import Balance, Signature
 from web3 import Web3
-from web3.types import Wei, TxParams
+from web3.types import Wei, TxParams, TxReceipt
 from eth_utils.address import to_checksum_address
 from eth_account.messages import encode_defunct, encode_typed_data
 
 from goat.types.chain import EvmChain
-from goat_wallets.evm import EVMWalletClient
+from goat_wallets.evm import ContractCache, ENSCache, EVMWalletClient, NonceManager, is_nonce_conflict
 from goat_wallets.evm.types import (
     EVMTransaction,
     EVMReadRequest,
@@ -16,25 +19,59 @@ from goat_wallets.evm.types import (
     PaymasterOptions,
 )
 
+from .receipt_tracker import ReceiptTracker
+
+
+# Attempts with a fresh nonce after the node reports the one we used as taken
+NONCE_CONFLICT_RETRIES = 3
+MAX_PENDING_RECEIPTS = 1024
+
 
 class Web3Options:
     def __init__(
         self,
         paymaster: Optional[PaymasterOptions] = None,
+        nonce_manager: bool = False,
+        chain_id: Optional[int] = None,
+        ens_cache: Optional[ENSCache] = None,
     ):
+        """Options for Web3EVMWalletClient.
+
+        Args:
+            paymaster: Default paymaster for transactions
+            nonce_manager: Assign nonces locally instead of asking the node for every transaction.
+                Only enable it when the account is not used to send transactions concurrently
+                from another process. Not supported by AsyncWeb3EVMWalletClient.
+            chain_id: Chain ID of the provider's network, saves looking it up on first use
+            ens_cache: Cache for ENS name resolutions, defaults to the cache shared by all wallets
+        """
         self.paymaster = paymaster
+        self.nonce_manager = nonce_manager
+        self.chain_id = chain_id
+        self.ens_cache = ens_cache
 
 
 class Web3EVMWalletClient(EVMWalletClient):
     def __init__(self, web3: Web3, options: Optional[Web3Options] = None, tokens=None, enable_send=True):
-        super().__init__(tokens=tokens, enable_send=enable_send)
+        super().__init__(tokens=tokens, enable_send=enable_send, ens_cache=options.ens_cache if options else None)
         self._web3 = web3
+        self._contracts = ContractCache(lambda address, abi: self._web3.eth.contract(address=address, abi=abi))
         self._default_paymaster_address = (
             options.paymaster["address"] if options and options.paymaster else None
         )
         self._default_paymaster_input = (
             options.paymaster["input"] if options and options.paymaster else None
         )
+        self._nonce_manager: Optional[NonceManager] = (
+            NonceManager(lambda: self._web3.eth.get_transaction_count(self._web3.eth.default_account, "pending"))
+            if options and options.nonce_manager
+            else None
+        )
+        self._chain_id = options.chain_id if options else None
+        self._nonces: Dict[str, int] = {}
+        self.receipt_tracker = ReceiptTracker(web3)
+        self._pending_receipts: "OrderedDict[str, Future]" = OrderedDict()
+        self._receipts_lock = threading.Lock()
 
     def get_address(self) -> str:
         if not self._web3.eth.default_account:
@@ -42,10 +79,10 @@ class Web3EVMWalletClient(EVMWalletClient):
         return self._web3.eth.default_account
 
     def get_chain_id(self) -> int:
-        return self._web3.eth.chain_id
+        return self._get_cached_chain_id(lambda: self._web3.eth.chain_id)
 
     def get_chain(self) -> EvmChain:
-        chain_id = self._web3.eth.chain_id
+        chain_id = self.get_chain_id()
         return {"type": "evm", "id": chain_id, "nativeCurrency": {"name": "Ether", "symbol": "ETH", "decimals": 18}}
 
     def resolve_address(self, address: str) -> ChecksumAddress:
@@ -56,13 +93,36 @@ class Web3EVMWalletClient(EVMWalletClient):
 
         # Try ENS resolution if it's a domain
         try:
-            resolved = self._web3.ens.address(address)  # type: ignore
+            resolved = self.ens_cache.resolve(self._ens_namespace(), address, self._web3.ens.address)  # type: ignore
             if not resolved:
                 raise ValueError("ENS name could not be resolved")
             return to_checksum_address(resolved)
         except Exception as e:
             raise ValueError(f"Failed to resolve ENS name: {str(e)}")
 
+    def resolve_many(self, addresses: List[str]) -> List[str]:
+        """Resolve many addresses or names, looking up the uncached ENS names concurrently."""
+        names = [address for address in addresses if not Web3.is_address(address)]
+        try:
+            resolved = self.ens_cache.resolve_many(self._ens_namespace(), names, self._web3.ens.address)  # type: ignore
+        except Exception as e:
+            raise ValueError(f"Failed to resolve ENS name: {str(e)}")
+
+        by_name = dict(zip(names, resolved))
+        result = []
+        for address in addresses:
+            if Web3.is_address(address):
+                result.append(to_checksum_address(address))
+                continue
+            if not by_name[address]:
+                raise ValueError(f"Failed to resolve ENS name: {address} could not be resolved")
+            result.append(to_checksum_address(by_name[address]))
+        return result
+
+    def _ens_namespace(self) -> str:
+        # Each chain has its own ENS registry, if any
+        return f"evm:{self.get_chain_id()}"
+
     def sign_message(self, message: str) -> Signature:
         """Sign a message with the current account."""
         if not self._web3.eth.default_account:
@@ -89,7 +149,56 @@ class Web3EVMWalletClient(EVMWalletClient):
         return {"signature": self._web3.to_hex(signed_message.signature)}
 
     def send_transaction(self, transaction: EVMTransaction) -> Dict[str, str]:
-        """Send a transaction on the EVM chain."""
+        """Send a transaction on the EVM chain and wait for it to be mined."""
+        return self._wait_for_receipt(self._send(transaction))
+
+    def send_transaction_nowait(self, transaction: EVMTransaction) -> str:
+        """Send a transaction without waiting for it to be mined.
+
+        The receipt is collected in the background. Combined with the nonce manager this lets
+        one wallet have many transactions pending at once.
+
+        Args:
+            transaction: The transaction to send
+
+        Returns:
+            The transaction hash, to pass to `wait_for_transaction`
+        """
+        tx_hash = self._send(transaction)
+        future = self.receipt_tracker.track(tx_hash)
+        future.add_done_callback(lambda _: self._confirm_nonce(tx_hash))
+        with self._receipts_lock:
+            self._pending_receipts[tx_hash] = future
+            self._trim_pending_receipts()
+        return tx_hash
+
+    def wait_for_transaction(self, tx_hash: str, timeout: Optional[float] = None) -> Dict[str, str]:
+        """Wait for a transaction sent with `send_transaction_nowait` to be mined.
+
+        Args:
+            tx_hash: The transaction hash
+            timeout: Seconds to wait, None to wait until the receipt tracker's timeout
+
+        Returns:
+            The transaction hash and status
+        """
+        with self._receipts_lock:
+            future = self._pending_receipts.pop(tx_hash, None)
+        if future is None:
+            return self._wait_for_receipt(HexStr(tx_hash))
+        return self._format_receipt(future.result(timeout))
+
+    def _trim_pending_receipts(self) -> None:
+        # Results nobody collected are dropped once they are done, oldest first
+        excess = len(self._pending_receipts) - MAX_PENDING_RECEIPTS
+        if excess <= 0:
+            return
+        done = [tx_hash for tx_hash, future in self._pending_receipts.items() if future.done()]
+        for tx_hash in done[:excess]:
+            del self._pending_receipts[tx_hash]
+
+    def _send(self, transaction: EVMTransaction) -> HexStr:
+        """Build and broadcast a transaction, returning its hash."""
         if not self._web3.eth.default_account:
             raise ValueError("No account connected")
 
@@ -105,7 +214,7 @@ class Web3EVMWalletClient(EVMWalletClient):
             tx_params: TxParams = {
                 "from": self._web3.eth.default_account,
                 "to": to_checksum_address(to_address),
-                "chainId": self._web3.eth.chain_id,
+                "chainId": self.get_chain_id(),
                 "value": Wei(transaction.get("value", 0)),
                 "data": transaction.get("data", HexStr("")),
             }
@@ -113,35 +222,34 @@ class Web3EVMWalletClient(EVMWalletClient):
             if paymaster_address and paymaster_input:
                 raise NotImplementedError("Paymaster not supported")
 
-            tx_hash = self._web3.eth.send_transaction(tx_params)
-            return self._wait_for_receipt(HexStr(tx_hash.hex()))
+            return self._broadcast(tx_params)
 
         # Contract call
         function_name = transaction.get("functionName")
         if not function_name:
             raise ValueError("Function name is required for contract calls")
 
-        contract = self._web3.eth.contract(
-            address=to_checksum_address(to_address), abi=transaction["abi"]  # type: ignore
-        )
+        contract = self._contracts.get(to_checksum_address(to_address), transaction["abi"])  # type: ignore
 
         # Build the transaction
         contract_function = getattr(contract.functions, function_name)
         args = transaction.get("args", [])
 
-        # First simulate the contract call to catch any potential errors
-        try:
-            contract_function(*args).call({
-                "from": self._web3.eth.default_account,
-                "value": Wei(transaction.get("value", 0)),
-            })
-        except Exception as e:
-            raise ValueError(f"Contract call simulation failed: {str(e)}")
+        # First simulate the contract call to catch any potential errors. With the nonce manager
+        # the gas estimate made while building the transaction serves as the simulation.
+        if self._nonce_manager is None:
+            try:
+                contract_function(*args).call({
+                    "from": self._web3.eth.default_account,
+                    "value": Wei(transaction.get("value", 0)),
+                })
+            except Exception as e:
+                raise ValueError(f"Contract call simulation failed: {str(e)}")
 
         # Build transaction parameters
         tx_params: TxParams = {
             "from": self._web3.eth.default_account,
-            "chainId": self._web3.eth.chain_id,
+            "chainId": self.get_chain_id(),
             "value": Wei(transaction.get("value", 0)),
         }
 
@@ -149,21 +257,47 @@ class Web3EVMWalletClient(EVMWalletClient):
             raise NotImplementedError("Paymaster not supported")
 
         # Build and send the transaction
-        tx = contract_function(*args).build_transaction(tx_params)
-        
-        # Get the nonce
-        tx["nonce"] = self._web3.eth.get_transaction_count(self._web3.eth.default_account)
-        
-        # Send the transaction
-        tx_hash = self._web3.eth.send_transaction(tx)
-
-        return self._wait_for_receipt(HexStr(tx_hash.hex()))
+        if self._nonce_manager is None:
+            tx = contract_function(*args).build_transaction(tx_params)
+            # Count pending transactions too, so back to back sends without waiting get distinct nonces
+            tx["nonce"] = self._web3.eth.get_transaction_count(self._web3.eth.default_account, "pending")
+        else:
+            try:
+                tx = contract_function(*args).build_transaction(tx_params)
+            except Exception as e:
+                raise ValueError(f"Contract call simulation failed: {str(e)}")
+
+        return self._broadcast(tx)
+
+    def _broadcast(self, tx: TxParams) -> HexStr:
+        """Send a built transaction, assigning its nonce when the nonce manager is enabled."""
+        if self._nonce_manager is None:
+            return HexStr(self._web3.eth.send_transaction(tx).hex())
+
+        attempts = 0
+        while True:
+            nonce = self._nonce_manager.next_nonce()
+            try:
+                tx_hash = HexStr(self._web3.eth.send_transaction({**tx, "nonce": nonce}).hex())
+                break
+            except Exception as e:
+                if not is_nonce_conflict(e):
+                    # The node did not accept the transaction, so the nonce is still free
+                    self._nonce_manager.release(nonce)
+                    raise
+                # The nonce is taken, by a mined transaction or one sent from elsewhere
+                self._nonce_manager.confirm(nonce)
+                self._nonce_manager.resync()
+                attempts += 1
+                if attempts > NONCE_CONFLICT_RETRIES:
+                    raise
+
+        self._nonces[tx_hash] = nonce
+        return tx_hash
 
     def read(self, request: EVMReadRequest) -> EVMReadResult:
         """Read data from a smart contract."""
-        contract = self._web3.eth.contract(
-            address=self.resolve_address(request["address"]), abi=request["abi"]
-        )
+        contract = self._contracts.get(self.resolve_address(request["address"]), request["abi"])
 
         function = getattr(contract.functions, request["functionName"])
         args = request.get("args", [])
@@ -171,6 +305,10 @@ class Web3EVMWalletClient(EVMWalletClient):
 
         return {"value": result}
 
+    def get_code(self, address: str) -> bytes:
+        """Return the code deployed at an address, empty if there is none."""
+        return bytes(self._web3.eth.get_code(self.resolve_address(address)))
+
     def get_native_balance(self) -> int:
         """Get the native balance of the wallet in wei."""
         if not self._web3.eth.default_account:
@@ -202,7 +340,19 @@ class Web3EVMWalletClient(EVMWalletClient):
 
     def _wait_for_receipt(self, tx_hash: HexStr) -> Dict[str, str]:
         """Wait for a transaction receipt and return standardized result."""
-        receipt = self._web3.eth.wait_for_transaction_receipt(tx_hash)
+        try:
+            receipt = self.receipt_tracker.wait(tx_hash)
+        finally:
+            self._confirm_nonce(tx_hash)
+        return self._format_receipt(receipt)
+
+    def _confirm_nonce(self, tx_hash: str) -> None:
+        nonce = self._nonces.pop(tx_hash, None)
+        if nonce is not None and self._nonce_manager is not None:
+            self._nonce_manager.confirm(nonce)
+
+    @staticmethod
+    def _format_receipt(receipt: TxReceipt) -> Dict[str, str]:
         return {
             "hash": receipt["transactionHash"].hex(),
             "status": "1" if receipt["status"] == 1 else "0",
@@ -0,0 +1,175 @@
+import asyncio
+from collections import Counter
+
+import pytest
+from eth_account import Account
+from web3 import AsyncWeb3
+from web3.providers.async_base import AsyncBaseProvider
+from goat_wallets.evm import ERC20_ABI, MULTICALL3_ADDRESS
+from goat_wallets.web3 import AsyncWeb3EVMWalletClient, Web3Options
+
+TOKEN = "0x" + "11" * 20
+RECIPIENT = "0x" + "22" * 20
+TX_HASH = "0x" + "33" * 32
+
+
+def _requests():
+    return [{"address": TOKEN, "abi": ERC20_ABI, "functionName": name, "args": []} for name in ("name", "symbol")]
+
+
+class FlakyMulticallWallet(AsyncWeb3EVMWalletClient):
+    """Async wallet whose aggregate calls fail, with reads and code lookups answered locally."""
+
+    def __init__(self, code=b"\x60\x80", code_error=None):
+        super().__init__(AsyncWeb3(), Web3Options(chain_id=1))
+        self.code = code
+        self.code_error = code_error
+        self.reads = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def aread(self, request):
+        self.reads.append(request["functionName"])
+        if request["address"] == MULTICALL3_ADDRESS:
+            raise TimeoutError("aggregate call timed out")
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return {"value": request["functionName"]}
+
+    async def aget_code(self, address):
+        assert address == MULTICALL3_ADDRESS
+        if self.code_error:
+            raise self.code_error
+        return self.code
+
+
+class FakeAsyncNode(AsyncBaseProvider):
+    """Stand-in async JSON-RPC node for contract calls, holding the simulation until the nonce is requested."""
+
+    def __init__(self, simulation_error=None, nonce=7):
+        super().__init__()
+        self.simulation_error = simulation_error
+        self.nonce = nonce
+        self.calls = Counter()
+        self.sent = []
+        self._nonce_requested = asyncio.Event()
+
+    async def make_request(self, method, params):
+        self.calls[method] += 1
+        if method == "eth_call":
+            # Only answers when the nonce lookup runs at the same time
+            await asyncio.wait_for(self._nonce_requested.wait(), timeout=1)
+            if self.simulation_error:
+                return self._error(self.simulation_error)
+            return self._result("0x" + f"{1:064x}")
+        if method == "eth_getTransactionCount":
+            self._nonce_requested.set()
+            return self._result(hex(self.nonce))
+        if method == "eth_chainId":
+            return self._result("0x1")
+        if method == "eth_estimateGas":
+            return self._result(hex(50_000))
+        if method == "eth_maxPriorityFeePerGas":
+            return self._result(hex(10**9))
+        if method == "eth_getBlockByNumber":
+            return self._result({"number": "0x1", "baseFeePerGas": hex(10**9)})
+        if method == "eth_sendTransaction":
+            self.sent.append(params[0])
+            return self._result(TX_HASH)
+        if method == "eth_getTransactionReceipt":
+            return self._result({
+                "transactionHash": TX_HASH,
+                "blockNumber": "0x1",
+                "blockHash": "0x" + "44" * 32,
+                "transactionIndex": "0x0",
+                "status": "0x1",
+                "logs": [],
+            })
+        return self._error(f"{method} not supported")
+
+    async def is_connected(self, show_traceback=False):
+        return True
+
+    @staticmethod
+    def _result(result):
+        return {"jsonrpc": "2.0", "id": 1, "result": result}
+
+    @staticmethod
+    def _error(message):
+        return {"jsonrpc": "2.0", "id": 1, "error": {"code": 3, "message": message}}
+
+
+def _wallet(node):
+    web3 = AsyncWeb3(node)
+    web3.eth.default_account = Account.create().address
+    return AsyncWeb3EVMWalletClient(web3, Web3Options(chain_id=1))
+
+
+def _transfer():
+    return {"to": TOKEN, "abi": ERC20_ABI, "functionName": "transfer", "args": [RECIPIENT, 1]}
+
+
+def test_nonce_manager_is_rejected():
+    """Test enabling the nonce manager, which the async client does not implement, raises."""
+    with pytest.raises(ValueError, match="nonce manager"):
+        AsyncWeb3EVMWalletClient(AsyncWeb3(), Web3Options(nonce_manager=True))
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_reads_concurrently():
+    """Test a failed aggregate call falls back to concurrent reads and keeps Multicall3 enabled."""
+    wallet = FlakyMulticallWallet()
+
+    assert await wallet.aread_many(_requests()) == [{"value": "name"}, {"value": "symbol"}]
+    assert wallet._multicall_supported is not False
+    assert wallet.max_in_flight == 2
+
+    await wallet.aread_many(_requests())
+    assert wallet.reads.count("aggregate3") == 2
+
+
+@pytest.mark.asyncio
+async def test_missing_multicall_is_disabled():
+    """Test Multicall3 is disabled when the chain has no code at its address."""
+    wallet = FlakyMulticallWallet(code=b"")
+
+    assert await wallet.aread_many(_requests()) == [{"value": "name"}, {"value": "symbol"}]
+    assert wallet._multicall_supported is False
+
+    await wallet.aread_many(_requests())
+    assert wallet.reads.count("aggregate3") == 1
+
+
+@pytest.mark.asyncio
+async def test_unreachable_node_raises():
+    """Test the aggregate error is raised when the code lookup fails as well."""
+    wallet = FlakyMulticallWallet(code_error=ConnectionError("node unreachable"))
+
+    with pytest.raises(TimeoutError):
+        await wallet.aread_many(_requests())
+    assert wallet.reads == ["aggregate3"]
+
+
+@pytest.mark.asyncio
+async def test_send_simulates_and_fetches_nonce_concurrently():
+    """Test the simulation and the nonce lookup are in flight together and the nonce is used."""
+    node = FakeAsyncNode(nonce=7)
+
+    result = await _wallet(node).asend_transaction(_transfer())
+
+    assert result == {"hash": TX_HASH[2:], "status": "1"}
+    assert node.calls["eth_call"] == 1
+    assert node.calls["eth_getTransactionCount"] == 1
+    assert int(node.sent[0]["nonce"], 16) == 7
+
+
+@pytest.mark.asyncio
+async def test_send_reports_failed_simulation():
+    """Test a failing simulation raises before anything is broadcast."""
+    node = FakeAsyncNode(simulation_error="execution reverted: insufficient balance")
+
+    with pytest.raises(ValueError, match="simulation failed.*insufficient balance"):
+        await _wallet(node).asend_transaction(_transfer())
+    assert node.sent == []
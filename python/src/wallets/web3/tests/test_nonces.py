@@ -0,0 +1,115 @@
+from collections import Counter
+
+import pytest
+
+from eth_account import Account
+from web3 import Web3
+from web3.providers.base import BaseProvider
+from goat_wallets.evm import ERC20_ABI
+from goat_wallets.web3 import Web3EVMWalletClient, Web3Options
+
+TOKEN = "0x" + "11" * 20
+RECIPIENT = "0x" + "22" * 20
+
+
+class FakeNode(BaseProvider):
+    """Stand-in JSON-RPC node that fails sends with queued errors in order and records accepted nonces."""
+
+    def __init__(self, pending_count=5, latest_count=3, send_errors=()):
+        super().__init__()
+        self.pending_count = pending_count
+        self.latest_count = latest_count
+        self.send_errors = list(send_errors)
+        self.calls = Counter()
+        self.count_blocks = []
+        self.sent_nonces = []
+
+    def make_request(self, method, params):
+        self.calls[method] += 1
+        if method == "eth_getTransactionCount":
+            self.count_blocks.append(params[1])
+            return self._result(hex(self.pending_count if params[1] == "pending" else self.latest_count))
+        if method == "eth_sendTransaction":
+            if self.send_errors:
+                message = self.send_errors.pop(0)
+                if "nonce" in message:
+                    # Another process took the nonce
+                    self.pending_count += 1
+                return {"jsonrpc": "2.0", "id": 1, "error": {"code": -32000, "message": message}}
+            nonce = int(params[0]["nonce"], 16)
+            self.sent_nonces.append(nonce)
+            return self._result("0x" + f"{nonce:064x}")
+        if method == "eth_chainId":
+            return self._result("0x1")
+        if method == "eth_call":
+            return self._result("0x" + f"{1:064x}")
+        if method == "eth_estimateGas":
+            return self._result(hex(50_000))
+        if method == "eth_maxPriorityFeePerGas":
+            return self._result(hex(10**9))
+        if method == "eth_getBlockByNumber":
+            return self._result({"number": "0x1", "gasLimit": hex(30_000_000), "baseFeePerGas": hex(10**9)})
+        return {"jsonrpc": "2.0", "id": 1, "error": {"code": -32601, "message": f"{method} not supported"}}
+
+    @staticmethod
+    def _result(result):
+        return {"jsonrpc": "2.0", "id": 1, "result": result}
+
+
+def _wallet(node, nonce_manager=True):
+    web3 = Web3(node)
+    web3.eth.default_account = Account.create().address
+    return Web3EVMWalletClient(web3, Web3Options(chain_id=1, nonce_manager=nonce_manager))
+
+
+def _transfer():
+    return {"to": RECIPIENT, "value": 1}
+
+
+def test_rejected_send_releases_nonce():
+    """Test a send rejected for another reason than the nonce frees the nonce for the next send."""
+    node = FakeNode(send_errors=["transaction underpriced"])
+    wallet = _wallet(node)
+
+    with pytest.raises(Exception, match="underpriced"):
+        wallet._send(_transfer())
+    wallet._send(_transfer())
+
+    assert node.sent_nonces == [5]
+    assert node.calls["eth_getTransactionCount"] == 1
+    assert wallet._nonce_manager.in_flight == 1
+
+
+def test_nonce_conflict_resyncs_and_retries():
+    """Test a nonce used elsewhere is skipped after re-reading the count from the node."""
+    node = FakeNode(send_errors=["nonce too low"])
+    wallet = _wallet(node)
+
+    wallet._send(_transfer())
+
+    assert node.sent_nonces == [6]
+    assert node.calls["eth_getTransactionCount"] == 2
+
+
+def test_repeated_nonce_conflicts_give_up_without_reusing_nonce():
+    """Test the conflict error is raised after the retries and the taken nonces are not handed out again."""
+    node = FakeNode(send_errors=["nonce too low"] * 4)
+    wallet = _wallet(node)
+
+    with pytest.raises(Exception, match="nonce too low"):
+        wallet._send(_transfer())
+
+    assert node.sent_nonces == []
+    assert wallet._nonce_manager.in_flight == 0
+    assert wallet._nonce_manager.next_nonce() == 9
+
+
+def test_sends_without_nonce_manager_count_pending_transactions():
+    """Test contract calls read the pending count, so sends that do not wait for receipts get distinct nonces."""
+    node = FakeNode(pending_count=5, latest_count=3)
+    wallet = _wallet(node, nonce_manager=False)
+
+    wallet._send({"to": TOKEN, "abi": ERC20_ABI, "functionName": "transfer", "args": [RECIPIENT, 1]})
+
+    assert node.count_blocks == ["pending"]
+    assert node.sent_nonces == [5]
@@ -0,0 +1,67 @@
+import pytest
+from web3 import Web3
+from goat_wallets.evm import ERC20_ABI, MULTICALL3_ADDRESS
+from goat_wallets.web3 import Web3EVMWalletClient, Web3Options
+
+TOKEN = "0x" + "11" * 20
+
+
+class FlakyMulticallWallet(Web3EVMWalletClient):
+    """Wallet whose aggregate calls fail, with reads and code lookups answered locally."""
+
+    def __init__(self, code=b"\x60\x80", code_error=None):
+        super().__init__(Web3(), Web3Options(chain_id=1))
+        self.code = code
+        self.code_error = code_error
+        self.reads = []
+
+    def read(self, request):
+        self.reads.append(request["functionName"])
+        if request["address"] == MULTICALL3_ADDRESS:
+            raise TimeoutError("aggregate call timed out")
+        return {"value": request["functionName"]}
+
+    def get_code(self, address):
+        assert address == MULTICALL3_ADDRESS
+        if self.code_error:
+            raise self.code_error
+        return self.code
+
+
+def _requests():
+    return [{"address": TOKEN, "abi": ERC20_ABI, "functionName": name, "args": []} for name in ("name", "symbol")]
+
+
+def test_failed_batch_falls_back_for_that_call_only():
+    """Test a failed aggregate call does not disable Multicall3 when it is deployed."""
+    wallet = FlakyMulticallWallet()
+
+    assert wallet.read_many(_requests()) == [{"value": "name"}, {"value": "symbol"}]
+    assert wallet._multicall_supported is not False
+
+    wallet.read_many(_requests())
+    assert wallet.reads.count("aggregate3") == 2
+
+
+def test_missing_multicall_is_disabled():
+    """Test Multicall3 is disabled when the chain has no code at its address."""
+    wallet = FlakyMulticallWallet(code=b"")
+
+    assert wallet.read_many(_requests()) == [{"value": "name"}, {"value": "symbol"}]
+    assert wallet._multicall_supported is False
+
+    wallet.read_many(_requests())
+    assert wallet.reads.count("aggregate3") == 1
+
+    wallet.invalidate_chain_cache()
+    assert wallet._multicall_supported is None
+
+
+def test_unreachable_node_raises():
+    """Test the aggregate error is raised when the code lookup fails as well."""
+    wallet = FlakyMulticallWallet(code_error=ConnectionError("node unreachable"))
+
+    with pytest.raises(TimeoutError):
+        wallet.read_many(_requests())
+    assert wallet._multicall_supported is not False
+    assert wallet.reads == ["aggregate3"]
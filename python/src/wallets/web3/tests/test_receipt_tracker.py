@@ -0,0 +1,165 @@
+import threading
+from collections import Counter
+
+import pytest
+from web3 import Web3
+from web3.exceptions import TimeExhausted
+from web3.providers.base import BaseProvider
+from goat_wallets.web3 import ReceiptTracker
+
+
+def _tx_hash(i: int) -> str:
+    return "0x" + f"{i:064x}"
+
+
+class FakeNode(BaseProvider):
+    """Stand-in JSON-RPC node that mines blocks on demand and counts requests."""
+
+    def __init__(self, block_receipts: bool = True, failing_blocks=()):
+        super().__init__()
+        self.blocks = [[]]
+        self.calls = Counter()
+        self.block_receipts = block_receipts
+        self.failing_blocks = set(failing_blocks)
+        self._lock = threading.Lock()
+
+    def mine(self, tx_hashes):
+        with self._lock:
+            self.blocks.append(list(tx_hashes))
+
+    def make_request(self, method, params):
+        with self._lock:
+            self.calls[method] += 1
+            if method == "eth_blockNumber":
+                return self._result(hex(len(self.blocks) - 1))
+            if method == "eth_getBlockByNumber":
+                number = int(params[0], 16)
+                if number in self.failing_blocks:
+                    return {"jsonrpc": "2.0", "id": 1, "error": {"code": -32000, "message": "header not found"}}
+                return self._result(self._block(number))
+            if method == "eth_getBlockReceipts" and self.block_receipts:
+                number = int(params[0], 16)
+                return self._result([self._receipt(tx_hash, number) for tx_hash in self.blocks[number]])
+            if method == "eth_getTransactionReceipt":
+                for number, tx_hashes in enumerate(self.blocks):
+                    if params[0] in tx_hashes:
+                        return self._result(self._receipt(params[0], number))
+                return self._result(None)
+            return {"jsonrpc": "2.0", "id": 1, "error": {"code": -32601, "message": f"{method} not supported"}}
+
+    def _block(self, number):
+        return {
+            "number": hex(number),
+            "hash": _tx_hash(10**6 + number),
+            "parentHash": _tx_hash(10**6 + number - 1),
+            "timestamp": hex(number),
+            "transactions": self.blocks[number],
+        }
+
+    @staticmethod
+    def _receipt(tx_hash, number):
+        return {
+            "transactionHash": tx_hash,
+            "blockNumber": hex(number),
+            "blockHash": _tx_hash(10**6 + number),
+            "transactionIndex": "0x0",
+            "status": "0x1",
+            "from": "0x" + "11" * 20,
+            "to": "0x" + "22" * 20,
+            "cumulativeGasUsed": "0x0",
+            "gasUsed": "0x0",
+            "logs": [],
+            "logsBloom": "0x" + "00" * 256,
+            "contractAddress": None,
+            "effectiveGasPrice": "0x0",
+            "type": "0x2",
+        }
+
+    @staticmethod
+    def _result(result):
+        return {"jsonrpc": "2.0", "id": 1, "result": result}
+
+
+def test_resolves_many_transactions_from_few_requests():
+    """Test receipts for many transactions cost requests per block, not per transaction."""
+    node = FakeNode()
+    tracker = ReceiptTracker(Web3(node), poll_interval=0.01, timeout=5)
+    hashes = [_tx_hash(i) for i in range(200)]
+    futures = [tracker.track(tx_hash) for tx_hash in hashes]
+
+    node.mine(hashes[:100])
+    node.mine(hashes[100:])
+    receipts = [future.result(timeout=5) for future in futures]
+
+    assert [Web3.to_hex(receipt["transactionHash"]) for receipt in receipts] == hashes
+    assert node.calls["eth_getBlockReceipts"] == 2
+    # One direct lookup when tracking starts, none while waiting
+    assert node.calls["eth_getTransactionReceipt"] == len(hashes)
+    assert tracker.pending == 0
+
+
+def test_resolves_already_mined_transactions_immediately():
+    """Test transactions mined well before tracking starts resolve without scanning blocks."""
+    node = FakeNode()
+    node.mine([_tx_hash(1)])
+    for _ in range(10):
+        node.mine([])
+    tracker = ReceiptTracker(Web3(node), poll_interval=60, timeout=5)
+
+    future = tracker.track(_tx_hash(1))
+
+    assert future.done()
+    assert future.result()["blockNumber"] == 1
+    assert tracker.pending == 0
+
+
+def test_tracks_from_the_genesis_block():
+    """Test a chain younger than the initial look-back window is scanned from block 0."""
+    node = FakeNode()
+    tracker = ReceiptTracker(Web3(node), poll_interval=0.01, timeout=5)
+    future = tracker.track(_tx_hash(1))
+
+    node.mine([_tx_hash(1)])
+
+    assert future.result(timeout=5)["blockNumber"] == 1
+
+
+def test_skips_blocks_that_keep_failing():
+    """Test a block that cannot be fetched does not stop later blocks from being scanned."""
+    node = FakeNode(failing_blocks={1})
+    tracker = ReceiptTracker(Web3(node), poll_interval=0.01, timeout=5)
+    future = tracker.track(_tx_hash(2))
+
+    node.mine([])
+    node.mine([_tx_hash(2)])
+
+    assert future.result(timeout=5)["blockNumber"] == 2
+    assert node.calls["eth_getBlockByNumber"] >= 3
+
+
+def test_falls_back_to_transaction_receipts():
+    """Test nodes without eth_getBlockReceipts are asked for each tracked receipt."""
+    node = FakeNode(block_receipts=False)
+    tracker = ReceiptTracker(Web3(node), poll_interval=0.01, timeout=5)
+    futures = [tracker.track(_tx_hash(i)) for i in range(3)]
+
+    node.mine([_tx_hash(i) for i in range(3)] + [_tx_hash(99)])
+
+    assert all(future.result(timeout=5)["status"] == 1 for future in futures)
+    # One direct lookup per transaction when tracking starts, then one per receipt found in the block
+    assert node.calls["eth_getTransactionReceipt"] == 6
+
+
+def test_same_hash_shares_one_future():
+    """Test tracking a hash twice returns the same future."""
+    tracker = ReceiptTracker(Web3(FakeNode()), poll_interval=0.01)
+    assert tracker.track(_tx_hash(1)) is tracker.track(_tx_hash(1).upper().replace("0X", "0x"))
+    tracker.stop()
+
+
+def test_times_out_missing_transactions():
+    """Test transactions that are never mined fail with TimeExhausted."""
+    tracker = ReceiptTracker(Web3(FakeNode()), poll_interval=0.01, timeout=0.05)
+    with pytest.raises(TimeExhausted):
+        tracker.wait(_tx_hash(1))
+    assert tracker.pending == 0